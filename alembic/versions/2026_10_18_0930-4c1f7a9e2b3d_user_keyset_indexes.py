@@ -0,0 +1,31 @@
+"""user keyset indexes
+
+Revision ID: 4c1f7a9e2b3d
+Revises: bb75bee984e9
+Create Date: 2026-10-18 09:30:12.418532
+
+"""
+from typing import Sequence, Union
+
+from src.utils.migration import create_indexes_concurrently, drop_indexes_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4c1f7a9e2b3d"
+down_revision: Union[str, None] = "bb75bee984e9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    "ix_user_first_name_id": ["first_name", "id"],
+    "ix_user_last_name_id": ["last_name", "id"],
+    "ix_user_created_at_id": ["created_at", "id"],
+}
+
+
+def upgrade() -> None:
+    create_indexes_concurrently("user", INDEXES)
+
+
+def downgrade() -> None:
+    drop_indexes_concurrently("user", list(INDEXES))
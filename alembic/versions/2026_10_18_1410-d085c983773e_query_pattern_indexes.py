@@ -0,0 +1,39 @@
+"""query pattern indexes
+
+Revision ID: d085c983773e
+Revises: 4c1f7a9e2b3d
+Create Date: 2026-10-18 14:10:37.205914
+
+"""
+from typing import Sequence, Union
+
+from src.utils.migration import create_indexes_concurrently, drop_indexes_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d085c983773e"
+down_revision: Union[str, None] = "4c1f7a9e2b3d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    "user": {
+        # users of a company (selectinload, json_agg ordered by id) and ON DELETE CASCADE of company
+        "ix_user_company_id_id": ["company_id", "id"],
+        # first_name/last_name IN-filters are served by the keyset indexes of revision 4c1f7a9e2b3d
+        "ix_user_middle_name_id": ["middle_name", "id"],
+    },
+    "company": {
+        "ix_company_inn": ["inn"],
+    },
+}
+
+
+def upgrade() -> None:
+    for table_name, indexes in INDEXES.items():
+        create_indexes_concurrently(table_name, indexes)
+
+
+def downgrade() -> None:
+    for table_name, indexes in INDEXES.items():
+        drop_indexes_concurrently(table_name, list(indexes))
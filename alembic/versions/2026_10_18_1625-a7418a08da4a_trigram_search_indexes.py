@@ -0,0 +1,48 @@
+"""trigram search indexes
+
+Revision ID: a7418a08da4a
+Revises: d085c983773e
+Create Date: 2026-10-18 16:25:08.771203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from src.utils.migration import create_indexes_concurrently, drop_indexes_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7418a08da4a"
+down_revision: Union[str, None] = "d085c983773e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# GIN trigram indexes serve both ILIKE '%text%' and the similarity operator %
+INDEXES = {
+    "user": {
+        "ix_user_first_name_trgm": ["first_name"],
+        "ix_user_last_name_trgm": ["last_name"],
+        "ix_user_middle_name_trgm": ["middle_name"],
+    },
+    "company": {
+        "ix_company_company_name_trgm": ["company_name"],
+    },
+}
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table_name, indexes in INDEXES.items():
+        create_indexes_concurrently(
+            table_name,
+            indexes,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops" for columns in indexes.values() for column in columns},
+        )
+
+
+def downgrade() -> None:
+    # the extension is kept, it may be used outside of these indexes
+    for table_name, indexes in INDEXES.items():
+        drop_indexes_concurrently(table_name, list(indexes))
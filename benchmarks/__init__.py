@@ -0,0 +1 @@
+"""The package contains benchmarks run against the database configured in `.env`."""
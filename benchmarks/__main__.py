@@ -0,0 +1,82 @@
+"""The module contains the command line of the benchmark suite.
+
+The database configured in `.env` must contain users and companies, the same data gives comparable results:
+a dataset of any size is loaded with `python -m src.seed`. With `REPOSITORY_BACKEND=memory` the service
+and api levels run without the database on the dataset of `MEMORY_SEED_USERS`, the micro level needs PostgreSQL.
+Usage:
+    python -m benchmarks run [--level micro service api] [--iterations 2000] [--output results.json]
+    python -m benchmarks compare baseline.json results.json [--threshold 0.1]
+`compare` exits with 1 if p50 or p95 latency grew or throughput dropped by more than the threshold.
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from benchmarks.results import (
+    BenchmarkResult,
+    find_regressions,
+    print_comparison,
+    print_results,
+    read_results,
+    write_results,
+)
+
+LEVELS = ('micro', 'service', 'api')
+
+
+async def run(args: argparse.Namespace) -> list[BenchmarkResult]:
+    # importing the application creates its engines, `compare` works without the database settings
+    from benchmarks import api, micro, services  # noqa: PLC0415
+    from src.main import app, lifespan  # noqa: PLC0415
+
+    results = []
+    # the lifespan warms up the pools or fills the in-memory database, as for a served application
+    async with lifespan(app):
+        if 'micro' in args.level:
+            results += await micro.run(args.iterations, args.warmup)
+        if 'service' in args.level:
+            results += await services.run(args.iterations, args.warmup)
+        if 'api' in args.level:
+            results += await api.run(args.iterations // args.concurrency, args.warmup, args.concurrency)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='run the benchmarks and save the results as JSON')
+    run_parser.add_argument('--level', nargs='+', choices=LEVELS, default=LEVELS)
+    run_parser.add_argument('--iterations', type=int, default=2000, help='timed operations per benchmark')
+    run_parser.add_argument('--warmup', type=int, default=100, help='untimed operations before the timed ones')
+    run_parser.add_argument('--concurrency', type=int, default=16, help='concurrent clients of the api level')
+    run_parser.add_argument('--output', type=Path, default=Path('benchmark_results.json'))
+
+    compare_parser = commands.add_parser('compare', help='flag regressions of the results against a baseline')
+    compare_parser.add_argument('baseline', type=Path)
+    compare_parser.add_argument('current', type=Path)
+    compare_parser.add_argument('--threshold', type=float, default=0.1, help='allowed change, 0.1 - 10%%')
+
+    args = parser.parse_args()
+    if args.command == 'run':
+        results = asyncio.run(run(args))
+        print_results(results)
+        write_results(
+            args.output,
+            results,
+            iterations=args.iterations,
+            warmup=args.warmup,
+            concurrency=args.concurrency,
+        )
+        return 0
+
+    baseline, current = read_results(args.baseline), read_results(args.current)
+    regressions = find_regressions(baseline, current, args.threshold)
+    print_comparison(baseline, current, regressions)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""The module contains macrobenchmarks driving the ASGI application in process with concurrent clients.
+
+Every client sends its requests one after another, the clients run concurrently on one event loop,
+so the results include the routing, the validation, the serialization and the contention for the pool.
+"""
+
+import asyncio
+from time import perf_counter
+
+from httpx import AsyncClient
+
+from benchmarks.data import load_app_sample
+from benchmarks.results import BenchmarkResult, summarize
+from src.main import app
+
+LEVEL = 'api'
+
+
+async def _client(client: AsyncClient, url: str, requests: int, timings: list[float]) -> None:
+    for _ in range(requests):
+        start = perf_counter()
+        response = await client.get(url)
+        timings.append(perf_counter() - start)
+        response.raise_for_status()
+
+
+async def _load(client: AsyncClient, url: str, requests: int, concurrency: int) -> tuple[list[float], float]:
+    timings: list[float] = []
+    started = perf_counter()
+    async with asyncio.TaskGroup() as group:
+        for _ in range(concurrency):
+            group.create_task(_client(client, url, requests, timings))
+    return timings, perf_counter() - started
+
+
+async def run(requests: int, warmup: int, concurrency: int) -> list[BenchmarkResult]:
+    sample = await load_app_sample()
+
+    urls = {
+        'GET /user/{user_id}': f'/api/v1/user/{sample.user_id}',
+        'GET /user/filters/': f'/api/v1/user/filters/?first_name={sample.first_name}&sort_by=last_name',
+        'GET /company/{company_id}': f'/api/v1/company/{sample.company_id}',
+    }
+    results = []
+    async with AsyncClient(app=app, base_url='http://benchmark') as client:
+        for name, url in urls.items():
+            await _load(client, url, warmup, concurrency)
+            timings, elapsed = await _load(client, url, requests, concurrency)
+            results.append(summarize(name, LEVEL, timings, elapsed, concurrency=concurrency))
+    return results
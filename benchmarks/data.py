@@ -0,0 +1,62 @@
+"""The module contains the choice of the entries the benchmarks read."""
+
+from collections import Counter
+from dataclasses import dataclass
+from heapq import nsmallest
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.database.db import read_only_session_maker
+from src.database.memory import memory_database
+from src.models import UserModel
+
+# users read by one batch lookup, see `SqlAlchemyRepository.get_values_by_ids`
+BATCH_SIZE = 100
+
+
+@dataclass(frozen=True, slots=True)
+class Sample:
+    user_id: UUID
+    first_name: str
+    company_id: UUID
+    user_ids: list[UUID]
+
+
+async def load_app_sample() -> Sample:
+    """Sample of the configured `REPOSITORY_BACKEND`, the in-memory one is filled in the lifespan of the application."""
+    if settings.REPOSITORY_BACKEND == 'memory':
+        return load_memory_sample()
+    async with read_only_session_maker() as session:
+        return await load_sample(session)
+
+
+async def load_sample(session: AsyncSession) -> Sample:
+    """The same entries are chosen on every run over the same data, so the results are comparable."""
+    user_ids = list(await session.scalars(select(UserModel.id).order_by(UserModel.id).limit(BATCH_SIZE)))
+    if not user_ids:
+        err_msg = 'The benchmarks require users in the database'
+        raise RuntimeError(err_msg)
+
+    user = await session.get_one(UserModel, user_ids[0])
+    # the largest company, so that the company with users is the heaviest response
+    company_id = await session.scalar(
+        select(UserModel.company_id).group_by(UserModel.company_id).order_by(func.count().desc(), UserModel.company_id),
+    )
+    return Sample(user_id=user.id, first_name=user.first_name, company_id=company_id, user_ids=user_ids)
+
+
+def load_memory_sample() -> Sample:
+    """Same as `load_sample` for the in-memory backend."""
+    users = memory_database.tables[UserModel.__tablename__].rows
+    user_ids = nsmallest(BATCH_SIZE, users)
+    if not user_ids:
+        err_msg = 'The benchmarks require users, see MEMORY_SEED_USERS'
+        raise RuntimeError(err_msg)
+
+    user = users[user_ids[0]]
+    sizes = Counter(user['company_id'] for user in users.values())
+    company_id = min(sizes, key=lambda company_id: (-sizes[company_id], company_id))
+    return Sample(user_id=user['id'], first_name=user['first_name'], company_id=company_id, user_ids=user_ids)
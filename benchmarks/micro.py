@@ -0,0 +1,95 @@
+"""The module contains microbenchmarks of repository methods, of `to_schema` and of `transaction_mode`.
+
+The repository methods run one after another on a single connection of a separate engine,
+so they measure the statement and the ORM work without the pool and the UnitOfWork.
+"""
+
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from benchmarks.data import load_sample
+from benchmarks.results import BenchmarkResult, measure, measure_sync, summarize
+from src.config import settings
+from src.repositories import CompanyRepository, UserRepository
+from src.schemas.user import UserFilters
+from src.utils.service import BaseService, transaction_mode
+from src.utils.unit_of_work import UnitOfWork
+
+if TYPE_CHECKING:
+    from src.models import CompanyModel, UserModel
+
+LEVEL = 'micro'
+
+
+class _NoopService(BaseService):
+    """Measures the UnitOfWork opened and closed around a method that doesn't touch the database."""
+
+    _repo: str = 'user'
+
+    @transaction_mode(read_only=True)
+    async def read(self) -> bool:  # - `transaction_mode` wraps coroutine functions
+        return self.uow.is_open
+
+    @transaction_mode
+    async def write(self) -> bool:  # - `transaction_mode` wraps coroutine functions
+        return self.uow.is_open
+
+
+async def _noop() -> bool:  # noqa: RUF029 - the baseline of the wrapped methods above
+    return True
+
+
+async def run(iterations: int, warmup: int) -> list[BenchmarkResult]:
+    engine = create_async_engine(settings.DB_URL, pool_size=1, max_overflow=0)
+    results = []
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            sample = await load_sample(session)
+            user_repo, company_repo = UserRepository(session), CompanyRepository(session)
+            filters = UserFilters(
+                page=None, per_page=20, cursor=None, order='asc', total='none', like='',
+                ids=None, first_name=[sample.first_name], last_name=None, middle_name=None, sort_by='last_name',
+            )
+            queries: dict[str, Callable[[], Awaitable[Any]]] = {
+                'UserRepository.get_by_filter_one_or_none': lambda: user_repo.get_by_filter_one_or_none(
+                    id=sample.user_id,
+                ),
+                'UserRepository.get_users_by_filter': lambda: user_repo.get_users_by_filter(filters),
+                'UserRepository.get_values_by_ids': lambda: user_repo.get_values_by_ids(sample.user_ids),
+                'UserRepository.get_updated_at': lambda: user_repo.get_updated_at(sample.user_id),
+                'CompanyRepository.get_company_with_users': lambda: company_repo.get_company_with_users(
+                    sample.company_id,
+                ),
+                'CompanyRepository.get_company_with_users_json': lambda: company_repo.get_company_with_users_json(
+                    sample.company_id,
+                ),
+            }
+            for name, query in queries.items():
+                async def timed_query(query: Callable[[], Awaitable[Any]] = query) -> None:
+                    await query()
+                    session.expunge_all()  # the identity map would skip loading the same rows again
+
+                results.append(summarize(name, LEVEL, *await measure(timed_query, iterations, warmup)))
+
+            user: UserModel = await user_repo.get_by_filter_one_or_none(id=sample.user_id)
+            company: CompanyModel = await company_repo.get_company_with_users(sample.company_id)
+            for name, func in {
+                'UserModel.to_schema': user.to_schema,
+                'CompanyModel.to_schema': company.to_schema,
+                'CompanyModel.users to_schema': lambda: [user.to_schema() for user in company.users],
+            }.items():
+                results.append(summarize(name, LEVEL, *measure_sync(func, iterations, warmup)))
+            await session.rollback()
+    finally:
+        await engine.dispose()
+
+    service = _NoopService(UnitOfWork())
+    for name, method in {
+        'no transaction (baseline)': _noop,
+        'transaction_mode(read_only=True)': service.read,
+        'transaction_mode': service.write,
+    }.items():
+        results.append(summarize(name, LEVEL, *await measure(method, iterations, warmup)))
+    return results
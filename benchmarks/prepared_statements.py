@@ -0,0 +1,83 @@
+"""The module contains a benchmark of the prepared statements modes, see `Settings.DB_STATEMENT_CACHE_MODE`.
+
+The hot repository queries are run one after another on a single connection in each mode,
+so the difference is the time Postgres spends to parse and plan the statement and the extra round trip of PREPARE.
+The database must contain users and companies, usage:
+    python -m benchmarks.prepared_statements [iterations]
+"""
+
+import asyncio
+import statistics
+import sys
+from collections.abc import Awaitable, Callable
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.config import STATEMENT_CACHE_MODES, settings
+from src.database.db import get_connect_args
+from src.models import UserModel
+from src.repositories import CompanyRepository, UserRepository
+from src.schemas.user import UserFilters
+
+WARMUP_ITERATIONS = 50
+
+
+def _hot_queries(session: AsyncSession, user: UserModel) -> dict[str, Callable[[], Awaitable[Any]]]:
+    user_repo = UserRepository(session)
+    company_repo = CompanyRepository(session)
+    filters = UserFilters(
+        page=None, per_page=20, cursor=None, order='asc', total='none', like='',
+        ids=None, first_name=[user.first_name], last_name=None, middle_name=None, sort_by='last_name',
+    )
+    return {
+        'user by id': lambda: user_repo.get_by_filter_one_or_none(id=user.id),
+        'users by filters': lambda: user_repo.get_users_by_filter(filters),
+        'company with users': lambda: company_repo.get_company_with_users(user.company_id),
+    }
+
+
+async def _run_mode(mode: str, iterations: int) -> dict[str, list[float]]:
+    engine = create_async_engine(settings.DB_URL, pool_size=1, max_overflow=0, connect_args=get_connect_args(mode))
+    timings: dict[str, list[float]] = {}
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            user = await session.scalar(select(UserModel).limit(1))
+            if user is None:
+                err_msg = 'The benchmark requires at least one user in the database'
+                raise RuntimeError(err_msg)
+
+            for name, query in _hot_queries(session, user).items():
+                for _ in range(WARMUP_ITERATIONS):
+                    await query()
+                session.expunge_all()
+
+                timings[name] = []
+                for _ in range(iterations):
+                    start = perf_counter()
+                    await query()
+                    timings[name].append(perf_counter() - start)
+                    session.expunge_all()
+    finally:
+        await engine.dispose()
+    return timings
+
+
+async def main(iterations: int) -> None:
+    results = {mode: await _run_mode(mode, iterations) for mode in STATEMENT_CACHE_MODES}
+
+    sys.stdout.write(f'{"query":<20} {"mode":<10} {"mean, ms":>10} {"p50, ms":>10} {"p95, ms":>10}\n')
+    for name in results[STATEMENT_CACHE_MODES[0]]:
+        for mode in STATEMENT_CACHE_MODES:
+            timings = [timing * 1000 for timing in results[mode][name]]
+            p95 = statistics.quantiles(timings, n=20)[-1]
+            sys.stdout.write(
+                f'{name:<20} {mode:<10} {statistics.fmean(timings):>10.3f} '
+                f'{statistics.median(timings):>10.3f} {p95:>10.3f}\n',
+            )
+
+
+if __name__ == '__main__':
+    asyncio.run(main(iterations=int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
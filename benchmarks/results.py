@@ -0,0 +1,154 @@
+"""The module contains measuring, reporting and comparison of benchmark results."""
+
+import json
+import platform
+import statistics
+import sys
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+import sqlalchemy
+
+# the compared statistics: a higher latency or a lower throughput is worse
+LATENCY_KEYS = ('p50_ms', 'p95_ms')
+THROUGHPUT_KEY = 'throughput'
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    name: str
+    level: str
+    operations: int
+    concurrency: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    # operations per second of wall time, all concurrent clients together
+    throughput: float
+
+
+@dataclass(frozen=True, slots=True)
+class Regression:
+    name: str
+    key: str
+    baseline: float
+    current: float
+
+
+def summarize(name: str, level: str, timings: Sequence[float], elapsed: float, concurrency: int = 1) -> BenchmarkResult:
+    """Latency percentiles and throughput of the timed operations, the timings and `elapsed` are in seconds."""
+    timings_ms = [timing * 1000 for timing in timings]
+    percentiles = statistics.quantiles(timings_ms, n=100, method='inclusive')
+    return BenchmarkResult(
+        name=name,
+        level=level,
+        operations=len(timings),
+        concurrency=concurrency,
+        mean_ms=statistics.fmean(timings_ms),
+        p50_ms=percentiles[49],
+        p95_ms=percentiles[94],
+        p99_ms=percentiles[98],
+        throughput=len(timings) / elapsed,
+    )
+
+
+async def measure(func: Callable[[], Awaitable[Any]], iterations: int, warmup: int) -> tuple[list[float], float]:
+    """Timings of the sequential calls and their total time, after `warmup` untimed calls."""
+    for _ in range(warmup):
+        await func()
+
+    timings = []
+    started = perf_counter()
+    for _ in range(iterations):
+        start = perf_counter()
+        await func()
+        timings.append(perf_counter() - start)
+    return timings, perf_counter() - started
+
+
+def measure_sync(func: Callable[[], Any], iterations: int, warmup: int) -> tuple[list[float], float]:
+    """Same as `measure` for plain functions."""
+    for _ in range(warmup):
+        func()
+
+    timings = []
+    started = perf_counter()
+    for _ in range(iterations):
+        start = perf_counter()
+        func()
+        timings.append(perf_counter() - start)
+    return timings, perf_counter() - started
+
+
+def write_results(path: Path, results: Iterable[BenchmarkResult], **options: Any) -> None:
+    """Saves the results with the environment they were measured in."""
+    document = {
+        'meta': {
+            'created_at': datetime.now(UTC).isoformat(),
+            'python': platform.python_version(),
+            'sqlalchemy': sqlalchemy.__version__,
+            'platform': platform.platform(),
+            'options': options,
+        },
+        'results': {result.name: asdict(result) for result in results},
+    }
+    path.write_text(json.dumps(document, indent=2))
+
+
+def read_results(path: Path) -> dict[str, BenchmarkResult]:
+    return {name: BenchmarkResult(**result) for name, result in json.loads(path.read_text())['results'].items()}
+
+
+def find_regressions(
+    baseline: dict[str, BenchmarkResult],
+    current: dict[str, BenchmarkResult],
+    threshold: float,
+) -> list[Regression]:
+    """Statistics of the benchmarks present in both runs that got worse by more than `threshold` (0.1 - 10%)."""
+    regressions = []
+    for name in baseline.keys() & current.keys():
+        old, new = asdict(baseline[name]), asdict(current[name])
+        regressions.extend(
+            Regression(name=name, key=key, baseline=old[key], current=new[key])
+            for key in LATENCY_KEYS
+            if new[key] > old[key] * (1 + threshold)
+        )
+        if new[THROUGHPUT_KEY] < old[THROUGHPUT_KEY] * (1 - threshold):
+            regressions.append(
+                Regression(name=name, key=THROUGHPUT_KEY, baseline=old[THROUGHPUT_KEY], current=new[THROUGHPUT_KEY]),
+            )
+    return sorted(regressions, key=lambda regression: (regression.name, regression.key))
+
+
+def print_results(results: Iterable[BenchmarkResult]) -> None:
+    sys.stdout.write(
+        f'{"benchmark":<48} {"level":<12} {"p50, ms":>10} {"p95, ms":>10} {"p99, ms":>10} {"ops/s":>12}\n',
+    )
+    for result in results:
+        sys.stdout.write(
+            f'{result.name:<48} {result.level:<12} {result.p50_ms:>10.3f} {result.p95_ms:>10.3f} '
+            f'{result.p99_ms:>10.3f} {result.throughput:>12.1f}\n',
+        )
+
+
+def print_comparison(
+    baseline: dict[str, BenchmarkResult],
+    current: dict[str, BenchmarkResult],
+    regressions: Sequence[Regression],
+) -> None:
+    regressed = {(regression.name, regression.key) for regression in regressions}
+    sys.stdout.write(f'{"benchmark":<48} {"statistic":<12} {"baseline":>12} {"current":>12} {"change":>9}\n')
+    for name in sorted(baseline.keys() & current.keys()):
+        old, new = asdict(baseline[name]), asdict(current[name])
+        for key in (*LATENCY_KEYS, THROUGHPUT_KEY):
+            change = new[key] / old[key] - 1 if old[key] else 0.0
+            flag = '  REGRESSION' if (name, key) in regressed else ''
+            sys.stdout.write(f'{name:<48} {key:<12} {old[key]:>12.3f} {new[key]:>12.3f} {change:>+9.1%}{flag}\n')
+
+    for name in sorted(baseline.keys() ^ current.keys()):
+        sys.stdout.write(f'{name:<48} only in {"baseline" if name in baseline else "current"}\n')
@@ -0,0 +1,28 @@
+"""The module contains benchmarks of service methods with the UnitOfWork and the engines of the application."""
+
+from benchmarks.data import load_app_sample
+from benchmarks.results import BenchmarkResult, measure, summarize
+from src.api.v1.services import CompanyService, UserService
+from src.schemas.user import UserFilters
+from src.utils.unit_of_work import get_unit_of_work_class
+
+LEVEL = 'service'
+
+
+async def run(iterations: int, warmup: int) -> list[BenchmarkResult]:
+    sample = await load_app_sample()
+    unit_of_work_class = get_unit_of_work_class()
+    user_service, company_service = UserService(unit_of_work_class()), CompanyService(unit_of_work_class())
+    filters = UserFilters(
+        page=None, per_page=20, cursor=None, order='asc', total='none', like='',
+        ids=None, first_name=[sample.first_name], last_name=None, middle_name=None, sort_by='last_name',
+    )
+    methods = {
+        'UserService.get_user_by_id': lambda: user_service.get_user_by_id(sample.user_id),
+        'UserService.get_users_by_filters': lambda: user_service.get_users_by_filters(filters),
+        'CompanyService.get_company_with_users': lambda: company_service.get_company_with_users(sample.company_id),
+        'CompanyService.get_company_with_users_json': lambda: company_service.get_company_with_users_json(
+            sample.company_id,
+        ),
+    }
+    return [summarize(name, LEVEL, *await measure(method, iterations, warmup)) for name, method in methods.items()]
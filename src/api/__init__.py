@@ -10,7 +10,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.status import HTTP_200_OK, HTTP_400_BAD_REQUEST
 
-from src.api.v1.routers import v1_company_router, v1_user_router
+from src.api.v1.routers import v1_admin_router, v1_company_router, v1_user_router
 from src.database.db import get_async_session
 from src.metadata import ERRORS_MAP
 from src.schemas.response import BaseResponse
@@ -18,6 +18,7 @@ from src.schemas.response import BaseResponse
 router = APIRouter()
 router.include_router(v1_user_router, prefix='/v1', tags=['User | v1'])
 router.include_router(v1_company_router, prefix='/v1', tags=['Company | v1'])
+router.include_router(v1_admin_router, prefix='/v1', tags=['Admin | v1'])
 
 
 @router.get(
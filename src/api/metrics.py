@@ -0,0 +1,24 @@
+"""The module contains the route exposing metrics to Prometheus."""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from starlette.status import HTTP_200_OK
+
+from src.utils.metrics import registry
+
+router = APIRouter()
+
+
+class PrometheusResponse(PlainTextResponse):
+    media_type = 'text/plain; version=0.0.4'
+
+
+@router.get(
+    path='/metrics',
+    status_code=HTTP_200_OK,
+    response_class=PrometheusResponse,
+    include_in_schema=False,
+)
+async def get_metrics() -> PrometheusResponse:  # noqa: RUF029 - the metrics are updated on the event loop
+    """Get the metrics of this worker process in the Prometheus text format."""
+    return PrometheusResponse(registry.render())
@@ -0,0 +1,102 @@
+"""The module contains routes for inspecting the application internals."""
+
+from typing import TYPE_CHECKING
+
+from fastapi import APIRouter
+from starlette.status import HTTP_200_OK
+
+from src.config import settings
+from src.database.db import get_engines
+from src.schemas.admin import (
+    CacheStatsDB,
+    CacheStatsResponse,
+    PoolStatsDB,
+    PoolStatsResponse,
+    ResponseCacheStatsDB,
+    ResponseCacheStatsResponse,
+)
+from src.utils.cache import repository_cache
+from src.utils.metrics import format_bound
+from src.utils.response_cache import response_caches
+
+if TYPE_CHECKING:
+    from src.database.pool import InstrumentedPool
+
+router = APIRouter(prefix='/admin')
+
+
+@router.get(
+    path='/cache/repository',
+    status_code=HTTP_200_OK,
+)
+async def get_repository_cache_stats() -> CacheStatsResponse:  # noqa: RUF029 - the stats are updated on the event loop
+    """Get counters of the repository read-through cache."""
+    stats = repository_cache.stats
+    return CacheStatsResponse(
+        payload=CacheStatsDB(
+            enabled=settings.REPOSITORY_CACHE_ENABLED,
+            size=len(repository_cache),
+            maxsize=repository_cache.maxsize,
+            hits=stats.hits,
+            misses=stats.misses,
+            evictions=stats.evictions,
+            expirations=stats.expirations,
+            invalidations=stats.invalidations,
+            hit_ratio=stats.hit_ratio,
+        ),
+    )
+
+
+@router.get(
+    path='/cache/responses',
+    status_code=HTTP_200_OK,
+)
+async def get_response_cache_stats() -> ResponseCacheStatsResponse:  # noqa: RUF029 - the stats are updated on the event loop
+    """Get counters and memory use (total size of the cached bodies) of the response caches by route."""
+    return ResponseCacheStatsResponse(
+        payload=[
+            ResponseCacheStatsDB(
+                route=cache.route,
+                enabled=cache.enabled,
+                size=len(cache),
+                nbytes=cache.weight,
+                maxbytes=cache.maxsize,
+                ttl=cache.ttl,
+                hits=cache.stats.hits,
+                misses=cache.stats.misses,
+                evictions=cache.stats.evictions,
+                expirations=cache.stats.expirations,
+                invalidations=cache.stats.invalidations,
+                hit_ratio=cache.stats.hit_ratio,
+            )
+            for cache in response_caches
+        ],
+    )
+
+
+@router.get(
+    path='/pool',
+    status_code=HTTP_200_OK,
+)
+async def get_pool_stats() -> PoolStatsResponse:  # noqa: RUF029 - the stats are updated on the event loop
+    """Get the live state and checkout statistics of the connection pools of this worker process."""
+    payload = []
+    for name, engine in get_engines().items():
+        pool: InstrumentedPool = engine.pool
+        payload.append(
+            PoolStatsDB(
+                engine=name,
+                size=pool.size(),
+                max_overflow=pool.max_overflow,
+                timeout=pool.timeout(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                # the counter starts at `-size` and counts connections opened above the pool size once positive
+                overflow=max(pool.overflow(), 0),
+                checkouts=pool.stats.checkouts,
+                timeouts=pool.stats.timeouts,
+                wait_time_sum=pool.stats.wait_time.sum,
+                wait_time_buckets={format_bound(bound): count for bound, count in pool.stats.wait_time.cumulative()},
+            ),
+        )
+    return PoolStatsResponse(payload=payload)
@@ -1,17 +1,23 @@
 """The module contains base routes for working with company."""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header
+from fastapi.responses import Response
 from pydantic import UUID4
 from starlette.status import HTTP_200_OK, HTTP_201_CREATED
 
 from src.api.v1.services import CompanyService
+from src.config import settings
 from src.schemas.company import (
     CompanyDB,
+    CompanyFilters,
+    CompanyListResponse,
     CompanyResponse,
-    CompanyWithUsers,
     CreateCompanyRequest,
     CreateCompanyResponse,
 )
+from src.utils.etag import not_modified
+from src.utils.response_cache import CachedResponse, company_response_cache
+from src.utils.responses import PydanticJSONResponse, RawJSONResponse, RowsJSONResponse
 
 router = APIRouter(prefix='/company')
 
@@ -24,7 +30,7 @@ async def create_company(
     company: CreateCompanyRequest,
     service: CompanyService = Depends(),
 ) -> CreateCompanyResponse:
-    """Create user."""
+    """Create company."""
     created_user: CompanyDB = await service.create_company(company)
     return CreateCompanyResponse(payload=created_user)
 
@@ -32,11 +38,55 @@ async def create_company(
 @router.get(
     path='/{company_id}',
     status_code=HTTP_200_OK,
+    response_model=CompanyResponse,
 )
 async def get_company_with_users(
     company_id: UUID4,
+    if_none_match: str | None = Header(default=None),
     service: CompanyService = Depends(),
-) -> CompanyResponse:
-    """Get user by ID."""
-    company: CompanyWithUsers = await service.get_company_with_users(company_id)
-    return CompanyResponse(payload=company)
+) -> Response:
+    """Get company with users by ID.
+    With `If-None-Match` the version is checked first, the company isn't loaded if the ETag is current,
+    304 is returned then. Otherwise the ETag is computed from the loaded company.
+    Encoded responses are served from the in-process cache, if it is enabled.
+    """
+    if cached := company_response_cache.get(company_id):
+        return cached.respond(if_none_match)
+
+    generation = company_response_cache.generation
+    if if_none_match:
+        etag = await service.get_company_with_users_etag(company_id)
+        if response := not_modified(if_none_match, etag):
+            return response
+
+    if settings.COMPANY_JSON_FROM_DB:
+        document, etag = await service.get_company_with_users_json_and_etag(company_id)
+        response = RawJSONResponse(CompanyResponse.model_construct(payload=document), headers={'ETag': etag})
+    else:
+        company, etag = await service.get_company_with_users_and_etag(company_id)
+        response = PydanticJSONResponse(CompanyResponse(payload=company), headers={'ETag': etag})
+
+    company_response_cache.set(company_id, CachedResponse(response.body, etag), generation=generation)
+    return response
+
+
+@router.get(
+    path='/filters/',
+    status_code=HTTP_200_OK,
+    response_model=CompanyListResponse,
+)
+async def get_companies_by_filters(
+    filters: CompanyFilters = Depends(),
+    service: CompanyService = Depends(),
+) -> RowsJSONResponse:
+    """Get a page of companies by filters, `like` searches companies by name.
+    The next page is requested by passing the received `next_cursor` as `cursor`.
+    """
+    companies = await service.get_companies_by_filters(filters)
+    return RowsJSONResponse(
+        CompanyListResponse.model_construct(
+            payload=companies.items,
+            next_cursor=companies.next_cursor,
+            total=companies.total,
+        ),
+    )
@@ -1,11 +1,15 @@
 """The module contains base routes for working with user."""
 
-from fastapi import APIRouter, Depends
+from typing import Any, Literal
+
+from fastapi import APIRouter, Body, Depends, Header, Query
+from fastapi.responses import Response, StreamingResponse
 from pydantic import UUID4
 from starlette.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_204_NO_CONTENT
 
 from src.api.v1.services.user import UserService
 from src.schemas.user import (
+    BulkCreateUsersResponse,
     CreateUserRequest,
     CreateUserResponse,
     UpdateUserRequest,
@@ -14,6 +18,11 @@ from src.schemas.user import (
     UserResponse,
     UsersListResponse,
 )
+from src.utils.constans import BULK_CREATE_USERS_MAX
+from src.utils.etag import not_modified
+from src.utils.response_cache import CachedResponse, user_response_cache
+from src.utils.responses import PydanticJSONResponse, RowsJSONResponse
+from src.utils.streaming import JSON_MEDIA_TYPE, NDJSON_MEDIA_TYPE, json_array_chunks, ndjson_chunks
 
 router = APIRouter(prefix='/user')
 
@@ -31,17 +40,57 @@ async def create_user(
     return CreateUserResponse(payload=created_user)
 
 
+@router.post(
+    path='/bulk',
+    status_code=HTTP_201_CREATED,
+)
+async def bulk_create_users(
+    # the items are validated one by one by the service to report the invalid ones,
+    # the schema of `create_user` is published for them
+    users: list[Any] = Body(
+        min_length=1,
+        max_length=BULK_CREATE_USERS_MAX,
+        json_schema_extra={'items': {'$ref': '#/components/schemas/CreateUserRequest'}},
+    ),
+    service: UserService = Depends(),
+) -> BulkCreateUsersResponse:
+    """Create users in bulk.
+    Every item is validated as `CreateUserRequest`, the valid items are created with the 201 status
+    while invalid items are skipped and reported by their index in `errors`.
+    If no user is created, the response has the 422 status with the errors of the items in `detail`.
+    """
+    result = await service.bulk_create_users(users)
+    return BulkCreateUsersResponse(payload=result)
+
+
 @router.get(
     path='/{user_id}',
     status_code=HTTP_200_OK,
+    response_model=UserResponse,
 )
 async def get_user(
     user_id: UUID4,
+    if_none_match: str | None = Header(default=None),
     service: UserService = Depends(),
-) -> UserResponse:
-    """Get user by ID."""
-    user: UserDB | None = await service.get_user_by_id(user_id)
-    return UserResponse(payload=user)
+) -> Response:
+    """Get user by ID.
+    With `If-None-Match` the version is checked first, the user isn't loaded if the ETag is current, 304 is returned
+    then. Otherwise the ETag is computed from the loaded user. Encoded responses are served from the in-process cache,
+    if it is enabled.
+    """
+    if cached := user_response_cache.get(user_id):
+        return cached.respond(if_none_match)
+
+    generation = user_response_cache.generation
+    if if_none_match:
+        etag = await service.get_user_etag(user_id)
+        if response := not_modified(if_none_match, etag):
+            return response
+
+    user, etag = await service.get_user_with_etag(user_id)
+    response = PydanticJSONResponse(UserResponse(payload=user), headers={'ETag': etag})
+    user_response_cache.set(user_id, CachedResponse(response.body, etag), generation=generation)
+    return response
 
 
 @router.put(
@@ -73,11 +122,35 @@ async def delete_user(
 @router.get(
     path='/filters/',
     status_code=HTTP_200_OK,
+    response_model=UsersListResponse,
 )
 async def get_users_by_filters(
     filters: UserFilters = Depends(),
     service: UserService = Depends(),
-) -> UsersListResponse:
-    """Get users by filters."""
+) -> RowsJSONResponse:
+    """Get a page of users by filters.
+    The next page is requested by passing the received `next_cursor` as `cursor`.
+    """
     users = await service.get_users_by_filters(filters)
-    return UsersListResponse(payload=users)
+    return RowsJSONResponse(
+        UsersListResponse.model_construct(payload=users.items, next_cursor=users.next_cursor, total=users.total),
+    )
+
+
+@router.get(
+    path='/filters/stream/',
+    status_code=HTTP_200_OK,
+    response_class=StreamingResponse,
+)
+async def stream_users_by_filters(  # noqa: RUF029 - must run on the event loop, not in a threadpool
+    filters: UserFilters = Depends(),
+    stream_format: Literal['ndjson', 'json'] = Query(default='ndjson', alias='format'),
+    service: UserService = Depends(),
+) -> StreamingResponse:
+    """Stream all users by filters as NDJSON or as a JSON array.
+    Rows are sent as they are read from the database, pagination parameters are ignored.
+    """
+    partitions = service.stream_users_by_filters(filters)
+    if stream_format == 'json':
+        return StreamingResponse(json_array_chunks(partitions), media_type=JSON_MEDIA_TYPE)
+    return StreamingResponse(ndjson_chunks(partitions), media_type=NDJSON_MEDIA_TYPE)
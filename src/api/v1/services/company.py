@@ -1,13 +1,18 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from fastapi import HTTPException
 from pydantic import UUID4
+from starlette.status import HTTP_400_BAD_REQUEST
 
-from src.schemas.company import CompanyDB, CompanyWithUsers, CreateCompanyRequest
-from src.utils.constans import COMPANY_NOT_FOUND_MSG
+from src.models import CompanyModel
+from src.schemas.company import CompanyDB, CompanyFilters, CompanyWithUsers, CreateCompanyRequest
+from src.utils.constans import COMPANY_NOT_FOUND_MSG, INVALID_CURSOR_MSG
+from src.utils.etag import make_etag
+from src.utils.pagination import InvalidCursorError, Page
 from src.utils.service import BaseService, transaction_mode
 
 if TYPE_CHECKING:
-    from src.models import CompanyModel
+    from sqlalchemy import Row
 
 
 class CompanyService(BaseService):
@@ -19,11 +24,55 @@ class CompanyService(BaseService):
         created_company: CompanyModel = await self.uow.company.add_one_and_get_obj(**company.model_dump())
         return created_company.to_schema()
 
-    @transaction_mode
+    @transaction_mode(read_only=True)
     async def get_company_with_users(self, company_id: UUID4) -> CompanyWithUsers:
         """Find company by ID with all users."""
         company: CompanyModel | None = await self.uow.company.get_company_with_users(company_id)
         self.check_existence(obj=company, details=COMPANY_NOT_FOUND_MSG)
+        return self._to_company_with_users(company)
+
+    @transaction_mode(read_only=True)
+    async def get_company_with_users_and_etag(self, company_id: UUID4) -> tuple[CompanyWithUsers, str]:
+        """Find company by ID with all users and the ETag of the loaded version."""
+        company: CompanyModel | None = await self.uow.company.get_company_with_users(company_id)
+        self.check_existence(obj=company, details=COMPANY_NOT_FOUND_MSG)
+        # the same version as `get_company_with_users_version` selects
+        users_updated_at = max((user.updated_at for user in company.users), default=None)
+        etag = make_etag(company_id, company.updated_at, users_updated_at, len(company.users))
+        return self._to_company_with_users(company), etag
+
+    @transaction_mode(read_only=True)
+    async def get_company_with_users_etag(self, company_id: UUID4) -> str:
+        """Get the ETag of the company with all users without loading them."""
+        version: Row | None = await self.uow.company.get_company_with_users_version(company_id)
+        self.check_existence(obj=version, details=COMPANY_NOT_FOUND_MSG)
+        return make_etag(company_id, *version)
+
+    @transaction_mode(read_only=True)
+    async def get_company_with_users_json(self, company_id: UUID4) -> str:
+        """Find company by ID with all users as a JSON document built by the database."""
+        company: str | None = await self.uow.company.get_company_with_users_json(company_id)
+        self.check_existence(obj=company, details=COMPANY_NOT_FOUND_MSG)
+        return company
+
+    @transaction_mode(read_only=True)
+    async def get_company_with_users_json_and_etag(self, company_id: UUID4) -> tuple[str, str]:
+        """Find company by ID with all users as a JSON document built by the database and the ETag of its version."""
+        row: Row | None = await self.uow.company.get_company_with_users_json_and_version(company_id)
+        self.check_existence(obj=row, details=COMPANY_NOT_FOUND_MSG)
+        document, *version = row
+        return document, make_etag(company_id, *version)
+
+    @transaction_mode(read_only=True)
+    async def get_companies_by_filters(self, filters: CompanyFilters) -> Page[dict[str, Any]]:
+        """Get a page of companies by filter as rows with `CompanyDB` fields."""
+        try:
+            return await self.uow.company.get_companies_by_filter(filters)
+        except InvalidCursorError:
+            raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=INVALID_CURSOR_MSG)
+
+    @staticmethod
+    def _to_company_with_users(company: CompanyModel) -> CompanyWithUsers:
         return CompanyWithUsers(
             id=company.id,
             inn=company.inn,
@@ -1,13 +1,29 @@
-from typing import TYPE_CHECKING
+from collections.abc import AsyncIterator, Sequence
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
 
-from pydantic import UUID4
+from fastapi import HTTPException
+from pydantic import UUID4, ValidationError
+from sqlalchemy import RowMapping
+from starlette.status import HTTP_400_BAD_REQUEST, HTTP_422_UNPROCESSABLE_ENTITY
 
-from src.schemas.user import CreateUserRequest, UpdateUserRequest, UserDB, UserFilters
-from src.utils.constans import USER_NOT_FOUND_MSG
+from src.schemas.user import (
+    BulkCreatedUser,
+    BulkCreateUserError,
+    BulkCreateUsersResult,
+    CreateUserRequest,
+    UpdateUserRequest,
+    UserDB,
+    UserFilters,
+)
+from src.utils.constans import COMPANY_NOT_FOUND_MSG, INVALID_CURSOR_MSG, STREAM_BATCH_SIZE, USER_NOT_FOUND_MSG
+from src.utils.etag import make_etag
+from src.utils.pagination import InvalidCursorError, Page
+from src.utils.response_cache import company_response_cache, user_response_cache
 from src.utils.service import BaseService, transaction_mode
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from datetime import datetime
 
     from src.models import UserModel
 
@@ -19,29 +35,106 @@ class UserService(BaseService):
     async def create_user(self, user: CreateUserRequest) -> UserDB:
         """Create user."""
         created_user: UserModel = await self.uow.user.add_one_and_get_obj(**user.model_dump())
+        self._invalidate_responses(company_ids=(created_user.company_id,))
         return created_user.to_schema()
 
     @transaction_mode
+    async def bulk_create_users(self, users: Sequence[Any]) -> BulkCreateUsersResult:
+        """Create all valid users in one transaction.
+        Invalid rows are skipped and reported by their index in the request,
+        if no row is valid, the errors are raised with the 422 status as the validation errors of FastAPI.
+        """
+        result = BulkCreateUsersResult()
+        rows: dict[int, dict[str, Any]] = {}
+        for index, user in enumerate(users):
+            try:
+                rows[index] = CreateUserRequest.model_validate(user).model_dump()
+            except ValidationError as exc:
+                errors = exc.errors(include_url=False, include_context=False, include_input=False)
+                result.errors.append(BulkCreateUserError(index=index, errors=errors))
+
+        existing_companies = await self.uow.company.get_existing_ids({row['company_id'] for row in rows.values()})
+        for index, row in list(rows.items()):
+            if row['company_id'] not in existing_companies:
+                error = {'type': 'not_found', 'loc': ('company_id',), 'msg': COMPANY_NOT_FOUND_MSG}
+                result.errors.append(BulkCreateUserError(index=index, errors=[error]))
+                del rows[index]
+                continue
+            row['id'] = uuid4()
+            result.created.append(BulkCreatedUser(index=index, id=row['id']))
+
+        result.errors.sort(key=lambda error: error.index)
+        if not rows:
+            detail = [error.model_dump(mode='json') for error in result.errors]
+            raise HTTPException(status_code=HTTP_422_UNPROCESSABLE_ENTITY, detail=detail)
+
+        await self.uow.user.bulk_add(list(rows.values()))
+        self._invalidate_responses(company_ids=[row['company_id'] for row in rows.values()])
+        return result
+
+    @transaction_mode(read_only=True)
     async def get_user_by_id(self, user_id: UUID4) -> UserDB:
         """Get user by ID."""
         user: UserModel | None = await self.uow.user.get_by_filter_one_or_none(id=user_id)
         self.check_existence(obj=user, details=USER_NOT_FOUND_MSG)
         return user.to_schema()
 
+    @transaction_mode(read_only=True)
+    async def get_user_with_etag(self, user_id: UUID4) -> tuple[UserDB, str]:
+        """Get user by ID with the ETag of the loaded version."""
+        user: UserModel | None = await self.uow.user.get_by_filter_one_or_none(id=user_id)
+        self.check_existence(obj=user, details=USER_NOT_FOUND_MSG)
+        return user.to_schema(), make_etag(user_id, user.updated_at)
+
+    @transaction_mode(read_only=True)
+    async def get_user_etag(self, user_id: UUID4) -> str:
+        """Get the ETag of the user without loading it."""
+        updated_at: datetime | None = await self.uow.user.get_updated_at(user_id)
+        self.check_existence(obj=updated_at, details=USER_NOT_FOUND_MSG)
+        return make_etag(user_id, updated_at)
+
     @transaction_mode
     async def update_user(self, user_id: UUID4, user: UpdateUserRequest) -> UserDB:
         """Update user by ID."""
+        old_company_id = await self._get_cached_company_id(user_id)
         user: UserModel | None = await self.uow.user.update_one_by_id(obj_id=user_id, **user.model_dump())
         self.check_existence(obj=user, details=USER_NOT_FOUND_MSG)
+        self._invalidate_responses(user_id, company_ids=(old_company_id, user.company_id))
         return user.to_schema()
 
     @transaction_mode
     async def delete_user(self, user_id: UUID4) -> None:
         """Delete user by ID."""
+        company_id = await self._get_cached_company_id(user_id)
         await self.uow.user.delete_by_filter(id=user_id)
+        self._invalidate_responses(user_id, company_ids=(company_id,))
 
-    @transaction_mode
-    async def get_users_by_filters(self, filters: UserFilters) -> list[UserDB]:
-        """Get users by filter."""
-        users: Sequence[UserModel] = await self.uow.user.get_users_by_filter(filters)
-        return [user.to_schema() for user in users]
+    @transaction_mode(read_only=True)
+    async def get_users_by_filters(self, filters: UserFilters) -> Page[dict[str, Any]]:
+        """Get a page of users by filter as rows with `UserDB` fields."""
+        try:
+            return await self.uow.user.get_users_by_filter(filters)
+        except InvalidCursorError:
+            raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=INVALID_CURSOR_MSG)
+
+    @transaction_mode(read_only=True)
+    async def stream_users_by_filters(self, filters: UserFilters) -> AsyncIterator[Sequence[RowMapping]]:
+        """Get all users by filter as batches of rows read from a server-side cursor."""
+        async for rows in self.uow.user.stream_users_by_filter(filters, batch_size=STREAM_BATCH_SIZE):
+            yield rows
+
+    async def _get_cached_company_id(self, user_id: UUID4) -> UUID4 | None:
+        """Company whose cached response lists the user before the write, read only if the cache is on."""
+        if not company_response_cache.enabled:
+            return None
+        return await self.uow.user.get_company_id(user_id)
+
+    def _invalidate_responses(self, user_id: UUID4 | None = None, company_ids: Sequence[UUID4 | None] = ()) -> None:
+        """Drops the cached responses showing the user once the transaction is committed."""
+        def invalidate() -> None:
+            if user_id is not None:
+                user_response_cache.invalidate(user_id)
+            for company_id in {company_id for company_id in company_ids if company_id is not None}:
+                company_response_cache.invalidate(company_id)
+
+        self.uow.add_after_commit(invalidate)
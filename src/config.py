@@ -4,6 +4,18 @@ from dotenv import find_dotenv, load_dotenv
 
 load_dotenv(find_dotenv('.env'))
 
+# values of `Settings.DB_STATEMENT_CACHE_MODE`
+STATEMENT_CACHE_MODES = ('direct', 'pgbouncer')
+
+
+def get_choice(name: str, default: str, choices: tuple[str, ...]) -> str:
+    """Value of the environment variable, an unknown value fails at startup rather than selecting the default."""
+    value = os.environ.get(name, default)
+    if value not in choices:
+        err_msg = f'Unknown {name} {value!r}, expected one of {list(choices)}'
+        raise ValueError(err_msg)
+    return value
+
 
 class Settings:
     MODE: str = os.environ.get('MODE')
@@ -16,5 +28,97 @@ class Settings:
 
     DB_URL: str = f'postgresql+asyncpg://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}'
 
+    # 'direct' - statements are prepared once per connection and reused, for a direct connection to Postgres;
+    # 'pgbouncer' - nothing is cached and statement names are unique, for PgBouncer in transaction pooling mode.
+    # Breaking change: the statement names used to be unique always, deployments behind PgBouncer must set 'pgbouncer'
+    DB_STATEMENT_CACHE_MODE: str = get_choice('DB_STATEMENT_CACHE_MODE', 'direct', STATEMENT_CACHE_MODES)
+    # prepared statements cached per connection in 'direct' mode
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = int(os.environ.get('DB_PREPARED_STATEMENT_CACHE_SIZE', 500))
+
+    # connection pool of every engine (the primary and each replica) in every worker process;
+    # workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) must stay below `max_connections` of the server
+    DB_POOL_SIZE: int = int(os.environ.get('DB_POOL_SIZE', 10))
+    # connections opened above DB_POOL_SIZE under load, they are closed once returned to a full pool
+    DB_MAX_OVERFLOW: int = int(os.environ.get('DB_MAX_OVERFLOW', 10))
+    # seconds to wait for a free connection before failing with TimeoutError
+    DB_POOL_TIMEOUT: float = float(os.environ.get('DB_POOL_TIMEOUT', 30))
+    # seconds after which a connection is reopened on checkout, -1 - never
+    DB_POOL_RECYCLE: int = int(os.environ.get('DB_POOL_RECYCLE', -1))
+    # connections are checked with a ping on checkout, e.g. to survive restarts of the server or of PgBouncer
+    DB_POOL_PRE_PING: bool = os.environ.get('DB_POOL_PRE_PING', 'false').lower() == 'true'
+    # connections of every pool opened at startup (at most DB_POOL_SIZE), so the first requests after a deploy
+    # don't pay for connecting; 0 - connections are opened on demand
+    DB_POOL_WARM_UP_SIZE: int = int(os.environ.get('DB_POOL_WARM_UP_SIZE', DB_POOL_SIZE))
+    # the statements of the read routes are run on every connection opened at startup,
+    # so they are compiled and, in 'direct' DB_STATEMENT_CACHE_MODE, prepared before the first requests
+    DB_WARM_UP_STATEMENTS: bool = os.environ.get('DB_WARM_UP_STATEMENTS', 'true').lower() == 'true'
+
+    # statements of the engines are timed, slow ones and ones repeated within a request are logged;
+    # a diagnostic tool, enabled in the dev and test environments, see README
+    QUERY_LOG_ENABLED: bool = os.environ.get('QUERY_LOG_ENABLED', 'false').lower() == 'true'
+    # seconds from which a statement is logged as slow
+    SLOW_QUERY_THRESHOLD: float = float(os.environ.get('SLOW_QUERY_THRESHOLD', 0.5))
+    # share (0..1) of slow SELECTs logged with `EXPLAIN (ANALYZE, BUFFERS)`, which runs the statement again
+    SLOW_QUERY_EXPLAIN_RATE: float = float(os.environ.get('SLOW_QUERY_EXPLAIN_RATE', 0))
+    # a warning is logged once a request runs the same statement more than this number of times
+    N_PLUS_ONE_THRESHOLD: int = int(os.environ.get('N_PLUS_ONE_THRESHOLD', 10))
+
+    # comma-separated `host[:port]` of read replicas, they share the credentials and the database of the primary
+    DB_REPLICA_HOSTS: tuple[str, ...] = tuple(filter(None, os.environ.get('DB_REPLICA_HOSTS', '').split(',')))
+    # isolation level of read-only transactions; with AUTOCOMMIT no BEGIN/COMMIT is sent
+    # and the connection is returned to the pool after every statement
+    DB_READ_ONLY_ISOLATION_LEVEL: str = os.environ.get('DB_READ_ONLY_ISOLATION_LEVEL', 'AUTOCOMMIT')
+    # seconds during which reads of a client stay on the primary after its write (read-your-writes)
+    DB_READ_YOUR_WRITES_TTL: int = int(os.environ.get('DB_READ_YOUR_WRITES_TTL', 5))
+
+    # rows per statement (multi-VALUES) or per COPY call in `SqlAlchemyRepository.bulk_add`
+    BULK_INSERT_BATCH_SIZE: int = int(os.environ.get('BULK_INSERT_BATCH_SIZE', 5000))
+    # starting from this number of rows `bulk_add` switches from multi-VALUES INSERT to binary COPY
+    BULK_INSERT_COPY_THRESHOLD: int = int(os.environ.get('BULK_INSERT_COPY_THRESHOLD', 1000))
+
+    # requests are profiled by a sampling profiler, see `ProfilerMiddleware`: a request passing the token
+    # in the `X-Profile` header or in the `profile` query parameter, an empty token disables it
+    PROFILE_TOKEN: str = os.environ.get('PROFILE_TOKEN', '')
+    # share (0..1) of requests profiled at random
+    PROFILE_SAMPLE_RATE: float = float(os.environ.get('PROFILE_SAMPLE_RATE', 0))
+    # seconds between the samples of the stack
+    PROFILE_INTERVAL: float = float(os.environ.get('PROFILE_INTERVAL', 0.001))
+    # directory of the profile files and their format: 'speedscope' (https://www.speedscope.app)
+    # or 'collapsed' (flamegraph.pl, also opened by speedscope)
+    PROFILE_DIR: str = os.environ.get('PROFILE_DIR', 'profiles')
+    PROFILE_FORMAT: str = os.environ.get('PROFILE_FORMAT', 'speedscope')
+
+    # 'sqlalchemy' - PostgreSQL; 'memory' - the in-memory repositories, e.g. to profile the framework overhead
+    # without the database, the data is lost on restart
+    REPOSITORY_BACKEND: str = os.environ.get('REPOSITORY_BACKEND', 'sqlalchemy')
+    # synthetic dataset (see `python -m src.seed`) loaded into the in-memory backend when the application is created
+    MEMORY_SEED_COMPANIES: int = int(os.environ.get('MEMORY_SEED_COMPANIES', 0))
+    MEMORY_SEED_USERS: int = int(os.environ.get('MEMORY_SEED_USERS', 0))
+
+    # read-through cache of by-ID repository lookups, see `CachedRepository`
+    REPOSITORY_CACHE_ENABLED: bool = os.environ.get('REPOSITORY_CACHE_ENABLED', 'false').lower() == 'true'
+    REPOSITORY_CACHE_MAXSIZE: int = int(os.environ.get('REPOSITORY_CACHE_MAXSIZE', 10000))
+    REPOSITORY_CACHE_TTL: float = float(os.environ.get('REPOSITORY_CACHE_TTL', 60))
+
+    # by-ID lookups of concurrent read-only transactions are loaded in batches, see `BatchingRepository`
+    REPOSITORY_BATCH_ENABLED: bool = os.environ.get('REPOSITORY_BATCH_ENABLED', 'false').lower() == 'true'
+    # seconds a batch waits for more lookups after the first one
+    REPOSITORY_BATCH_WINDOW: float = float(os.environ.get('REPOSITORY_BATCH_WINDOW', 0.002))
+    REPOSITORY_BATCH_MAX_SIZE: int = int(os.environ.get('REPOSITORY_BATCH_MAX_SIZE', 100))
+
+    # encoded responses of single-entity routes are cached in process, see `ResponseCache`
+    RESPONSE_CACHE_ENABLED: bool = os.environ.get('RESPONSE_CACHE_ENABLED', 'false').lower() == 'true'
+    # per route: seconds an entry lives and the total size of the cached bodies in bytes
+    RESPONSE_CACHE_USER_TTL: float = float(os.environ.get('RESPONSE_CACHE_USER_TTL', 60))
+    RESPONSE_CACHE_USER_MAXBYTES: int = int(os.environ.get('RESPONSE_CACHE_USER_MAXBYTES', 16 * 1024 * 1024))
+    RESPONSE_CACHE_COMPANY_TTL: float = float(os.environ.get('RESPONSE_CACHE_COMPANY_TTL', 30))
+    RESPONSE_CACHE_COMPANY_MAXBYTES: int = int(os.environ.get('RESPONSE_CACHE_COMPANY_MAXBYTES', 64 * 1024 * 1024))
+
+    # seconds the exact total of a listing (`total=exact`) may take, the total is omitted after that
+    COUNT_EXACT_TIMEOUT: float = float(os.environ.get('COUNT_EXACT_TIMEOUT', 1))
+
+    # company with users is rendered to JSON by PostgreSQL (`json_build_object`/`json_agg`) instead of the ORM
+    COMPANY_JSON_FROM_DB: bool = os.environ.get('COMPANY_JSON_FROM_DB', 'false').lower() == 'true'
+
 
 settings = Settings()
@@ -1,28 +1,135 @@
 from collections.abc import AsyncGenerator
+from itertools import cycle
+from typing import Any, TypeVar
 from uuid import uuid4
 
-from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import URL, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
-from src.config import settings
+from src.config import STATEMENT_CACHE_MODES, settings
+from src.database.pool import InstrumentedPool
+from src.database.query_log import install_query_log
 
-async_engine = create_async_engine(
-    url=settings.DB_URL,
-    echo=False,
-    future=True,
-    pool_size=50,
-    max_overflow=100,
-    connect_args={
-        'prepared_statement_name_func': lambda:  f'__asyncpg_{uuid4()}__',
-    },
-)
+T = TypeVar('T')
 
-async_session_maker = async_sessionmaker(
-    bind=async_engine,
-    class_=AsyncSession,
-    autoflush=False,
-    autocommit=False,
-    expire_on_commit=False,
-)
+
+def get_connect_args(statement_cache_mode: str = settings.DB_STATEMENT_CACHE_MODE) -> dict[str, Any]:
+    """Returns asyncpg arguments for the prepared statements mode, see `Settings.DB_STATEMENT_CACHE_MODE`."""
+    if statement_cache_mode not in STATEMENT_CACHE_MODES:
+        err_msg = f'Unknown statement cache mode {statement_cache_mode!r}, expected one of {STATEMENT_CACHE_MODES}'
+        raise ValueError(err_msg)
+    if statement_cache_mode == 'pgbouncer':
+        # the next statement may run on another server connection, so nothing can be reused
+        # and the names must not collide with statements prepared there by other clients
+        return {
+            'prepared_statement_name_func': lambda: f'__asyncpg_{uuid4()}__',
+            'prepared_statement_cache_size': 0,
+            'statement_cache_size': 0,
+        }
+    return {
+        'prepared_statement_cache_size': settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+    }
+
+
+def _create_engine(url: str | URL) -> AsyncEngine:
+    engine = create_async_engine(
+        url=url,
+        echo=False,
+        future=True,
+        poolclass=InstrumentedPool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=get_connect_args(),
+    )
+    if settings.QUERY_LOG_ENABLED:
+        install_query_log(engine)
+    return engine
+
+
+class ReadOnlyAsyncSession(AsyncSession):
+    """Session of read-only transactions on autocommit connections.
+    Results of `execute` (`scalars` included) and of `scalar` and `get` are buffered, so the connection is returned
+    to the pool right after each statement instead of being held until the end of the UnitOfWork.
+    A streamed result needs a server-side cursor, which exists only within a transaction, so `stream`
+    begins a `READ ONLY` transaction, it holds the connection until the session is closed.
+    """
+
+    # isolation level of the transactions of streamed results
+    stream_isolation_level = 'REPEATABLE READ'
+
+    async def execute(self, *args: Any, **kwargs: Any) -> Any:
+        return await self._release(await super().execute(*args, **kwargs))
+
+    async def scalar(self, *args: Any, **kwargs: Any) -> Any:
+        return await self._release(await super().scalar(*args, **kwargs))
+
+    async def get(self, *args: Any, **kwargs: Any) -> Any:
+        return await self._release(await super().get(*args, **kwargs))
+
+    async def stream(self, *args: Any, **kwargs: Any) -> Any:
+        # the isolation level of the connection is reset when it's returned to the pool
+        await self.connection(execution_options={'isolation_level': self.stream_isolation_level})
+        return await super().stream(*args, **kwargs)
+
+    async def _release(self, result: T) -> T:
+        await self.commit()  # COMMIT isn't sent on an autocommit connection, the connection is just released
+        return result
+
+
+def _create_session_maker(engine: AsyncEngine, *, read_only: bool = False) -> async_sessionmaker[AsyncSession]:
+    session_class = AsyncSession
+    if read_only:
+        isolation_level = settings.DB_READ_ONLY_ISOLATION_LEVEL
+        engine = engine.execution_options(isolation_level=isolation_level, postgresql_readonly=True)
+        if isolation_level == 'AUTOCOMMIT':
+            session_class = ReadOnlyAsyncSession
+    return async_sessionmaker(
+        bind=engine,
+        class_=session_class,
+        autoflush=False,
+        autocommit=False,
+        expire_on_commit=False,
+    )
+
+
+def _replica_url(replica_host: str) -> URL:
+    host, _, port = replica_host.partition(':')
+    return make_url(settings.DB_URL).set(host=host, port=int(port or settings.DB_PORT))
+
+
+async_engine = _create_engine(settings.DB_URL)
+async_session_maker = _create_session_maker(async_engine)
+read_only_session_maker = _create_session_maker(async_engine, read_only=True)
+
+replica_engines = [_create_engine(_replica_url(host)) for host in settings.DB_REPLICA_HOSTS]
+replica_session_makers = [_create_session_maker(engine, read_only=True) for engine in replica_engines]
+_replica_session_makers_cycle = cycle(replica_session_makers)
+
+
+def get_engines() -> dict[str, AsyncEngine]:
+    """Returns the engines of the primary and of the replicas by name."""
+    replicas = zip(settings.DB_REPLICA_HOSTS, replica_engines, strict=True)
+    return {'primary': async_engine} | {f'replica {host}': engine for host, engine in replicas}
+
+
+async def dispose_engines() -> None:
+    """Closes the connections of the pools of all engines."""
+    for engine in get_engines().values():
+        await engine.dispose()
+
+
+def get_replica_session_maker() -> async_sessionmaker[AsyncSession] | None:
+    """Returns the session maker of the next replica (round-robin) or None if there are no replicas."""
+    return next(_replica_session_makers_cycle, None)
 
 
 async def get_async_connection() -> AsyncGenerator[AsyncConnection, None]:
@@ -0,0 +1,218 @@
+"""The module contains the in-memory database of the in-memory backend, see `REPOSITORY_BACKEND`."""
+
+from collections import defaultdict
+from collections.abc import Callable, Collection, Hashable, Iterable, Mapping, Sequence
+from datetime import UTC, datetime
+from functools import partial
+from typing import Any
+
+from sqlalchemy import Column, Table
+from sqlalchemy.exc import CompileError, IntegrityError, InvalidRequestError
+
+from src.models import BaseModel, CompanyModel, UserModel
+
+
+def utc_now() -> datetime:
+    # the columns store UTC without a time zone, as `TIMEZONE('utc', now())` of the server defaults
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def _integrity_error(message: str) -> IntegrityError:
+    return IntegrityError(message, None, ValueError(message))
+
+
+class InMemoryTable:
+    """Rows of a table by primary key with hash indexes of the given columns.
+    A row is a dict of all column values, it is replaced on update, callers get copies of it.
+    """
+
+    def __init__(self, table: Table, indexed_columns: Iterable[str]) -> None:
+        self.table = table
+        self.name = table.name
+        self.columns = table.columns
+        self.rows: dict[Hashable, dict[str, Any]] = {}
+        self.indexes: dict[str, defaultdict[Any, set[Hashable]]] = {
+            column: defaultdict(set) for column in indexed_columns
+        }
+
+    def insert(self, row: dict[str, Any]) -> None:
+        if row['id'] in self.rows:
+            err_msg = f'duplicate key value violates unique constraint "{self.name}_pkey"'
+            raise _integrity_error(err_msg)
+        self.rows[row['id']] = row
+        for column, index in self.indexes.items():
+            index[row[column]].add(row['id'])
+
+    def replace(self, row: dict[str, Any]) -> None:
+        old = self.rows[row['id']]
+        self.rows[row['id']] = row
+        for column, index in self.indexes.items():
+            if old[column] != row[column]:
+                self._unindex(index, old[column], row['id'])
+                index[row[column]].add(row['id'])
+
+    def delete(self, obj_id: Hashable) -> dict[str, Any]:
+        row = self.rows.pop(obj_id)
+        for column, index in self.indexes.items():
+            self._unindex(index, row[column], obj_id)
+        return row
+
+    def clear(self) -> None:
+        self.rows.clear()
+        for index in self.indexes.values():
+            index.clear()
+
+    def where_in(self, criteria: Mapping[str, Collection[Any]]) -> Collection[dict[str, Any]]:
+        """Rows whose value of every given column is one of the given values.
+        The candidates are found by the primary key or by the most selective index, the rest are checked one by one.
+        """
+        if not criteria:
+            return self.rows.values()
+        if unknown := criteria.keys() - self.columns.keys():
+            err_msg = f'Table "{self.name}" has no columns {sorted(unknown)}'
+            raise InvalidRequestError(err_msg)
+
+        if 'id' in criteria:
+            ids: Iterable[Hashable] = dict.fromkeys(criteria['id'])
+        else:
+            candidates = [
+                {obj_id for value in values for obj_id in self.indexes[column].get(value, ())}
+                for column, values in criteria.items()
+                if column in self.indexes
+            ]
+            ids = min(candidates, key=len) if candidates else self.rows.keys()
+
+        rows = (self.rows.get(obj_id) for obj_id in ids)
+        return [
+            row for row in rows
+            if row is not None and all(row[column] in values for column, values in criteria.items())
+        ]
+
+    @staticmethod
+    def _unindex(index: defaultdict[Any, set[Hashable]], value: Any, obj_id: Hashable) -> None:
+        ids = index[value]
+        ids.discard(obj_id)
+        if not ids:
+            del index[value]
+
+
+class InMemoryDatabase:
+    """Tables of the models kept in process memory, shared by all in-memory sessions of the process.
+    Foreign keys are enforced, `ON DELETE CASCADE` included, their columns must be indexed.
+    """
+
+    def __init__(self, indexes: Mapping[type[BaseModel], Sequence[str]]) -> None:
+        self.tables = {
+            model.__tablename__: InMemoryTable(model.__table__, columns) for model, columns in indexes.items()
+        }
+        # foreign keys by the referencing table: the column and the referenced table
+        self.foreign_keys: dict[str, list[tuple[str, InMemoryTable]]] = defaultdict(list)
+        # foreign keys by the referenced table: the referencing table, its column and whether deletes cascade
+        self.referenced_by: dict[str, list[tuple[InMemoryTable, str, bool]]] = defaultdict(list)
+        for table in self.tables.values():
+            for foreign_key in table.table.foreign_keys:
+                column = foreign_key.parent.key
+                if column not in table.indexes:
+                    err_msg = f'Foreign key column "{table.name}.{column}" must be indexed'
+                    raise ValueError(err_msg)
+                referenced = self.tables[foreign_key.column.table.name]
+                self.foreign_keys[table.name].append((column, referenced))
+                cascade = (foreign_key.ondelete or '').upper() == 'CASCADE'
+                self.referenced_by[referenced.name].append((table, column, cascade))
+
+    def clear(self) -> None:
+        for table in self.tables.values():
+            table.clear()
+
+
+class InMemorySession:
+    """Transaction of the in-memory database: changes are applied at once and undone on rollback.
+    There is no isolation, concurrent transactions see the uncommitted changes of each other,
+    but every change is atomic, since it doesn't await.
+    """
+
+    def __init__(self, database: InMemoryDatabase) -> None:
+        self.database = database
+        self._undo: list[Callable[[], Any]] = []
+
+    def table(self, model: type[BaseModel]) -> InMemoryTable:
+        return self.database.tables[model.__tablename__]
+
+    def insert(self, table: InMemoryTable, values: Mapping[str, Any]) -> dict[str, Any]:
+        """Inserts the row filling the column defaults, returns a copy of the inserted row."""
+        if unknown := values.keys() - table.columns.keys():
+            err_msg = f'Unconsumed column names: {", ".join(sorted(unknown))}'
+            raise CompileError(err_msg)
+
+        row = {
+            column.key: values[column.key] if column.key in values else self._get_column_default(column)
+            for column in table.columns
+        }
+        self._check_foreign_keys(table, row)
+        table.insert(row)
+        self._undo.append(partial(table.delete, row['id']))
+        return dict(row)
+
+    def update(self, table: InMemoryTable, obj_id: Hashable, values: Mapping[str, Any]) -> dict[str, Any] | None:
+        """Updates the row filling the `onupdate` columns, returns a copy of the updated row or None."""
+        old = table.rows.get(obj_id)
+        if old is None:
+            return None
+
+        row = old | {
+            column.key: utc_now() for column in table.columns if column.onupdate is not None or column.server_onupdate
+        } | values
+        self._check_foreign_keys(table, row)
+        table.replace(row)
+        self._undo.append(partial(table.replace, old))
+        return dict(row)
+
+    def delete(self, table: InMemoryTable, obj_id: Hashable) -> None:
+        """Deletes the row if it exists, the referencing rows are deleted too if the foreign key cascades."""
+        if obj_id not in table.rows:
+            return
+
+        for referencing, column, cascade in self.database.referenced_by[table.name]:
+            referencing_ids = list(referencing.indexes[column].get(obj_id, ()))
+            if referencing_ids and not cascade:
+                err_msg = f'"{table.name}" row is still referenced from table "{referencing.name}"'
+                raise _integrity_error(err_msg)
+            for referencing_id in referencing_ids:
+                self.delete(referencing, referencing_id)
+
+        row = table.delete(obj_id)
+        self._undo.append(partial(table.insert, row))
+
+    async def flush(self) -> None:
+        """Changes are applied at once, there is nothing to flush."""
+
+    async def commit(self) -> None:
+        self._undo.clear()
+
+    async def rollback(self) -> None:
+        while self._undo:
+            self._undo.pop()()
+
+    async def close(self) -> None:
+        # as with `AsyncSession`, closing rolls back the transaction that isn't committed
+        await self.rollback()
+
+    def _check_foreign_keys(self, table: InMemoryTable, row: dict[str, Any]) -> None:
+        for column, referenced in self.database.foreign_keys[table.name]:
+            if row[column] is not None and row[column] not in referenced.rows:
+                err_msg = f'insert or update on table "{table.name}" violates foreign key "{table.name}_{column}_fkey"'
+                raise _integrity_error(err_msg)
+
+    @staticmethod
+    def _get_column_default(column: Column) -> Any:
+        if column.default is not None:
+            return column.default.arg(None) if column.default.is_callable else column.default.arg
+        # the only server-side defaults of the models are the UTC timestamps
+        return utc_now() if column.server_default is not None else None
+
+
+# the secondary indexes mirror the ones the repositories filter by
+memory_database = InMemoryDatabase({
+    CompanyModel: ('inn',),
+    UserModel: ('company_id', 'first_name', 'last_name', 'middle_name'),
+})
@@ -0,0 +1,51 @@
+"""The module contains the connection pool collecting checkout statistics."""
+
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Self
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from src.utils.metrics import Histogram
+
+# upper bounds of the checkout wait time buckets in seconds
+CHECKOUT_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+@dataclass(slots=True)
+class PoolStats:
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_time: Histogram = field(default_factory=lambda: Histogram(CHECKOUT_WAIT_BUCKETS))
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool of the asyncio engines counting checkouts, their wait time and timeouts.
+    The wait time covers waiting for a free connection, opening a new one and the pre-ping.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    @property
+    def max_overflow(self) -> int:
+        return self._max_overflow
+
+    def connect(self) -> PoolProxiedConnection:
+        start = perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.stats.timeouts += 1
+            raise
+        self.stats.checkouts += 1
+        self.stats.wait_time.observe(perf_counter() - start)
+        return connection
+
+    def recreate(self) -> Self:
+        # the statistics survive `engine.dispose()`
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
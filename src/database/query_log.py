@@ -0,0 +1,150 @@
+"""The module contains the slow-query log and the detection of repeated statements (N+1) within a request."""
+
+import functools
+import random
+from collections import Counter
+from collections.abc import Awaitable, Callable, Sequence
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, TypeVar
+
+from loguru import logger
+from sqlalchemy import Connection, event
+from sqlalchemy.engine.interfaces import DBAPICursor, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import Scope
+
+from src.config import settings
+
+F = TypeVar('F', bound=Callable[..., Awaitable[Any]])
+
+_QUERY_START_KEY = 'query_log_start'
+
+
+@dataclass(slots=True)
+class RequestQueries:
+    """Statements run while handling a request, by their SQL text with placeholders (the shape)."""
+
+    scope: Scope
+    counts: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def route(self) -> str:
+        # the router puts the matched route into the scope before calling the endpoint
+        route = self.scope.get('route')
+        return route.path if route is not None else self.scope['path']
+
+
+# set by `QueryLogMiddleware` for the duration of a request
+request_queries: ContextVar[RequestQueries | None] = ContextVar('request_queries', default=None)
+# `Repository.method` running the statement, set by the repository methods, see `traced`
+current_caller: ContextVar[str | None] = ContextVar('current_caller', default=None)
+
+
+def traced(caller: str) -> Callable[[F], F]:
+    """Marks the statements run by the coroutine function with the caller name in the query log."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            token = current_caller.set(caller)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                current_caller.reset(token)
+
+        return wrapper
+
+    return decorator
+
+
+def install_query_log(engine: AsyncEngine) -> None:
+    """Times every statement of the engine, see `Settings.SLOW_QUERY_THRESHOLD` and `Settings.N_PLUS_ONE_THRESHOLD`."""
+    event.listen(engine.sync_engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(engine.sync_engine, 'after_cursor_execute', _after_cursor_execute)
+
+
+def parameters_shape(parameters: Any, *, executemany: bool = False) -> str:
+    """Types of the parameters without their values, which may be large or sensitive."""
+    if executemany:
+        rows = list(parameters)
+        return f'{len(rows)} x {parameters_shape(rows[0])}' if rows else '0 rows'
+    if isinstance(parameters, dict):
+        return '{{{}}}'.format(', '.join(f'{key}: {_value_shape(value)}' for key, value in parameters.items()))
+    return '({})'.format(', '.join(_value_shape(value) for value in parameters or ()))
+
+
+def _value_shape(value: Any) -> str:
+    if isinstance(value, list | tuple):
+        return f'{type(value).__name__}[{len(value)}]'
+    return type(value).__name__
+
+
+def _before_cursor_execute(conn: Connection, *_args: Any) -> None:
+    conn.info.setdefault(_QUERY_START_KEY, []).append(perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Connection,
+    cursor: DBAPICursor,
+    statement: str,
+    parameters: Any,
+    context: ExecutionContext,
+    executemany: bool,  # noqa: FBT001
+) -> None:
+    duration = perf_counter() - conn.info[_QUERY_START_KEY].pop()
+    queries = request_queries.get()
+    if queries is not None:
+        queries.counts[statement] += 1
+        if queries.counts[statement] == settings.N_PLUS_ONE_THRESHOLD + 1:
+            logger.warning(
+                f'Statement run more than {settings.N_PLUS_ONE_THRESHOLD} times in one request (N+1?), '
+                f'route: {queries.route}, caller: {current_caller.get()}, statement: {statement}',
+            )
+
+    if duration < settings.SLOW_QUERY_THRESHOLD:
+        return
+
+    route = queries.route if queries is not None else None
+    message = (
+        f'Slow query {duration:.3f}s, route: {route}, caller: {current_caller.get()}, '
+        f'parameters: {parameters_shape(parameters, executemany=executemany)}, statement: {statement}'
+    )
+    if _should_explain(statement, context, executemany=executemany):
+        message += f'\n{_explain_analyze(conn, statement, parameters)}'
+    logger.warning(message)
+
+
+def _should_explain(statement: str, context: ExecutionContext, *, executemany: bool) -> bool:
+    # EXPLAIN ANALYZE runs the statement again, so only single reads are explained;
+    # a server-side cursor of a streamed result is still open on the connection
+    return (
+        random.random() < settings.SLOW_QUERY_EXPLAIN_RATE  # noqa: S311
+        and not executemany
+        and not context.execution_options.get('stream_results')
+        and statement.lstrip()[:6].upper() == 'SELECT'
+    )
+
+
+def _explain_analyze(conn: Connection, statement: str, parameters: Sequence[Any]) -> str:
+    """Plan of the statement with the actual times and buffers, run on a separate cursor of the same connection.
+    Within a transaction EXPLAIN runs in a savepoint, so its failure doesn't abort the transaction.
+    """
+    in_transaction = conn.connection.driver_connection.is_in_transaction()
+    cursor = conn.connection.cursor()
+    try:
+        if in_transaction:
+            cursor.execute('SAVEPOINT query_log_explain')
+        try:
+            cursor.execute(f'EXPLAIN (ANALYZE, BUFFERS) {statement}', parameters)
+            plan = '\n'.join(row[0] for row in cursor.fetchall())
+        except Exception as exc:
+            if in_transaction:
+                cursor.execute('ROLLBACK TO SAVEPOINT query_log_explain')
+            return f'EXPLAIN failed: {exc}'
+        if in_transaction:
+            cursor.execute('RELEASE SAVEPOINT query_log_explain')
+        return plan
+    finally:
+        cursor.close()
@@ -0,0 +1,44 @@
+"""The module contains routing of transactions between the primary and read replicas."""
+
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.database import db
+
+
+@dataclass(slots=True)
+class PrimaryPin:
+    """Request-scoped state of read-your-writes.
+    `pinned` keeps read-only transactions on the primary, `wrote` is set once a write transaction is committed.
+    """
+
+    pinned: bool = False
+    wrote: bool = False
+
+
+primary_pin: ContextVar[PrimaryPin | None] = ContextVar('primary_pin', default=None)
+
+
+def pin_to_primary() -> None:
+    """Keeps the following reads of the current request (and of the client, see `ReadYourWritesMiddleware`)
+    on the primary, so they don't miss the changes that haven't been replicated yet.
+    """
+    pin = primary_pin.get()
+    if pin is not None:
+        pin.pinned = pin.wrote = True
+
+
+def is_pinned_to_primary() -> bool:
+    pin = primary_pin.get()
+    return pin is not None and pin.pinned
+
+
+def get_session_maker(*, read_only: bool = False) -> async_sessionmaker[AsyncSession]:
+    """Returns the session maker of a replica for read-only transactions, otherwise of the primary."""
+    if not read_only:
+        return db.async_session_maker
+    if is_pinned_to_primary():
+        return db.read_only_session_maker
+    return db.get_replica_session_maker() or db.read_only_session_maker
@@ -0,0 +1,87 @@
+"""The module contains the warm-up of the connection pools at startup."""
+
+import asyncio
+from collections.abc import Mapping
+from dataclasses import fields
+from itertools import starmap
+from time import perf_counter
+from typing import TypeVar
+from uuid import uuid4
+
+from loguru import logger
+from pydantic.fields import FieldInfo
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from src.repositories import CompanyRepository, UserRepository
+from src.schemas.company import CompanyFilters
+from src.schemas.filter import BaseFilter
+from src.schemas.user import UserFilters
+
+F = TypeVar('F', bound=BaseFilter)
+
+
+def default_filters(filter_class: type[F]) -> F:
+    """Filters with the defaults of the query parameters, created outside of a request."""
+    values = {
+        field.name: field.default.default if isinstance(field.default, FieldInfo) else field.default
+        for field in fields(filter_class)
+    }
+    return filter_class(**values)
+
+
+async def run_hot_statements(session: AsyncSession) -> None:
+    """Runs the statements of the read routes, so the connection prepares them and the engine compiles them.
+    The ID matches no row, so only the first statement of `get_company_with_users` runs.
+    """
+    users, companies = UserRepository(session), CompanyRepository(session)
+    missing_id = uuid4()
+    await users.get_by_filter_one_or_none(id=missing_id)
+    await users.get_updated_at(missing_id)
+    await users.get_users_by_filter(default_filters(UserFilters))
+    await companies.get_company_with_users(missing_id)
+    await companies.get_company_with_users_version(missing_id)
+    await companies.get_company_with_users_json(missing_id)
+    await companies.get_companies_by_filter(default_filters(CompanyFilters))
+
+
+async def warm_up_engine(engine: AsyncEngine, connections: int, *, statements: bool = True) -> int:
+    """Opens up to `connections` connections of the pool at once (at most the pool size, since the overflow
+    is closed on return) and returns them to the pool. With `statements` the hot statements are run on each.
+    Returns the number of connections opened, failures are logged, so the application starts anyway.
+    """
+    connections = min(connections, engine.pool.size())
+    results = await asyncio.gather(
+        *(engine.connect().start() for _ in range(connections)),
+        return_exceptions=True,
+    )
+    opened = [result for result in results if isinstance(result, AsyncConnection)]
+    errors = [result for result in results if isinstance(result, BaseException)]
+    try:
+        if errors:
+            logger.warning(f'Failed to open {len(errors)} of {connections} connections: {errors[0]}')
+        if statements:
+            await asyncio.gather(*(_run_hot_statements(connection) for connection in opened))
+    finally:
+        await asyncio.gather(*(connection.close() for connection in opened))
+    return len(opened)
+
+
+async def warm_up_engines(engines: Mapping[str, AsyncEngine], connections: int, *, statements: bool = True) -> None:
+    """Warms up the engines by name in parallel, see `warm_up_engine`."""
+
+    async def warm_up(name: str, engine: AsyncEngine) -> None:
+        start = perf_counter()
+        opened = await warm_up_engine(engine, connections, statements=statements)
+        logger.info(f'Pool of the {name} engine warmed up with {opened} connections in {perf_counter() - start:.2f}s')
+
+    await asyncio.gather(*starmap(warm_up, engines.items()))
+
+
+async def _run_hot_statements(connection: AsyncConnection) -> None:
+    # the session begins a transaction on the connection and rolls it back on close
+    async with AsyncSession(bind=connection) as session:
+        try:
+            await run_hot_statements(session)
+        except SQLAlchemyError as exc:
+            logger.warning(f'Failed to run the hot statements: {exc}')
@@ -1,11 +1,34 @@
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from dotenv import find_dotenv, load_dotenv
 from fastapi import FastAPI
 from fastapi.responses import ORJSONResponse
 
 from src.api import router
+from src.api.metrics import router as metrics_router
+from src.config import settings
+from src.database.db import dispose_engines, get_engines
+from src.database.memory import memory_database
+from src.database.warmup import warm_up_engines
 from src.metadata import DESCRIPTION, TAG_METADATA, TITLE, VERSION
+from src.middlewares import MetricsMiddleware, ProfilerMiddleware, QueryLogMiddleware, ReadYourWritesMiddleware
+from src.seed.dataset import SeedOptions, seed_memory
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Warms up the connection pools (or fills the in-memory database) before serving requests
+    and closes the pools on shutdown.
+    """
+    if settings.REPOSITORY_BACKEND == 'memory':
+        options = SeedOptions(companies=settings.MEMORY_SEED_COMPANIES, users=settings.MEMORY_SEED_USERS)
+        seed_memory(memory_database, options)
+    elif settings.DB_POOL_WARM_UP_SIZE > 0:
+        await warm_up_engines(get_engines(), settings.DB_POOL_WARM_UP_SIZE, statements=settings.DB_WARM_UP_STATEMENTS)
+    yield
+    await dispose_engines()
 
 
 def create_fast_api_app() -> FastAPI:
@@ -19,6 +42,7 @@ def create_fast_api_app() -> FastAPI:
             description=DESCRIPTION,
             version=VERSION,
             openapi_tags=TAG_METADATA,
+            lifespan=lifespan,
         )
     else:
         fastapi_app = FastAPI(
@@ -27,11 +51,29 @@ def create_fast_api_app() -> FastAPI:
             description=DESCRIPTION,
             version=VERSION,
             openapi_tags=TAG_METADATA,
+            lifespan=lifespan,
             docs_url=None,
             redoc_url=None,
         )
 
     fastapi_app.include_router(router, prefix='/api')
+    fastapi_app.include_router(metrics_router)
+    if settings.QUERY_LOG_ENABLED:
+        fastapi_app.add_middleware(QueryLogMiddleware)
+    if settings.DB_REPLICA_HOSTS:
+        fastapi_app.add_middleware(ReadYourWritesMiddleware, ttl=settings.DB_READ_YOUR_WRITES_TTL)
+    # the middleware isn't added at all unless enabled, so requests pay nothing for it
+    if settings.PROFILE_TOKEN or settings.PROFILE_SAMPLE_RATE > 0:
+        fastapi_app.add_middleware(
+            ProfilerMiddleware,
+            directory=settings.PROFILE_DIR,
+            token=settings.PROFILE_TOKEN,
+            sample_rate=settings.PROFILE_SAMPLE_RATE,
+            interval=settings.PROFILE_INTERVAL,
+            output_format=settings.PROFILE_FORMAT,
+        )
+    # added last to be the outermost, so the latency covers the other middlewares
+    fastapi_app.add_middleware(MetricsMiddleware)
     return fastapi_app
 
 
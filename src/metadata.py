@@ -7,6 +7,10 @@ TAG_METADATA = [
         'name': 'Company | v1',
         'description': 'Operation with company v1.',
     },
+    {
+        'name': 'Admin | v1',
+        'description': 'Inspection of the application internals v1.',
+    },
     {
         'name': 'healthz',
         'description': 'Standard health check.',
@@ -0,0 +1,13 @@
+"""The package contains ASGI middlewares."""
+
+__all__ = [
+    'MetricsMiddleware',
+    'ProfilerMiddleware',
+    'QueryLogMiddleware',
+    'ReadYourWritesMiddleware',
+]
+
+from src.middlewares.metrics import MetricsMiddleware
+from src.middlewares.profiler import ProfilerMiddleware
+from src.middlewares.query_log import QueryLogMiddleware
+from src.middlewares.read_your_writes import ReadYourWritesMiddleware
@@ -0,0 +1,43 @@
+"""The module contains the middleware observing the latency of requests."""
+
+from time import perf_counter
+
+from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.utils.metrics import request_duration
+
+# route label of requests matching no route, so that unknown paths don't create new label values
+UNMATCHED_ROUTE = 'unmatched'
+
+
+class MetricsMiddleware:
+    """Observes the latency of HTTP requests in `http_request_duration_seconds`
+    by method, route template (not the path, to keep the number of label values bounded) and status.
+    The latency covers sending the body, streaming responses included. Pure ASGI, so nothing is buffered.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        status = HTTP_500_INTERNAL_SERVER_ERROR
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # the router puts the matched route into the scope
+            route = scope.get('route')
+            route_path = route.path if route is not None else UNMATCHED_ROUTE
+            request_duration.labels(scope['method'], route_path, status).observe(perf_counter() - start)
@@ -0,0 +1,97 @@
+"""The module contains the middleware profiling single requests."""
+
+import hmac
+import random
+import re
+from datetime import UTC, datetime
+from operator import itemgetter
+from pathlib import Path
+from uuid import uuid4
+
+from loguru import logger
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, QueryParams
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.utils.profiler import SamplingProfiler
+
+PROFILE_HEADER = 'x-profile'
+PROFILE_QUERY_PARAM = 'profile'
+# file suffixes by the output format
+PROFILE_SUFFIXES = {'speedscope': '.speedscope.json', 'collapsed': '.collapsed.txt'}
+
+
+class ProfilerMiddleware:
+    """Profiles a request with `SamplingProfiler` when it passes the token in the `X-Profile` header
+    or in the `profile` query parameter, or at random with the probability `sample_rate`.
+
+    The profile is saved into `directory` once the response is sent, in the speedscope or the collapsed-stack format,
+    and its time by layer (router, service, repository, database, serialization) is logged.
+    Requests that are not profiled only check the header and draw the random number.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        directory: str,
+        token: str = '',
+        sample_rate: float = 0,
+        interval: float = 0.001,
+        output_format: str = 'speedscope',
+    ) -> None:
+        if output_format not in PROFILE_SUFFIXES:
+            err_msg = f'Unknown profile format {output_format!r}, expected one of {sorted(PROFILE_SUFFIXES)}'
+            raise ValueError(err_msg)
+        self.app = app
+        self.directory = Path(directory)
+        self.token = token.encode()
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self.output_format = output_format
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = SamplingProfiler(self.interval)
+        coro = self.app(scope, receive, send)
+        profiler.start(coro)
+        try:
+            await coro
+        finally:
+            profiler.stop()
+            # the response is sent already, so a failure to save only loses the profile
+            try:
+                await run_in_threadpool(self._save, scope, profiler)
+            except OSError as exc:
+                logger.error(f'Failed to save the profile of {scope["method"]} {scope["path"]}: {exc}')
+
+    def _should_profile(self, scope: Scope) -> bool:
+        if self.token:
+            supplied = Headers(scope=scope).get(PROFILE_HEADER)
+            if supplied is None and PROFILE_QUERY_PARAM.encode() in scope['query_string']:
+                supplied = QueryParams(scope['query_string']).get(PROFILE_QUERY_PARAM)
+            if supplied is not None and hmac.compare_digest(supplied.encode(), self.token):
+                return True
+        return random.random() < self.sample_rate  # noqa: S311
+
+    def _save(self, scope: Scope, profiler: SamplingProfiler) -> None:
+        # the router puts the matched route into the scope
+        route = scope.get('route')
+        route_path = route.path if route is not None else scope['path']
+        name = f'{scope["method"]} {route_path}'
+
+        slug = re.sub(r'[^\w-]+', '_', route_path).strip('_') or 'root'
+        timestamp = datetime.now(UTC).strftime('%Y%m%dT%H%M%S')
+        suffix = PROFILE_SUFFIXES[self.output_format]
+        path = self.directory / f'{timestamp}-{scope["method"]}-{slug}-{uuid4().hex[:8]}{suffix}'
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if self.output_format == 'speedscope':
+            path.write_bytes(profiler.to_speedscope(name))
+        else:
+            path.write_text(profiler.to_collapsed())
+
+        layers = sorted(profiler.layers().items(), key=itemgetter(1), reverse=True)
+        by_layer = ', '.join(f'{layer} {seconds * 1000:.1f}ms' for layer, seconds in layers) or 'no samples'
+        logger.info(f'Profile of {name} ({profiler.duration * 1000:.1f}ms) saved to {path}, by layer: {by_layer}')
@@ -0,0 +1,25 @@
+"""The module contains the middleware collecting the statements run by a request."""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.database.query_log import RequestQueries, request_queries
+
+
+class QueryLogMiddleware:
+    """Counts the statements of every HTTP request by shape for the N+1 detection of the query log
+    and names the route in its messages.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        token = request_queries.set(RequestQueries(scope))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_queries.reset(token)
@@ -0,0 +1,40 @@
+"""The module contains the middleware providing read-your-writes on top of read replicas."""
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.database.routing import PrimaryPin, primary_pin
+
+
+class ReadYourWritesMiddleware:
+    """Keeps reads of a client on the primary for `ttl` seconds after its write.
+
+    The write is remembered in a short-lived cookie, so it works across requests and workers,
+    while within the request the reads follow the write right away.
+    Pure ASGI, so streaming responses are not buffered.
+    """
+
+    def __init__(self, app: ASGIApp, ttl: int, cookie_name: str = 'db_primary_pin') -> None:
+        self.app = app
+        self.ttl = ttl
+        self.cookie_name = cookie_name
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        pin = PrimaryPin(pinned=self.cookie_name in HTTPConnection(scope).cookies)
+
+        async def send_wrapper(message: Message) -> None:
+            if message['type'] == 'http.response.start' and pin.wrote:
+                cookie = f'{self.cookie_name}=1; Max-Age={self.ttl}; Path=/; HttpOnly; SameSite=Lax'
+                MutableHeaders(scope=message).append('set-cookie', cookie)
+            await send(message)
+
+        token = primary_pin.set(pin)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            primary_pin.reset(token)
@@ -1,5 +1,8 @@
+from sqlalchemy import event
 from sqlalchemy.orm import DeclarativeBase
 
+from src.utils.search import create_pg_trgm
+
 
 class BaseModel(DeclarativeBase):
     __abstract__ = True
@@ -14,3 +17,7 @@ class BaseModel(DeclarativeBase):
                 cols.append(f'{col}={getattr(self, col)}')
 
         return f'<{self.__class__.__name__} {", ".join(cols)}>'
+
+
+# trigram indexes of the models need the extension
+event.listen(BaseModel.metadata, 'before_create', create_pg_trgm)
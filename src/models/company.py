@@ -1,11 +1,12 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, Column, String
+from sqlalchemy import Boolean, Column, Index, String
 from sqlalchemy.orm import Mapped, relationship
 
 from src.models import BaseModel
 from src.schemas.company import CompanyDB
 from src.utils.custom_types import created_at, updated_at, uuid_pk
+from src.utils.search import trigram_index
 
 if TYPE_CHECKING:
     from src.models.user import UserModel
@@ -13,6 +14,11 @@ if TYPE_CHECKING:
 
 class CompanyModel(BaseModel):
     __tablename__ = 'company'
+    __table_args__ = (
+        Index('ix_company_inn', 'inn'),
+        # fuzzy search by `like`
+        trigram_index('ix_company_company_name_trgm', 'company_name'),
+    )
 
     id: Mapped[uuid_pk]
     inn: Mapped[int]
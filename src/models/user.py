@@ -1,14 +1,28 @@
-from sqlalchemy import String
+from sqlalchemy import Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.models import BaseModel
 from src.models.mixins.company_mixin import CompanyMixin
 from src.schemas.user import UserDB
 from src.utils.custom_types import created_at, updated_at, uuid_pk
+from src.utils.search import trigram_index
 
 
 class UserModel(CompanyMixin, BaseModel):
     __tablename__ = 'user'
+    __table_args__ = (
+        # keyset pagination indexes, see `UserRepository._sortable_columns`
+        Index('ix_user_first_name_id', 'first_name', 'id'),
+        Index('ix_user_last_name_id', 'last_name', 'id'),
+        Index('ix_user_created_at_id', 'created_at', 'id'),
+        # users of a company, ordered by id
+        Index('ix_user_company_id_id', 'company_id', 'id'),
+        Index('ix_user_middle_name_id', 'middle_name', 'id'),
+        # fuzzy search by `like`, see `UserRepository._search_columns`
+        trigram_index('ix_user_first_name_trgm', 'first_name'),
+        trigram_index('ix_user_last_name_trgm', 'last_name'),
+        trigram_index('ix_user_middle_name_trgm', 'middle_name'),
+    )
 
     _company_back_populates: str | None = 'users'
 
@@ -1,7 +1,10 @@
 __all__ = [
     'CompanyRepository',
+    'InMemoryCompanyRepository',
+    'InMemoryUserRepository',
     'UserRepository',
 ]
 
 from src.repositories.company import CompanyRepository
+from src.repositories.memory import InMemoryCompanyRepository, InMemoryUserRepository
 from src.repositories.user import UserRepository
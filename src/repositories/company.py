@@ -1,9 +1,18 @@
+from collections.abc import Collection
+from dataclasses import replace
+from typing import Any
+
 from pydantic import UUID4
-from sqlalchemy import Result, select
+from sqlalchemy import Result, Row, Select, Text, bindparam, cast, func, literal_column, select, true
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.orm import selectinload
 
-from src.models import CompanyModel
-from src.utils.repository import SqlAlchemyRepository
+from src.models import CompanyModel, UserModel
+from src.schemas.company import CompanyDB, CompanyFilters
+from src.schemas.user import UserDB
+from src.utils.pagination import Page
+from src.utils.repository import SqlAlchemyRepository, json_object
+from src.utils.search import SEARCH_RANK_KEY, search_condition, search_rank
 
 
 class CompanyRepository(SqlAlchemyRepository[CompanyModel]):
@@ -11,10 +20,91 @@ class CompanyRepository(SqlAlchemyRepository[CompanyModel]):
 
     async def get_company_with_users(self, company_id: UUID4) -> CompanyModel | None:
         """Find company by ID with all users."""
-        query = (
-            select(self._model)
-            .where(self._model.id == company_id)
-            .options(selectinload(self._model.users))
+        query = self._get_statement(
+            'get_company_with_users',
+            lambda: select(self._model)
+            .where(self._model.id == bindparam('p_id'))
+            .options(selectinload(self._model.users)),
         )
-        res: Result = await self._session.execute(query)
+        res: Result = await self._session.execute(query, {'p_id': company_id})
+        return res.scalar_one_or_none()
+
+    async def get_company_with_users_version(self, company_id: UUID4) -> Row | None:
+        """Version of the company with users for conditional requests: `updated_at` of the company,
+        the latest `updated_at` and the number of its users (a deleted user changes only the number).
+        """
+        query = self._get_statement(
+            'get_company_with_users_version',
+            lambda: select(self._model.updated_at, func.max(UserModel.updated_at), func.count(UserModel.id))
+            .outerjoin(self._model.users)
+            .where(self._model.id == bindparam('p_id'))
+            .group_by(self._model.id),
+        )
+        res: Result = await self._session.execute(query, {'p_id': company_id})
+        return res.one_or_none()
+
+    async def get_company_with_users_json(self, company_id: UUID4) -> str | None:
+        """Find company by ID with all users as a `CompanyWithUsers` JSON document assembled by PostgreSQL."""
+        query = self._get_statement('get_company_with_users_json', self._build_company_with_users_json)
+        res: Result = await self._session.execute(query, {'p_id': company_id})
         return res.scalar_one_or_none()
+
+    async def get_company_with_users_json_and_version(self, company_id: UUID4) -> Row | None:
+        """The document of `get_company_with_users_json` followed by the version of `get_company_with_users_version`,
+        selected by the same statement.
+        """
+        query = self._get_statement('get_company_with_users_json', self._build_company_with_users_json)
+        res: Result = await self._session.execute(query, {'p_id': company_id})
+        return res.one_or_none()
+
+    def _build_company_with_users_json(self) -> Select:
+        users = (
+            select(
+                func.json_agg(aggregate_order_by(json_object(UserModel, UserDB), UserModel.id)).label('documents'),
+                func.max(UserModel.updated_at).label('updated_at'),
+                func.count(UserModel.id).label('count'),
+            )
+            .where(UserModel.company_id == self._model.id)
+            .lateral()
+        )
+        document = json_object(
+            self._model,
+            CompanyDB,
+            users=func.coalesce(users.c.documents, literal_column("'[]'::json")),
+        )
+        # the document is returned as text so that it isn't decoded by the driver
+        return (
+            select(cast(document, Text), self._model.updated_at, users.c.updated_at, users.c.count)
+            .join(users, true())
+            .where(self._model.id == bindparam('p_id'))
+        )
+
+    async def get_companies_by_filter(self, filters: CompanyFilters) -> Page[dict[str, Any]]:
+        """Find a page of companies by filters ordered by ID.
+        With `like` the companies are searched by name and ordered by similarity (best first).
+        Rows are returned as dicts with `CompanyDB` fields (and the sort column), bypassing the ORM.
+        """
+        if filters.like:
+            filters = replace(filters, order='desc')
+            sort_by, sort_column = SEARCH_RANK_KEY, search_rank([self._model.company_name], filters.like)
+        else:
+            sort_by, sort_column = 'id', self._model.id
+
+        columns = [getattr(self._model, field) for field in CompanyDB.model_fields]
+        query = select(*columns, sort_column.label(sort_by)) if filters.like else select(*columns)
+        if filters.ids:
+            query = query.where(self._model.id.in_(filters.ids))
+        if filters.inn:
+            query = query.where(self._model.inn.in_(filters.inn))
+        if filters.like:
+            query = query.where(search_condition([self._model.company_name], filters.like))
+        return await self._get_page(query, filters, sort_by, sort_column)
+
+    async def get_existing_ids(self, ids: Collection[UUID4]) -> set[UUID4]:
+        """Find which of the given company IDs exist."""
+        if not ids:
+            return set()
+
+        query = select(self._model.id).where(self._model.id.in_(ids))
+        res: Result = await self._session.execute(query)
+        return set(res.scalars().all())
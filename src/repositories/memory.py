@@ -0,0 +1,132 @@
+from collections.abc import AsyncIterator, Collection, Sequence
+from dataclasses import replace
+from datetime import datetime
+from operator import itemgetter
+from typing import Any, ClassVar
+from uuid import UUID
+
+import orjson
+from pydantic import UUID4
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.models import CompanyModel, UserModel
+from src.schemas.company import CompanyDB, CompanyFilters
+from src.schemas.user import UserDB, UserFilters
+from src.utils.memory_repository import InMemoryRepository, load_instance
+from src.utils.pagination import Page
+from src.utils.search import SEARCH_RANK_KEY
+
+
+class InMemoryUserRepository(InMemoryRepository[UserModel]):
+    """In-memory counterpart of `UserRepository`."""
+
+    _model = UserModel
+
+    _search_columns: ClassVar[tuple[str, ...]] = ('first_name', 'last_name', 'middle_name')
+
+    async def get_users_by_filter(self, filters: UserFilters) -> Page[dict[str, Any]]:
+        """Find a page of users by filters, see `UserRepository.get_users_by_filter`."""
+        rows = self._select(filters)
+        if filters.like:
+            filters = replace(filters, order='desc')
+            rows, sort_by = self._search(rows, filters.like, self._search_columns), SEARCH_RANK_KEY
+        else:
+            sort_by = filters.sort_by
+        return self._get_page(rows, filters, sort_by, UserDB)
+
+    async def stream_users_by_filter(
+        self,
+        filters: UserFilters,
+        batch_size: int,
+    ) -> AsyncIterator[Sequence[dict[str, Any]]]:
+        """Find all users by filters in batches, see `UserRepository.stream_users_by_filter`."""
+        rows = self._select(filters)
+        if filters.like:
+            filters = replace(filters, order='desc')
+            rows, sort_by = self._search(rows, filters.like, self._search_columns), SEARCH_RANK_KEY
+        else:
+            sort_by = filters.sort_by
+        rows = sorted(rows, key=itemgetter(sort_by, 'id'), reverse=filters.order == 'desc')
+        for start in range(0, len(rows), batch_size):
+            yield [self._to_values(row, UserDB) for row in rows[start:start + batch_size]]
+
+    async def get_company_id(self, user_id: UUID) -> UUID | None:
+        """Company of the user, None if the user doesn't exist."""
+        row = self._table.rows.get(user_id)
+        return None if row is None else row['company_id']
+
+    def _select(self, filters: UserFilters) -> Collection[dict[str, Any]]:
+        criteria = {
+            column: values
+            for column, values in (
+                ('id', filters.ids),
+                ('first_name', filters.first_name),
+                ('last_name', filters.last_name),
+                ('middle_name', filters.middle_name),
+            )
+            if values
+        }
+        return self._table.where_in(criteria)
+
+
+class InMemoryCompanyRepository(InMemoryRepository[CompanyModel]):
+    """In-memory counterpart of `CompanyRepository`."""
+
+    _model = CompanyModel
+
+    async def get_company_with_users(self, company_id: UUID4) -> CompanyModel | None:
+        """Find company by ID with all users."""
+        row = self._table.rows.get(company_id)
+        if row is None:
+            return None
+        company = load_instance(self._model, row)
+        # set as loaded, assigning the collection would fire the backref events of every user
+        set_committed_value(company, 'users', [load_instance(UserModel, user) for user in self._get_users(company_id)])
+        return company
+
+    async def get_company_with_users_version(self, company_id: UUID4) -> tuple[datetime, datetime | None, int] | None:
+        """Version of the company with users, see `CompanyRepository.get_company_with_users_version`."""
+        row = self._table.rows.get(company_id)
+        if row is None:
+            return None
+        users = self._get_users(company_id)
+        return row['updated_at'], max((user['updated_at'] for user in users), default=None), len(users)
+
+    async def get_company_with_users_json(self, company_id: UUID4) -> str | None:
+        """Find company by ID with all users as a `CompanyWithUsers` JSON document."""
+        row = self._table.rows.get(company_id)
+        if row is None:
+            return None
+        document = self._to_values(row, CompanyDB)
+        document['users'] = [self._to_values(user, UserDB) for user in self._get_users(company_id)]
+        return orjson.dumps(document).decode()
+
+    async def get_company_with_users_json_and_version(
+        self,
+        company_id: UUID4,
+    ) -> tuple[str, datetime, datetime | None, int] | None:
+        """The document of `get_company_with_users_json` followed by the version of `get_company_with_users_version`."""
+        document = await self.get_company_with_users_json(company_id)
+        if document is None:
+            return None
+        return document, *await self.get_company_with_users_version(company_id)
+
+    async def get_companies_by_filter(self, filters: CompanyFilters) -> Page[dict[str, Any]]:
+        """Find a page of companies by filters, see `CompanyRepository.get_companies_by_filter`."""
+        criteria = {column: values for column, values in (('id', filters.ids), ('inn', filters.inn)) if values}
+        rows = self._table.where_in(criteria)
+        if filters.like:
+            filters = replace(filters, order='desc')
+            rows, sort_by = self._search(rows, filters.like, ('company_name',)), SEARCH_RANK_KEY
+        else:
+            sort_by = 'id'
+        return self._get_page(rows, filters, sort_by, CompanyDB)
+
+    async def get_existing_ids(self, ids: Collection[UUID4]) -> set[UUID4]:
+        """Find which of the given company IDs exist."""
+        return {company_id for company_id in ids if company_id in self._table.rows}
+
+    def _get_users(self, company_id: UUID4) -> list[dict[str, Any]]:
+        """Users of the company ordered by ID, found by the index of `company_id`."""
+        users = self._session.table(UserModel).where_in({'company_id': (company_id,)})
+        return sorted(users, key=itemgetter('id'))
@@ -1,19 +1,82 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import replace
+from typing import Any, ClassVar
+from uuid import UUID
 
-from sqlalchemy import Result, select
+from sqlalchemy import ColumnElement, RowMapping, Select, bindparam, select
+from sqlalchemy.orm import InstrumentedAttribute
 
 from src.models import UserModel
-from src.schemas.user import UserFilters
+from src.schemas.user import UserDB, UserFilters
+from src.utils.pagination import Page, keyset_order
 from src.utils.repository import SqlAlchemyRepository
+from src.utils.search import SEARCH_RANK_KEY, search_condition, search_rank
 
 
 class UserRepository(SqlAlchemyRepository[UserModel]):
     _model = UserModel
 
-    async def get_users_by_filter(self, filters: UserFilters) -> Sequence[UserModel]:
-        """Find all users by filters."""
-        query = select(self._model)
+    # every sortable column is backed by a composite `(column, id)` index
+    _sortable_columns: ClassVar[dict[str, InstrumentedAttribute]] = {
+        'id': UserModel.id,
+        'first_name': UserModel.first_name,
+        'last_name': UserModel.last_name,
+        'created_at': UserModel.created_at,
+    }
+    # every searched column is backed by a trigram index
+    _search_columns: ClassVar[tuple[InstrumentedAttribute, ...]] = (
+        UserModel.first_name,
+        UserModel.last_name,
+        UserModel.middle_name,
+    )
 
+    async def get_users_by_filter(self, filters: UserFilters) -> Page[dict[str, Any]]:
+        """Find a page of users by filters.
+        With `like` the users are searched by names and ordered by similarity (best first) instead of `sort_by`.
+        Rows are returned as dicts with `UserDB` fields (and the sort column), bypassing the ORM.
+        """
+        filters, sort_by, sort_column = self._get_sorting(filters)
+        query = self._apply_filters(select(*self._get_schema_columns(sort_column.label(sort_by))), filters)
+        return await self._get_page(query, filters, sort_by, sort_column)
+
+    async def stream_users_by_filter(
+        self,
+        filters: UserFilters,
+        batch_size: int,
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        """Find all users by filters, reading them from a server-side cursor in batches.
+        The users are ordered as by `get_users_by_filter`, by similarity with `like`.
+        Pagination parameters are ignored, rows are returned as plain mappings with `UserDB` fields.
+        """
+        filters, _, sort_column = self._get_sorting(filters)
+        query = self._apply_filters(select(*self._get_schema_columns()), filters)
+        query = keyset_order(query, filters.order, sort_column, self._model.id)
+
+        res = await self._session.stream(query.execution_options(yield_per=batch_size))
+        async for partition in res.mappings().partitions():
+            yield partition
+
+    async def get_company_id(self, user_id: UUID) -> UUID | None:
+        """Company of the user, None if the user doesn't exist."""
+        query = self._get_statement(
+            'get_company_id',
+            lambda: select(self._model.company_id).where(self._model.id == bindparam('p_id')),
+        )
+        return await self._session.scalar(query, {'p_id': user_id})
+
+    def _get_sorting(self, filters: UserFilters) -> tuple[UserFilters, str, InstrumentedAttribute | ColumnElement]:
+        """Filters with the order, the key and the column of sorting: with `like` the users are ordered
+        by similarity (best first) instead of `sort_by`.
+        """
+        if filters.like:
+            return replace(filters, order='desc'), SEARCH_RANK_KEY, search_rank(self._search_columns, filters.like)
+        return filters, filters.sort_by, self._sortable_columns[filters.sort_by]
+
+    def _get_schema_columns(self, *extra_columns: ColumnElement) -> list[ColumnElement]:
+        columns = [getattr(self._model, field) for field in UserDB.model_fields]
+        return columns + [column for column in extra_columns if column.key not in UserDB.model_fields]
+
+    def _apply_filters(self, query: Select, filters: UserFilters) -> Select:
         if filters.ids:
             query = query.where(self._model.id.in_(filters.ids))
 
@@ -26,5 +89,7 @@ class UserRepository(SqlAlchemyRepository[UserModel]):
         if filters.middle_name:
             query = query.where(self._model.middle_name.in_(filters.middle_name))
 
-        res: Result = await self._session.execute(query)
-        return res.scalars().all()
+        if filters.like:
+            query = query.where(search_condition(self._search_columns, filters.like))
+
+        return query
@@ -0,0 +1,57 @@
+from pydantic import BaseModel
+
+from src.schemas.response import BaseResponse
+
+
+class CacheStatsDB(BaseModel):
+    enabled: bool
+    size: int
+    maxsize: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    hit_ratio: float
+
+
+class CacheStatsResponse(BaseResponse):
+    payload: CacheStatsDB
+
+
+class ResponseCacheStatsDB(BaseModel):
+    route: str
+    enabled: bool
+    size: int
+    nbytes: int
+    maxbytes: int
+    ttl: float
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    hit_ratio: float
+
+
+class ResponseCacheStatsResponse(BaseResponse):
+    payload: list[ResponseCacheStatsDB]
+
+
+class PoolStatsDB(BaseModel):
+    engine: str
+    size: int
+    max_overflow: int
+    timeout: float
+    checked_out: int
+    checked_in: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    wait_time_sum: float
+    # cumulative number of checkouts by the upper bound of their wait time in seconds, the last is '+Inf'
+    wait_time_buckets: dict[str, int]
+
+
+class PoolStatsResponse(BaseResponse):
+    payload: list[PoolStatsDB]
@@ -1,5 +1,9 @@
+from dataclasses import dataclass
+
+from fastapi import Query
 from pydantic import UUID4, BaseModel, Field
 
+from src.schemas.filter import TypeFilter
 from src.schemas.response import BaseCreateResponse, BaseResponse
 from src.schemas.user import UserDB
 
@@ -35,3 +39,11 @@ class CompanyResponse(BaseResponse):
 
 class CompanyListResponse(BaseResponse):
     payload: list[CompanyDB]
+    next_cursor: str | None = None
+    total: int | None = None
+
+
+@dataclass
+class CompanyFilters(TypeFilter):
+    ids: list[UUID4] | None = Query(None)
+    inn: list[int] | None = Query(None)
@@ -1,20 +1,31 @@
 from dataclasses import dataclass
+from typing import Literal
 
 from fastapi import Query
 
+MAX_PER_PAGE = 100
+
+TotalMode = Literal['none', 'exact', 'estimate']
+
 
 @dataclass
 class BaseFilter:
     page: int | None = Query(default=None)
-    per_page: int = Query(ge=1, le=100, default=100)
+    per_page: int = Query(ge=1, le=MAX_PER_PAGE, default=MAX_PER_PAGE)
+    cursor: str | None = Query(default=None, description='Opaque `next_cursor` of the previous page.')
+    order: Literal['asc', 'desc'] = Query(default='asc')
+    total: TotalMode = Query(
+        default='none',
+        description='Include the total number of found rows: counted exactly or estimated by the planner.',
+    )
 
     @property
     def offset(self) -> int:
         return self.page * self.per_page if self.page else 0
 
     @property
-    def limit(self) -> int | None:
-        return self.per_page if self.page is not None else None
+    def limit(self) -> int:
+        return min(self.per_page, MAX_PER_PAGE)
 
 
 @dataclass
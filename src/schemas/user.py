@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Any, Literal
 
 from fastapi import Query
 from pydantic import UUID4, BaseModel, Field
@@ -34,8 +35,28 @@ class UserResponse(BaseResponse):
     payload: UserDB
 
 
+class BulkCreatedUser(UserID):
+    index: int
+
+
+class BulkCreateUserError(BaseModel):
+    index: int
+    errors: list[dict[str, Any]]
+
+
+class BulkCreateUsersResult(BaseModel):
+    created: list[BulkCreatedUser] = Field(default_factory=list)
+    errors: list[BulkCreateUserError] = Field(default_factory=list)
+
+
+class BulkCreateUsersResponse(BaseCreateResponse):
+    payload: BulkCreateUsersResult
+
+
 class UsersListResponse(BaseResponse):
     payload: list[UserDB]
+    next_cursor: str | None = None
+    total: int | None = None
 
 
 @dataclass
@@ -44,3 +65,4 @@ class UserFilters(TypeFilter):
     first_name: list[str] | None = Query(None)
     last_name: list[str] | None = Query(None)
     middle_name: list[str] | None = Query(None)
+    sort_by: Literal['id', 'first_name', 'last_name', 'created_at'] = Query('id')
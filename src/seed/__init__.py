@@ -0,0 +1 @@
+"""The package contains the generator of synthetic datasets for scale testing, see `python -m src.seed --help`."""
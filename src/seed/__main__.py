@@ -0,0 +1,52 @@
+"""The module contains the command line of the dataset generator.
+
+Loads the dataset into the database configured in `.env`, the same options give the same rows.
+Usage:
+    python -m src.seed --companies 10000 --users 1000000 [--skew 1.1] [--seed 0] [--truncate]
+"""
+
+import argparse
+import asyncio
+import sys
+from time import perf_counter
+
+from loguru import logger
+
+from src.database.db import async_engine, async_session_maker
+from src.seed.dataset import SeedOptions, seed
+
+
+async def run(options: SeedOptions, *, truncate: bool) -> None:
+    start = perf_counter()
+    try:
+        await seed(async_session_maker, options, truncate=truncate)
+    finally:
+        await async_engine.dispose()
+    logger.info(f'{options.companies} companies and {options.users} users loaded in {perf_counter() - start:.1f}s')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog='python -m src.seed')
+    parser.add_argument('--companies', type=int, required=True)
+    parser.add_argument('--users', type=int, required=True)
+    parser.add_argument('--skew', type=float, default=1.1, help='Zipf exponent of company sizes, 0 - uniform')
+    parser.add_argument('--seed', type=int, default=0, help='the same seed gives the same dataset')
+    parser.add_argument('--chunk-size', type=int, default=50_000, help='rows loaded with COPY per transaction')
+    parser.add_argument('--truncate', action='store_true', help='delete the existing users and companies first')
+
+    args = parser.parse_args()
+    if args.companies < 1 and args.users:
+        parser.error('users need at least one company')
+    options = SeedOptions(
+        companies=args.companies,
+        users=args.users,
+        skew=args.skew,
+        seed=args.seed,
+        chunk_size=args.chunk_size,
+    )
+    asyncio.run(run(options, truncate=args.truncate))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""The module contains the generation and the loading of the synthetic dataset.
+
+Users are spread over companies by the Zipf law: with the default skew a handful of companies get
+a large share of the users, while most companies are small.
+Names follow the same law over the vocabularies, so some values are frequent and most are rare.
+Every value, the IDs included, depends only on the options, the same options give the same dataset.
+"""
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from hashlib import blake2b
+from itertools import accumulate
+from random import Random
+from typing import Any
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.database.memory import InMemoryDatabase
+from src.models import CompanyModel, UserModel
+from src.repositories import CompanyRepository, UserRepository
+from src.seed.names import (
+    COMPANY_NAME_FORMS,
+    COMPANY_NAME_TRADES,
+    COMPANY_NAME_WORDS,
+    FIRST_NAMES,
+    LAST_NAME_ROOTS,
+    LAST_NAME_SUFFIXES,
+    PATRONYMIC_SUFFIXES,
+)
+
+# INNs of the companies are unique 9-digit numbers
+INN_RANGE = range(100_000_000, 1_000_000_000)
+# entries are created within this period, `updated_at` is up to `UPDATE_PERIOD` later
+CREATED_FROM = datetime(2021, 1, 1)  # noqa: DTZ001 - the columns store UTC without a time zone
+CREATED_PERIOD = timedelta(days=3 * 365)
+UPDATE_PERIOD = timedelta(days=90)
+
+LAST_NAMES = tuple(f'{root}{suffix}' for root in LAST_NAME_ROOTS for suffix in LAST_NAME_SUFFIXES)
+
+
+@dataclass(frozen=True, slots=True)
+class SeedOptions:
+    companies: int
+    users: int
+    # exponent of the Zipf law of company sizes and name frequencies, 0 - uniform
+    skew: float = 1.1
+    seed: int = 0
+    # rows generated and loaded (with binary COPY) at a time
+    chunk_size: int = 50_000
+    # share of users with a middle name
+    middle_name_share: float = 0.8
+    # share of inactive companies
+    inactive_share: float = 0.1
+
+
+def zipf_cum_weights(size: int, skew: float) -> list[float]:
+    """Cumulative weights of the ranks 1..size for `Random.choices`, the first rank is the most frequent."""
+    return list(accumulate(1 / rank ** skew for rank in range(1, size + 1)))
+
+
+def make_id(seed: int, kind: str, index: int) -> UUID:
+    """Deterministic random-looking UUID of the entry, users refer to companies by their index."""
+    digest = blake2b(f'{seed}:{kind}:{index}'.encode(), digest_size=16).digest()
+    return UUID(bytes=digest, version=4)
+
+
+def company_rows(options: SeedOptions) -> Iterator[list[dict[str, Any]]]:
+    """Companies in chunks of `chunk_size` rows, the first companies are the largest."""
+    rng = Random(f'{options.seed}:companies')  # noqa: S311 - not for security
+    inns = rng.sample(INN_RANGE, options.companies)
+    for start in range(0, options.companies, options.chunk_size):
+        rows = []
+        for index in range(start, min(start + options.chunk_size, options.companies)):
+            created_at = _random_created_at(rng)
+            rows.append({
+                'id': make_id(options.seed, 'company', index),
+                'inn': inns[index],
+                'company_name': (
+                    f'{rng.choice(COMPANY_NAME_WORDS)} {rng.choice(COMPANY_NAME_TRADES)} '
+                    f'{rng.choice(COMPANY_NAME_FORMS)}'
+                ),
+                'is_active': rng.random() >= options.inactive_share,
+                'created_at': created_at,
+                'updated_at': created_at + rng.random() * UPDATE_PERIOD,
+            })
+        yield rows
+
+
+def user_rows(options: SeedOptions) -> Iterator[list[dict[str, Any]]]:
+    """Users in chunks of `chunk_size` rows."""
+    rng = Random(f'{options.seed}:users')  # noqa: S311 - not for security
+    companies = range(options.companies)
+    company_weights = zipf_cum_weights(options.companies, options.skew)
+    first_name_weights = zipf_cum_weights(len(FIRST_NAMES), options.skew)
+    last_name_weights = zipf_cum_weights(len(LAST_NAMES), options.skew)
+
+    for start in range(0, options.users, options.chunk_size):
+        size = min(options.chunk_size, options.users - start)
+        company_indexes = rng.choices(companies, cum_weights=company_weights, k=size)
+        first_names = rng.choices(FIRST_NAMES, cum_weights=first_name_weights, k=size)
+        last_names = rng.choices(LAST_NAMES, cum_weights=last_name_weights, k=size)
+        fathers = rng.choices(FIRST_NAMES, cum_weights=first_name_weights, k=size)
+
+        rows = []
+        for offset in range(size):
+            created_at = _random_created_at(rng)
+            middle_name = None
+            if rng.random() < options.middle_name_share:
+                middle_name = f'{fathers[offset]}{rng.choice(PATRONYMIC_SUFFIXES)}'
+            rows.append({
+                'id': make_id(options.seed, 'user', start + offset),
+                'first_name': first_names[offset],
+                'last_name': last_names[offset],
+                'middle_name': middle_name,
+                'company_id': make_id(options.seed, 'company', company_indexes[offset]),
+                'created_at': created_at,
+                'updated_at': created_at + rng.random() * UPDATE_PERIOD,
+            })
+        yield rows
+
+
+async def seed(
+    session_maker: async_sessionmaker[AsyncSession],
+    options: SeedOptions,
+    *,
+    truncate: bool = False,
+) -> None:
+    """Loads the dataset committing every chunk and refreshes the planner statistics with ANALYZE.
+    With `truncate` the existing users and companies are deleted first,
+    otherwise loading the same dataset twice fails on the primary keys.
+    """
+    async with session_maker() as session, session.begin():
+        preparer = session.bind.dialect.identifier_preparer
+        tables = ', '.join(preparer.format_table(model.__table__) for model in (CompanyModel, UserModel))
+        if truncate:
+            await session.execute(text(f'TRUNCATE {tables}'))
+
+    for repository_class, chunks, total in (
+        (CompanyRepository, company_rows(options), options.companies),
+        (UserRepository, user_rows(options), options.users),
+    ):
+        loaded = 0
+        for rows in chunks:
+            async with session_maker() as session, session.begin():
+                await repository_class(session).bulk_add(rows, batch_size=len(rows))
+            loaded += len(rows)
+            logger.info(f'{repository_class.__name__}: {loaded}/{total} rows loaded')
+
+    async with session_maker() as session, session.begin():
+        await session.execute(text(f'ANALYZE {tables}'))
+
+
+def seed_memory(database: InMemoryDatabase, options: SeedOptions) -> None:
+    """Loads the dataset into the in-memory backend, the rows are complete and consistent, so they aren't checked."""
+    for model, chunks in ((CompanyModel, company_rows(options)), (UserModel, user_rows(options))):
+        table = database.tables[model.__tablename__]
+        for rows in chunks:
+            for row in rows:
+                table.insert(row)
+
+
+def _random_created_at(rng: Random) -> datetime:
+    return CREATED_FROM + rng.random() * CREATED_PERIOD
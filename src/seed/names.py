@@ -0,0 +1,32 @@
+"""The module contains the vocabularies of the synthetic dataset, the most frequent words first."""
+
+FIRST_NAMES = (
+    'Alexander', 'Sergey', 'Dmitry', 'Andrey', 'Alexey', 'Maxim', 'Ivan', 'Mikhail', 'Artem', 'Nikolay',
+    'Vladimir', 'Pavel', 'Roman', 'Denis', 'Evgeny', 'Igor', 'Anton', 'Oleg', 'Kirill', 'Ilya',
+    'Anna', 'Elena', 'Olga', 'Natalia', 'Ekaterina', 'Maria', 'Tatiana', 'Irina', 'Svetlana', 'Yulia',
+    'Anastasia', 'Daria', 'Marina', 'Victoria', 'Ksenia', 'Polina', 'Sofia', 'Alina', 'Vera', 'Liza',
+    'Timur', 'Ruslan', 'Stanislav', 'Konstantin', 'Vadim', 'Gleb', 'Yaroslav', 'Fedor', 'Egor', 'Leonid',
+)
+
+# last names are the roots combined with the suffixes
+LAST_NAME_ROOTS = (
+    'Ivan', 'Smirn', 'Kuznets', 'Pop', 'Vasil', 'Petr', 'Sokol', 'Mikhayl', 'Novik', 'Fedor',
+    'Moroz', 'Volk', 'Alexe', 'Lebed', 'Semen', 'Egor', 'Pavl', 'Kozl', 'Stepan', 'Nikolae',
+    'Orl', 'Andre', 'Makar', 'Nikit', 'Zakhar', 'Zaits', 'Solov', 'Borisov', 'Yakovl', 'Grigor',
+    'Roman', 'Vorob', 'Serge', 'Kuzmin', 'Frol', 'Alexandr', 'Dmitri', 'Korol', 'Gusev', 'Kisel',
+    'Ilyin', 'Maxim', 'Polyak', 'Sorokin', 'Vinogrado', 'Kovalev', 'Belov', 'Medvede', 'Antonov', 'Tarasov',
+)
+LAST_NAME_SUFFIXES = ('ov', 'ev', 'in', 'sky', 'enko')
+
+# patronymics are formed from the first names of the fathers
+PATRONYMIC_SUFFIXES = ('ovich', 'evich', 'ovna', 'evna')
+
+COMPANY_NAME_WORDS = (
+    'Global', 'Nord', 'Star', 'Alpha', 'Prime', 'Union', 'Vector', 'Delta', 'Sigma', 'Orion',
+    'Volga', 'Ural', 'Baikal', 'Neva', 'Altai', 'Arctic', 'Polar', 'Eastern', 'Western', 'Central',
+)
+COMPANY_NAME_TRADES = (
+    'Logistics', 'Systems', 'Trade', 'Energy', 'Consulting', 'Software', 'Retail', 'Foods', 'Telecom', 'Capital',
+    'Construction', 'Media', 'Pharma', 'Metals', 'Agro', 'Motors', 'Finance', 'Labs', 'Textile', 'Security',
+)
+COMPANY_NAME_FORMS = ('LLC', 'JSC', 'Group', 'Holding', 'Partners')
@@ -0,0 +1,111 @@
+"""The module contains in-process caches."""
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any
+
+from src.config import settings
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+
+class LRUCache:
+    """Bounded LRU cache with per-entry TTL.
+    It is not thread-safe and is meant to be used from the event loop only.
+
+    The cache holds entries of the total weight up to `maxsize`, the weight of an entry is 1 unless `_weigh`
+    is overridden. An entry heavier than `maxsize` is not stored.
+
+    Every invalidation bumps `generation`. A value read from the database is stored only if no invalidation
+    happened since the read started, otherwise a concurrent commit could be overwritten by stale data:
+        generation = cache.generation
+        value = await read_from_db()
+        cache.set(key, value, generation=generation)
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.generation = 0
+        self.weight = 0
+        self.stats = CacheStats()
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Any | None:
+        item = self._data.get(key)
+        if item is None:
+            self.stats.misses += 1
+            return None
+
+        expires_at, value = item
+        if expires_at < monotonic():
+            self._pop(key)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, generation: int | None = None) -> None:
+        if generation is not None and generation != self.generation:
+            return
+
+        self._pop(key)
+        weight = self._weigh(value)
+        if weight > self.maxsize:
+            return
+
+        self._data[key] = (monotonic() + self.ttl, value)
+        self.weight += weight
+        while self.weight > self.maxsize:
+            self._pop(next(iter(self._data)))
+            self.stats.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        self.generation += 1
+        if self._pop(key) is not None:
+            self.stats.invalidations += 1
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        self.generation += 1
+        for key in [key for key in self._data if predicate(key)]:
+            self._pop(key)
+            self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._data.clear()
+        self.weight = 0
+
+    def _pop(self, key: Hashable) -> Any | None:
+        item = self._data.pop(key, None)
+        if item is None:
+            return None
+        self.weight -= self._weigh(item[1])
+        return item[1]
+
+    @staticmethod
+    def _weigh(_value: Any) -> int:
+        return 1
+
+
+repository_cache = LRUCache(maxsize=settings.REPOSITORY_CACHE_MAXSIZE, ttl=settings.REPOSITORY_CACHE_TTL)
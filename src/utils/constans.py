@@ -2,3 +2,6 @@
 
 COMPANY_NOT_FOUND_MSG = 'Company Not Found'
 USER_NOT_FOUND_MSG = 'User not found'
+INVALID_CURSOR_MSG = 'Invalid pagination cursor'
+STREAM_BATCH_SIZE = 1000
+BULK_CREATE_USERS_MAX = 10000
@@ -0,0 +1,61 @@
+"""The module contains total counts of paginated listings."""
+
+import asyncio
+from collections.abc import Awaitable
+from typing import TypeVar
+
+from sqlalchemy import Select, func, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.database.routing import get_session_maker
+from src.schemas.filter import TotalMode
+from src.utils.explain import explain
+from src.utils.pagination import Page
+
+T = TypeVar('T')
+
+_RELTUPLES = text('SELECT reltuples FROM pg_class WHERE oid = to_regclass(:name)')
+
+
+async def count_exact(query: Select) -> int | None:
+    """`COUNT(*)` of the rows of the query on a separate connection, so it can run concurrently with the page.
+    Returns None if counting takes longer than `COUNT_EXACT_TIMEOUT`, the query is cancelled on the server then.
+    """
+    count_query = query.with_only_columns(func.count(), maintain_column_froms=True).order_by(None)
+    async with get_session_maker(read_only=True)() as session:
+        try:
+            async with asyncio.timeout(settings.COUNT_EXACT_TIMEOUT):
+                return await session.scalar(count_query)
+        except TimeoutError:
+            return None
+
+
+async def estimate_count(session: AsyncSession, query: Select) -> int:
+    """Estimated number of the rows of the query.
+    A query without filters is estimated by `pg_class.reltuples` of its table (kept up to date by VACUUM and ANALYZE),
+    a filtered one by the row estimate of the planner.
+    """
+    froms = query.get_final_froms()
+    if query.whereclause is None and len(froms) == 1:
+        name = session.get_bind().dialect.identifier_preparer.format_table(froms[0])
+        reltuples = await session.scalar(_RELTUPLES, {'name': name})
+        if reltuples is not None and reltuples >= 0:  # -1 until the table is vacuumed or analyzed
+            return int(reltuples)
+
+    plan = await explain(session, query)
+    return plan['Plan Rows']
+
+
+async def with_total(page: Awaitable[Page[T]], session: AsyncSession, query: Select, total: TotalMode) -> Page[T]:
+    """Awaits the page and sets its `total`, the number of the rows of the filtered (not paginated) query.
+    The exact count runs concurrently with the page.
+    """
+    if total == 'exact':
+        result, count = await asyncio.gather(page, count_exact(query))
+    else:
+        result = await page
+        count = await estimate_count(session, query) if total == 'estimate' else None
+
+    result.total = count
+    return result
@@ -0,0 +1,80 @@
+"""The module contains batching of concurrent lookups by key."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(slots=True)
+class LoaderStats:
+    loads: int = 0
+    batches: int = 0
+    errors: int = 0
+
+    @property
+    def keys_per_batch(self) -> float:
+        return self.loads / self.batches if self.batches else 0.0
+
+
+class BatchLoader:
+    """Collects the keys requested by concurrent callers and loads them with one call of `load_many`.
+    It is not thread-safe and is meant to be used from the event loop only.
+
+    A batch is dispatched `window` seconds after its first key or as soon as it has `max_batch_size` keys.
+    Callers requesting the same key in one batch share the result. `load_many` returns the found values
+    by key, a missing key is resolved with None.
+    """
+
+    def __init__(
+        self,
+        load_many: Callable[[Sequence[Hashable]], Awaitable[Mapping[Hashable, Any]]],
+        *,
+        window: float,
+        max_batch_size: int,
+    ) -> None:
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.stats = LoaderStats()
+        self._load_many = load_many
+        self._pending: dict[Hashable, asyncio.Future] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, key: Hashable) -> Any | None:
+        self.stats.loads += 1
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._pending[key] = loop.create_future()
+            if len(self._pending) >= self.max_batch_size:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.window, self._dispatch)
+        # a cancelled caller must not cancel the result shared with the other callers
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, {}
+        task = asyncio.create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: dict[Hashable, asyncio.Future]) -> None:
+        self.stats.batches += 1
+        try:
+            values = await self._load_many(list(batch))
+        except Exception as exc:
+            self.stats.errors += 1
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(values.get(key))
@@ -0,0 +1,30 @@
+"""The module contains conditional GET (ETag / If-None-Match) helpers."""
+
+from hashlib import blake2b
+from typing import Any
+
+from starlette.responses import Response
+from starlette.status import HTTP_304_NOT_MODIFIED
+
+
+def make_etag(*version: Any) -> str:
+    """Weak ETag of the resource version, e.g. its ID and `updated_at`."""
+    digest = blake2b('|'.join(map(str, version)).encode(), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of the `If-None-Match` header (`*` or a list of ETags) with the ETag, see RFC 9110 13.1.2."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    opaque_tag = etag.removeprefix('W/')
+    return any(tag.strip().removeprefix('W/') == opaque_tag for tag in if_none_match.split(','))
+
+
+def not_modified(if_none_match: str | None, etag: str) -> Response | None:
+    """Returns the 304 response if the client has the current version of the resource."""
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+    return None
@@ -0,0 +1,32 @@
+"""The module contains the EXPLAIN construct of SQLAlchemy statements."""
+
+from typing import Any
+
+import orjson
+from sqlalchemy import ClauseElement, Executable
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+
+
+class Explain(Executable, ClauseElement):
+    """`EXPLAIN (FORMAT JSON)` of the statement, the statement is compiled with its bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Executable) -> None:
+        self.statement = statement
+
+
+@compiles(Explain, 'postgresql')
+def _compile_explain(element: Explain, compiler: SQLCompiler, **kwargs: Any) -> str:
+    return f'EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kwargs)}'
+
+
+async def explain(session: AsyncSession, statement: Executable) -> dict[str, Any]:
+    """Returns the root node of the plan of the statement."""
+    plan = await session.scalar(Explain(statement))
+    # the JSON may come decoded or as text depending on the type codecs of the connection
+    if isinstance(plan, str | bytes):
+        plan = orjson.loads(plan)
+    return plan[0]['Plan']
@@ -0,0 +1,147 @@
+"""The module contains the base repository of the in-memory backend."""
+
+from collections.abc import Collection, Hashable, Sequence
+from datetime import datetime
+from operator import itemgetter
+from typing import Any, Generic, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel as PydanticModel
+from sqlalchemy.exc import MultipleResultsFound
+from sqlalchemy.orm import class_mapper
+
+from src.database.memory import InMemorySession
+from src.models import BaseModel
+from src.schemas.filter import BaseFilter
+from src.utils.pagination import Page, paginate_rows
+from src.utils.repository import AbstractRepository
+from src.utils.search import SEARCH_RANK_KEY, match_rank
+
+M = TypeVar('M', bound=BaseModel)
+
+
+def load_instance(model: type[M], row: dict[str, Any]) -> M:
+    """Transient instance of the model filled as by loading from the database:
+    the values are set without the attribute events of the constructor, which cost more than the rest of a lookup.
+    """
+    # `class_mapper` configures the mappers on the first use, as loading does
+    obj = class_mapper(model).class_manager.new_instance()
+    obj.__dict__.update(row)
+    return obj
+
+
+class InMemoryRepository(AbstractRepository, Generic[M]):
+    """Repository keeping the rows in an `InMemoryDatabase` with the interface of `SqlAlchemyRepository`.
+    Every call returns new transient instances of the model built from the column values,
+    so nothing is shared between transactions. Equality filters use the indexes of the table.
+    """
+
+    _model: type[M]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._time_methods()
+
+    def __init__(self, session: InMemorySession) -> None:
+        self._session = session
+        self._table = session.table(self._model)
+
+    @property
+    def model(self) -> type[M]:
+        return self._model
+
+    async def add_one(self, **kwargs: Any) -> None:
+        self._session.insert(self._table, kwargs)
+
+    async def add_one_and_get_id(self, **kwargs: Any) -> int | str | UUID:
+        return self._session.insert(self._table, kwargs)['id']
+
+    async def add_one_and_get_obj(self, **kwargs: Any) -> M:
+        return load_instance(self._model, self._session.insert(self._table, kwargs))
+
+    async def bulk_add(
+        self,
+        values: Sequence[dict[str, Any]],
+        *,
+        batch_size: int | None = None,  # noqa: ARG002 - the interface of `SqlAlchemyRepository.bulk_add`
+    ) -> None:
+        """Inserts the rows one by one."""
+        for row in values:
+            self._session.insert(self._table, row)
+
+    async def get_by_filter_one_or_none(self, **kwargs: Any) -> M | None:
+        rows = self._find(kwargs)
+        if len(rows) > 1:
+            err_msg = 'Multiple rows were found when one or none was required'
+            raise MultipleResultsFound(err_msg)
+        return load_instance(self._model, next(iter(rows))) if rows else None
+
+    async def get_by_filter_all(self, **kwargs: Any) -> Sequence[M]:
+        return [load_instance(self._model, row) for row in self._find(kwargs)]
+
+    async def get_updated_at(self, obj_id: int | str | UUID) -> datetime | None:
+        """Version of the entry for conditional requests, None if the entry doesn't exist."""
+        row = self._table.rows.get(obj_id)
+        return None if row is None else row['updated_at']
+
+    async def get_values_by_ids(self, ids: Sequence[int | str | UUID]) -> dict[Hashable, dict[str, Any]]:
+        """Column values of the entries with the given IDs by ID, missing IDs are skipped."""
+        return {row['id']: dict(row) for row in self._table.where_in({'id': ids})}
+
+    async def update_one_by_id(self, obj_id: int | str | UUID, **kwargs: Any) -> M | None:
+        row = self._session.update(self._table, obj_id, kwargs)
+        return None if row is None else load_instance(self._model, row)
+
+    async def delete_by_filter(self, **kwargs: Any) -> None:
+        for row in list(self._find(kwargs)):
+            self._session.delete(self._table, row['id'])
+
+    async def delete_by_ids(self, *args: int | str | UUID) -> None:
+        for obj_id in args:
+            self._session.delete(self._table, obj_id)
+
+    async def delete_all(self) -> None:
+        for obj_id in list(self._table.rows):
+            self._session.delete(self._table, obj_id)
+
+    def _find(self, kwargs: dict[str, Any]) -> Collection[dict[str, Any]]:
+        """Rows equal to the filter, None stands for `IS NULL` as in `SqlAlchemyRepository`."""
+        return self._table.where_in({key: (value,) for key, value in kwargs.items()})
+
+    @staticmethod
+    def _search(rows: Collection[dict[str, Any]], like: str, columns: Sequence[str]) -> list[dict[str, Any]]:
+        """Rows where any of the columns contains the text or is similar to it,
+        with the similarity of the best matching column under `SEARCH_RANK_KEY`.
+        """
+        rank = match_rank(like)
+        return [
+            row | {SEARCH_RANK_KEY: value}
+            for row in rows
+            if (value := rank(row[column] for column in columns)) is not None
+        ]
+
+    def _get_page(
+        self,
+        rows: Collection[dict[str, Any]],
+        filters: BaseFilter,
+        sort_by: str,
+        schema: type[PydanticModel],
+    ) -> Page[dict[str, Any]]:
+        """In-memory counterpart of `SqlAlchemyRepository._get_page`: rows with the fields of the schema
+        and the sort column. Strings are ordered by code points rather than by the collation of the database.
+        The total is counted exactly for both `exact` and `estimate`.
+        """
+        columns = self._model.__table__.columns
+        value_type = float if sort_by == SEARCH_RANK_KEY else columns[sort_by].type.python_type
+        id_type = columns['id'].type.python_type
+        page = paginate_rows(rows, filters, sort_by, itemgetter(sort_by, 'id'), value_type, id_type)
+        page.items = [self._to_values(row, schema, sort_by) for row in page.items]
+        if filters.total != 'none':
+            page.total = len(rows)
+        return page
+
+    @staticmethod
+    def _to_values(row: dict[str, Any], schema: type[PydanticModel], *extra_columns: str) -> dict[str, Any]:
+        values = {field: row[field] for field in schema.model_fields}
+        values.update((column, row[column]) for column in extra_columns if column not in values)
+        return values
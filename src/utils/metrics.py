@@ -0,0 +1,196 @@
+"""The module contains in-process metrics rendered in the Prometheus text format."""
+
+import functools
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from math import isinf
+from time import perf_counter
+from typing import Any, ClassVar, Generic, TypeVar
+
+C = TypeVar('C', bound='Counter | Histogram')
+F = TypeVar('F', bound=Callable[..., Awaitable[Any]])
+
+# upper bounds of the latency buckets in seconds
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class Counter:
+    __slots__ = ('value',)
+
+    def __init__(self) -> None:
+        self.value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        self.value += amount
+
+
+class Histogram:
+    """Distribution of observed values over fixed buckets in the Prometheus layout:
+    a bucket counts the values less than or equal to its upper bound, the last bucket is `+Inf`.
+    It is not thread-safe and is meant to be used from the event loop only.
+    """
+
+    __slots__ = ('bounds', 'count', 'counts', 'sum')
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds = tuple(sorted(bounds))
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """Upper bounds with the number of values less than or equal to them."""
+        total, buckets = 0, []
+        for bound, count in zip((*self.bounds, float('inf')), self.counts, strict=True):
+            total += count
+            buckets.append((bound, total))
+        return buckets
+
+
+class MetricFamily(Generic[C]):
+    """Metrics of one name split by label values.
+
+    A child is created on the first use of its label values, so bind it once where possible:
+        duration = family.labels('UserService.get_user_by_id')
+    """
+
+    type: ClassVar[str]
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._children: dict[tuple[Any, ...], C] = {}
+
+    def labels(self, *values: Any) -> C:
+        child = self._children.get(values)
+        if child is None:
+            child = self._children[values] = self._create_child()
+        return child
+
+    def render(self) -> Iterator[str]:
+        yield f'# HELP {self.name} {self.documentation}'
+        yield f'# TYPE {self.name} {self.type}'
+        for values, child in self._children.items():
+            yield from self._render_child(dict(zip(self.label_names, values, strict=True)), child)
+
+    def _create_child(self) -> C:
+        raise NotImplementedError
+
+    def _render_child(self, labels: dict[str, Any], child: C) -> Iterator[str]:
+        raise NotImplementedError
+
+
+class CounterFamily(MetricFamily[Counter]):
+    type = 'counter'
+
+    @staticmethod
+    def _create_child() -> Counter:
+        return Counter()
+
+    def _render_child(self, labels: dict[str, Any], child: Counter) -> Iterator[str]:
+        yield f'{self.name}{format_labels(labels)} {child.value}'
+
+
+class HistogramFamily(MetricFamily[Histogram]):
+    type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str], bounds: Sequence[float]) -> None:
+        super().__init__(name, documentation, label_names)
+        self.bounds = bounds
+
+    def _create_child(self) -> Histogram:
+        return Histogram(self.bounds)
+
+    def _render_child(self, labels: dict[str, Any], child: Histogram) -> Iterator[str]:
+        for bound, count in child.cumulative():
+            yield f'{self.name}_bucket{format_labels(labels | {"le": format_bound(bound)})} {count}'
+        yield f'{self.name}_sum{format_labels(labels)} {child.sum!r}'
+        yield f'{self.name}_count{format_labels(labels)} {child.count}'
+
+
+class Registry:
+    """Metric families exposed together at `/metrics`."""
+
+    def __init__(self) -> None:
+        self.families: list[MetricFamily] = []
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str]) -> CounterFamily:
+        family = CounterFamily(name, documentation, label_names)
+        self.families.append(family)
+        return family
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str],
+        bounds: Sequence[float] = LATENCY_BUCKETS,
+    ) -> HistogramFamily:
+        family = HistogramFamily(name, documentation, label_names, bounds)
+        self.families.append(family)
+        return family
+
+    def render(self) -> str:
+        return ''.join(f'{line}\n' for family in self.families for line in family.render())
+
+
+def format_bound(bound: float) -> str:
+    """Upper bound of a bucket as the `le` label of Prometheus."""
+    return '+Inf' if isinf(bound) else repr(float(bound))
+
+
+def format_labels(labels: dict[str, Any]) -> str:
+    if not labels:
+        return ''
+    pairs = ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+    return f'{{{pairs}}}'
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def timed(histogram: Histogram) -> Callable[[F], F]:
+    """Observes the duration of every call of the coroutine function, failed calls included."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                histogram.observe(perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+registry = Registry()
+request_duration = registry.histogram(
+    'http_request_duration_seconds',
+    'Latency of HTTP requests by route template.',
+    ('method', 'route', 'status'),
+)
+service_duration = registry.histogram(
+    'service_method_duration_seconds',
+    'Duration of service methods wrapped in `transaction_mode`.',
+    ('method',),
+)
+repository_duration = registry.histogram(
+    'repository_method_duration_seconds',
+    'Duration of the public coroutine methods of repositories, i.e. of their queries.',
+    ('repository', 'method'),
+)
+transactions = registry.counter(
+    'db_transactions_total',
+    'Transactions ended by the UnitOfWork: commit, rollback or read_only (closed without a commit).',
+    ('outcome',),
+)
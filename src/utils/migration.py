@@ -0,0 +1,44 @@
+"""The module contains helpers for Alembic migrations."""
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+def create_indexes_concurrently(table_name: str, indexes: Mapping[str, Sequence[str]], **kwargs: Any) -> None:
+    """Creates the indexes (name -> columns) without blocking writes to the table.
+    `kwargs` are passed to `op.create_index`, e.g. `postgresql_using`.
+    CONCURRENTLY can't run inside a transaction block, so the indexes are created in an autocommit block.
+    A failed concurrent build leaves an INVALID index behind: it is dropped and built again,
+    valid indexes are kept, so the migration can be rerun after a failure.
+    """
+    with op.get_context().autocommit_block():
+        for name, columns in indexes.items():
+            if _is_invalid_index(name):
+                op.drop_index(name, table_name=table_name, postgresql_concurrently=True, if_exists=True)
+            op.create_index(
+                name,
+                table_name,
+                list(columns),
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+                **kwargs,
+            )
+
+
+def drop_indexes_concurrently(table_name: str, names: Sequence[str]) -> None:
+    """Drops the indexes without blocking reads and writes of the table."""
+    with op.get_context().autocommit_block():
+        for name in names:
+            op.drop_index(name, table_name=table_name, postgresql_concurrently=True, if_exists=True)
+
+
+def _is_invalid_index(name: str) -> bool:
+    if op.get_context().as_sql:  # offline mode has no connection to check
+        return False
+    query = sa.text('SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)')
+    return bool(op.get_bind().execute(query, {'name': name}).scalar())
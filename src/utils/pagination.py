@@ -0,0 +1,155 @@
+"""The module contains helpers for keyset (cursor) pagination."""
+
+import heapq
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Generic, TypeVar
+
+import orjson
+from sqlalchemy import ColumnElement, Select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.schemas.filter import BaseFilter
+
+T = TypeVar('T')
+
+
+class InvalidCursorError(ValueError):
+    """The cursor can't be decoded or was issued for another ordering."""
+
+
+@dataclass(frozen=True, slots=True)
+class Cursor:
+    sort_by: str
+    order: str
+    value: Any
+    id: Any
+
+
+@dataclass(slots=True)
+class Page(Generic[T]):
+    items: Sequence[T]
+    next_cursor: str | None = None
+    total: int | None = None
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    """Packs the cursor into an opaque url-safe token."""
+    # asyncpg returns its own UUID subclass which orjson doesn't serialize natively
+    raw = orjson.dumps([cursor.sort_by, cursor.order, cursor.value, cursor.id], default=str)
+    return urlsafe_b64encode(raw).rstrip(b'=').decode()
+
+
+def decode_cursor(token: str) -> Cursor:
+    """Unpacks the token created by `encode_cursor`."""
+    try:
+        raw = urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        sort_by, order, value, obj_id = orjson.loads(raw)
+    except (ValueError, TypeError):
+        raise InvalidCursorError(token)
+    return Cursor(sort_by=sort_by, order=order, value=value, id=obj_id)
+
+
+def _coerce(value: Any, python_type: type) -> Any:
+    """Restores the type of the value lost during JSON encoding."""
+    if value is None or isinstance(value, python_type):
+        return value
+    try:
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        return python_type(value)
+    except (ValueError, TypeError):
+        raise InvalidCursorError(value)
+
+
+def keyset_order(
+    query: Select,
+    order: str,
+    sort_column: InstrumentedAttribute | ColumnElement,
+    id_column: InstrumentedAttribute,
+) -> Select:
+    """Orders the query by `(sort_column, id)` so that the order is stable and served by an index."""
+    columns = (id_column,) if sort_column is id_column else (sort_column, id_column)
+    return query.order_by(*(column.desc() if order == 'desc' else column.asc() for column in columns))
+
+
+def paginate(
+    query: Select,
+    filters: BaseFilter,
+    sort_by: str,
+    sort_column: InstrumentedAttribute | ColumnElement,
+    id_column: InstrumentedAttribute,
+) -> Select:
+    """Applies ordering, the keyset condition and the page limit to the query.
+    One extra row is requested to find out whether the next page exists.
+    """
+    is_desc = filters.order == 'desc'
+    by_id = sort_column is id_column
+    query = keyset_order(query, filters.order, sort_column, id_column)
+
+    if filters.cursor:
+        cursor = decode_cursor(filters.cursor)
+        if (cursor.sort_by, cursor.order) != (sort_by, filters.order):
+            raise InvalidCursorError(filters.cursor)
+
+        obj_id = _coerce(cursor.id, id_column.type.python_type)
+        if by_id:
+            condition = id_column < obj_id if is_desc else id_column > obj_id
+        else:
+            value = _coerce(cursor.value, sort_column.type.python_type)
+            keyset = tuple_(sort_column, id_column)
+            condition = keyset < (value, obj_id) if is_desc else keyset > (value, obj_id)
+        query = query.where(condition)
+    elif filters.offset:
+        query = query.offset(filters.offset)
+
+    return query.limit(filters.limit + 1)
+
+
+def build_page(
+    rows: Sequence[T],
+    filters: BaseFilter,
+    sort_by: str,
+    get_keyset: Callable[[T], tuple[Any, Any]],
+) -> Page[T]:
+    """Cuts the extra row requested by `paginate` and creates the cursor of the next page."""
+    if len(rows) <= filters.limit:
+        return Page(items=rows)
+
+    items = rows[:filters.limit]
+    value, obj_id = get_keyset(items[-1])
+    next_cursor = encode_cursor(Cursor(sort_by=sort_by, order=filters.order, value=value, id=obj_id))
+    return Page(items=items, next_cursor=next_cursor)
+
+
+def paginate_rows(
+    rows: Iterable[T],
+    filters: BaseFilter,
+    sort_by: str,
+    get_keyset: Callable[[T], tuple[Any, Any]],
+    value_type: type,
+    id_type: type,
+) -> Page[T]:
+    """In-memory counterpart of `paginate` and `build_page` for rows held by the process.
+    The rows are scanned once, only the rows of the page are sorted;
+    `value_type` and `id_type` are the types of the sort value and of the ID, the cursor values are restored to them.
+    """
+    if filters.cursor:
+        cursor = decode_cursor(filters.cursor)
+        if (cursor.sort_by, cursor.order) != (sort_by, filters.order):
+            raise InvalidCursorError(filters.cursor)
+
+        keyset = (_coerce(cursor.value, value_type), _coerce(cursor.id, id_type))
+        if filters.order == 'desc':
+            rows = (row for row in rows if get_keyset(row) < keyset)
+        else:
+            rows = (row for row in rows if get_keyset(row) > keyset)
+        offset = 0
+    else:
+        offset = filters.offset
+
+    select = heapq.nlargest if filters.order == 'desc' else heapq.nsmallest
+    page_rows = select(offset + filters.limit + 1, rows, key=get_keyset)[offset:]
+    return build_page(page_rows, filters, sort_by, get_keyset)
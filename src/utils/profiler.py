@@ -0,0 +1,175 @@
+"""The module contains the sampling profiler of single requests."""
+
+import sys
+import threading
+from collections import Counter, defaultdict
+from collections.abc import Coroutine, Iterator
+from dataclasses import dataclass
+from time import perf_counter
+from types import CodeType, FrameType
+from typing import Any
+
+import orjson
+
+SPEEDSCOPE_SCHEMA = 'https://www.speedscope.app/file-format-schema.json'
+# layers by the module prefixes of their frames, the first match wins, so nested packages go first
+LAYER_MODULES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ('serialization', (
+        'pydantic', 'pydantic_core', 'orjson', 'fastapi.encoders', 'fastapi.responses', 'src.schemas',
+        'src.utils.responses',
+    )),
+    ('database', ('sqlalchemy', 'asyncpg', 'src.database')),
+    ('repository', ('src.repositories', 'src.utils.repository', 'src.utils.memory_repository')),
+    ('service', ('src.api.v1.services', 'src.utils.service', 'src.utils.unit_of_work')),
+    ('router', ('src.api',)),
+)
+# layer of the samples without frames of the layers above, e.g. of the middlewares
+OTHER_LAYER = 'framework'
+# pairs of the frame and the awaited object attributes of coroutines, async generators and generators
+_AWAITABLE_ATTRIBUTES = (('cr_frame', 'cr_await'), ('ag_frame', 'ag_await'), ('gi_frame', 'gi_yieldfrom'))
+
+
+@dataclass(frozen=True, slots=True)
+class Frame:
+    name: str
+    file: str
+    line: int
+    layer: str | None
+
+
+# the last frame of a sample taken while the coroutine is suspended, e.g. waiting for the database
+AWAIT_FRAME = Frame('<await>', '', 0, None)
+
+
+def layer_of(module: str) -> str | None:
+    """Layer of the module, see `LAYER_MODULES`."""
+    for layer, prefixes in LAYER_MODULES:
+        if any(module == prefix or module.startswith(f'{prefix}.') for prefix in prefixes):
+            return layer
+    return None
+
+
+class SamplingProfiler:
+    """Statistical profiler of one coroutine, e.g. the handling of a request.
+
+    A background thread takes the stack of the thread running the coroutine every `interval` seconds.
+    While the coroutine runs, the stack is taken up to the coroutine, so other tasks of the event loop are skipped;
+    while it's suspended, the chain of the awaited coroutines is taken with `AWAIT_FRAME` on top,
+    so the wall time is profiled, waits for I/O included. A sample is weighted by the time since the previous one,
+    since the thread gets the GIL only at the switch interval of the running thread.
+    Tasks the coroutine waits for (e.g. of `asyncio.wait_for` or of a thread pool) are not followed.
+    """
+
+    def __init__(self, interval: float = 0.001) -> None:
+        self.interval = interval
+        # stacks from the outermost frame with their weights in seconds, in the order of sampling
+        self.samples: list[tuple[tuple[Frame, ...], float]] = []
+        self.duration = 0.0
+        self._frames: dict[CodeType, Frame] = {}
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._coro: Coroutine[Any, Any, Any] | None = None
+        self._thread_id = 0
+        self._start = 0.0
+
+    def start(self, coro: Coroutine[Any, Any, Any]) -> None:
+        """Starts sampling the coroutine, it's called from the thread that will run the coroutine."""
+        self._coro = coro
+        self._thread_id = threading.get_ident()
+        self._start = perf_counter()
+        self._thread = threading.Thread(target=self._run, name='request-profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration = perf_counter() - self._start
+
+    def layers(self) -> dict[str, float]:
+        """Sampled seconds by the layer of the innermost frame that belongs to one, see `LAYER_MODULES`."""
+        totals: defaultdict[str, float] = defaultdict(float)
+        for stack, weight in self.samples:
+            totals[next((frame.layer for frame in reversed(stack) if frame.layer), OTHER_LAYER)] += weight
+        return dict(totals)
+
+    def to_collapsed(self) -> str:
+        """Stacks in the collapsed format of flamegraph.pl, weighted in microseconds."""
+        totals: Counter[tuple[Frame, ...]] = Counter()
+        for stack, weight in self.samples:
+            totals[stack] += weight
+        return ''.join(
+            f'{";".join(frame.name for frame in stack)} {round(weight * 1_000_000)}\n'
+            for stack, weight in totals.items()
+        )
+
+    def to_speedscope(self, name: str) -> bytes:
+        """Samples as a sampled profile of the speedscope file format."""
+        indexes: dict[Frame, int] = {}
+        samples = [[indexes.setdefault(frame, len(indexes)) for frame in stack] for stack, _ in self.samples]
+        frames = [
+            {'name': frame.name, 'file': frame.file, 'line': frame.line} if frame.file else {'name': frame.name}
+            for frame in indexes
+        ]
+        return orjson.dumps({
+            '$schema': SPEEDSCOPE_SCHEMA,
+            'name': name,
+            'activeProfileIndex': 0,
+            'shared': {'frames': frames},
+            'profiles': [{
+                'type': 'sampled',
+                'name': name,
+                'unit': 'seconds',
+                'startValue': 0,
+                'endValue': sum(weight for _, weight in self.samples),
+                'samples': samples,
+                'weights': [weight for _, weight in self.samples],
+            }],
+        })
+
+    def _run(self) -> None:
+        last = perf_counter()
+        while not self._stopped.wait(self.interval):
+            stack = self._sample()
+            now = perf_counter()
+            # nothing is sampled before the coroutine starts and after it finishes
+            if stack:
+                self.samples.append((stack, now - last))
+            last = now
+
+    def _sample(self) -> tuple[Frame, ...]:
+        root = getattr(self._coro, 'cr_frame', None)
+        if root is None:
+            return ()
+
+        frames = []
+        # the only way to get the stack of another thread
+        frame = sys._current_frames().get(self._thread_id)  # noqa: SLF001
+        while frame is not None and frame is not root:
+            frames.append(frame)
+            frame = frame.f_back
+        if frame is root:
+            frames.append(root)
+            return tuple(self._frame(frame) for frame in reversed(frames))
+        return (*(self._frame(frame) for frame in _awaited_frames(self._coro)), AWAIT_FRAME)
+
+    def _frame(self, frame: FrameType) -> Frame:
+        """Frame of the function, so samples at different lines of a function are merged."""
+        code = frame.f_code
+        if (cached := self._frames.get(code)) is None:
+            module = frame.f_globals.get('__name__', '')
+            cached = Frame(f'{module}:{code.co_qualname}', code.co_filename, code.co_firstlineno, layer_of(module))
+            self._frames[code] = cached
+        return cached
+
+
+def _awaited_frames(awaitable: Any) -> Iterator[FrameType]:
+    """Frames of the suspended coroutine and of the coroutines and generators it awaits, down to a future."""
+    while awaitable is not None:
+        for frame_attribute, await_attribute in _AWAITABLE_ATTRIBUTES:
+            if (frame := getattr(awaitable, frame_attribute, None)) is not None:
+                yield frame
+                awaitable = getattr(awaitable, await_attribute)
+                break
+        else:
+            return
@@ -1,18 +1,56 @@
 """The module contains base classes for working with databases."""
 
+import inspect
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
-from typing import TYPE_CHECKING, Any, Generic, Never, TypeVar
+from collections.abc import Callable, Hashable, Sequence
+from datetime import datetime
+from functools import partial
+from itertools import chain
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, Never, TypeVar
 from uuid import UUID
 
-from sqlalchemy import delete, insert, select, update
+from pydantic import BaseModel as PydanticModel
+from sqlalchemy import (
+    ARRAY,
+    Column,
+    ColumnElement,
+    Executable,
+    Select,
+    any_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
+from src.config import settings
+from src.database.query_log import traced
+from src.database.routing import get_session_maker
 from src.models import BaseModel
+from src.schemas.filter import BaseFilter
+from src.utils.cache import LRUCache
+from src.utils.counting import with_total
+from src.utils.dataloader import BatchLoader
+from src.utils.metrics import repository_duration, timed
+from src.utils.pagination import Page, build_page, paginate
 
 if TYPE_CHECKING:
     from sqlalchemy.engine import Result
 
+# the limit of bind parameters in a single statement of the PostgreSQL protocol
+MAX_BIND_PARAMS = 32767
+# attribute of the timing wrappers of repository methods holding the method they wrap, see `_time_methods`
+_TIMED_METHOD_ATTRIBUTE = '__timed_method__'
+
+# filter of a statement template: names of the filtered columns and whether the value is None (`IS NULL`)
+FilterKey = tuple[tuple[str, bool], ...]
+
 
 class AbstractRepository(ABC):
     """An abstract class implementing the CRUD operations for working with any database."""
@@ -67,6 +105,26 @@ class AbstractRepository(ABC):
         """Bulk delete all entries."""
         raise NotImplementedError
 
+    @classmethod
+    def _time_methods(cls) -> None:
+        """Observes the duration of the public coroutine methods, inherited ones included,
+        in `repository_method_duration_seconds` by the name of the subclass.
+        Their statements are attributed to `Repository.method` in the query log.
+        """
+        for name in dir(cls):
+            method = inspect.getattr_static(cls, name)
+            if name.startswith('_') or not inspect.iscoroutinefunction(method):
+                continue
+            # a wrapper inherited from a timed parent is replaced, so the call is observed once,
+            # while the method it wraps is kept as it is, with the decorators of its class
+            method = getattr(method, _TIMED_METHOD_ATTRIBUTE, method)
+            wrapper = method
+            if settings.QUERY_LOG_ENABLED:
+                wrapper = traced(f'{cls.__name__}.{name}')(wrapper)
+            wrapper = timed(repository_duration.labels(cls.__name__, name))(wrapper)
+            setattr(wrapper, _TIMED_METHOD_ATTRIBUTE, method)
+            setattr(cls, name, wrapper)
+
 
 M = TypeVar('M', bound=BaseModel)
 
@@ -77,51 +135,377 @@ class SqlAlchemyRepository(AbstractRepository, Generic[M]):
     """
 
     _model: type[M]  # must be a child class of SQLAlchemy DeclarativeBase
+    _bulk_batch_size: int = settings.BULK_INSERT_BATCH_SIZE
+    _copy_threshold: int = settings.BULK_INSERT_COPY_THRESHOLD
+    # statement templates of the subclass, built once and then executed with parameters, see `_get_statement`
+    _statements: ClassVar[dict[Hashable, Executable]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._statements = {}
+        cls._time_methods()
 
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
+    @property
+    def model(self) -> type[M]:
+        return self._model
+
     async def add_one(self, **kwargs: Any) -> None:
-        query = insert(self._model).values(**kwargs)
-        await self._session.execute(query)
+        query = self._get_statement('add_one', lambda: insert(self._model))
+        await self._session.execute(query, kwargs)
 
     async def add_one_and_get_id(self, **kwargs: Any) -> int | str | UUID:
-        query = insert(self._model).values(**kwargs).returning(self._model.id)
-        obj_id: Result = await self._session.execute(query)
+        query = self._get_statement('add_one_and_get_id', lambda: insert(self._model).returning(self._model.id))
+        obj_id: Result = await self._session.execute(query, kwargs)
         return obj_id.scalar_one()
 
     async def add_one_and_get_obj(self, **kwargs: Any) -> M:
-        query = insert(self._model).values(**kwargs).returning(self._model)
-        obj: Result = await self._session.execute(query)
+        query = self._get_statement('add_one_and_get_obj', lambda: insert(self._model).returning(self._model))
+        obj: Result = await self._session.execute(query, kwargs)
         return obj.scalar_one()
 
-    async def bulk_add(self, values: Sequence[dict[str, Any]]) -> None:
-        query = insert(self._model).values(values)
-        await self._session.execute(query)
+    async def bulk_add(self, values: Sequence[dict[str, Any]], *, batch_size: int | None = None) -> None:
+        """Inserts rows in chunks of `batch_size`.
+        Small batches use multi-VALUES INSERT, large ones are loaded with binary COPY,
+        unless a missing column has a default computed by SQL, see `_has_sql_defaults`.
+        All rows must have the same keys.
+        """
+        if not values:
+            return
+
+        batch_size = batch_size or self._bulk_batch_size
+        if len(values) >= self._copy_threshold and not self._has_sql_defaults(values[0]):
+            await self._copy_records(values, batch_size)
+            return
+
+        # every row takes a bind parameter per column, including the ones filled by defaults
+        batch_size = min(batch_size, MAX_BIND_PARAMS // len(self._model.__table__.columns))
+        for start in range(0, len(values), batch_size):
+            query = insert(self._model).values(values[start:start + batch_size])
+            await self._session.execute(query)
 
     async def get_by_filter_one_or_none(self, **kwargs: Any) -> M | None:
-        query = select(self._model).filter_by(**kwargs)
-        res: Result = await self._session.execute(query)
+        res: Result = await self._session.execute(*self._get_select_by_filter(kwargs))
         return res.unique().scalar_one_or_none()
 
     async def get_by_filter_all(self, **kwargs: Any) -> Sequence[M]:
-        query = select(self._model).filter_by(**kwargs)
-        res: Result = await self._session.execute(query)
+        res: Result = await self._session.execute(*self._get_select_by_filter(kwargs))
         return res.scalars().all()
 
+    async def get_updated_at(self, obj_id: int | str | UUID) -> datetime | None:
+        """Version of the entry for conditional requests, None if the entry doesn't exist."""
+        query = self._get_statement(
+            'get_updated_at',
+            lambda: select(self._model.updated_at).where(self._model.id == bindparam('p_id')),
+        )
+        return await self._session.scalar(query, {'p_id': obj_id})
+
+    async def get_values_by_ids(self, ids: Sequence[int | str | UUID]) -> dict[Hashable, dict[str, Any]]:
+        """Column values of the entries with the given IDs by ID, missing IDs are skipped."""
+        query = self._get_statement(
+            'get_values_by_ids',
+            lambda: select(*self._model.__table__.columns)
+            .where(self._model.id == any_(bindparam('p_ids', type_=ARRAY(self._model.id.type)))),
+        )
+        res: Result = await self._session.execute(query, {'p_ids': list(ids)})
+        return {row['id']: dict(row) for row in res.mappings()}
+
     async def update_one_by_id(self, obj_id: int | str | UUID, **kwargs: Any) -> M | None:
-        query = update(self._model).filter(self._model.id == obj_id).values(**kwargs).returning(self._model)
-        obj: Result | None = await self._session.execute(query)
+        query = self._get_statement(('update_one_by_id', tuple(sorted(kwargs))), lambda: self._build_update(kwargs))
+        params = {'p_id': obj_id, **{f'p_{key}': value for key, value in kwargs.items()}}
+        obj: Result | None = await self._session.execute(query, params)
         return obj.scalar_one_or_none()
 
     async def delete_by_filter(self, **kwargs: Any) -> None:
-        query = delete(self._model).filter_by(**kwargs)
-        await self._session.execute(query)
+        filter_key = self._get_filter_key(kwargs)
+        if filter_key is None:
+            await self._session.execute(delete(self._model).filter_by(**kwargs))
+            return
+
+        query = self._get_statement(
+            ('delete_by_filter', filter_key),
+            # the ORM can't evaluate the criteria of a template against the identity map
+            lambda: delete(self._model)
+            .where(*self._get_filter_conditions(filter_key))
+            .execution_options(synchronize_session='fetch'),
+        )
+        await self._session.execute(query, self._get_filter_params(kwargs))
 
     async def delete_by_ids(self, *args: int | str | UUID) -> None:
-        query = delete(self._model).filter(self._model.id.in_(args))
-        await self._session.execute(query)
+        query = self._get_statement(
+            'delete_by_ids',
+            # `= ANY(array)` is a single statement for any number of IDs, unlike `IN`
+            lambda: delete(self._model)
+            .where(self._model.id == any_(bindparam('p_ids', type_=ARRAY(self._model.id.type))))
+            .execution_options(synchronize_session='fetch'),
+        )
+        await self._session.execute(query, {'p_ids': list(args)})
 
     async def delete_all(self) -> None:
-        query = delete(self._model)
+        query = self._get_statement('delete_all', lambda: delete(self._model))
         await self._session.execute(query)
+
+    async def _get_page(
+        self,
+        query: Select,
+        filters: BaseFilter,
+        sort_by: str,
+        sort_column: InstrumentedAttribute | ColumnElement,
+    ) -> Page[dict[str, Any]]:
+        """Runs the filtered query as a keyset-paginated page of rows (dicts), bypassing the ORM.
+        The total number of the filtered rows is added if requested by `filters.total`.
+        """
+        page_query = paginate(query, filters, sort_by, sort_column, self._model.id)
+        return await with_total(self._fetch_page(page_query, filters, sort_by), self._session, query, filters.total)
+
+    async def _fetch_page(self, query: Select, filters: BaseFilter, sort_by: str) -> Page[dict[str, Any]]:
+        res: Result = await self._session.execute(query)
+        return build_page(
+            rows=[dict(row) for row in res.mappings()],
+            filters=filters,
+            sort_by=sort_by,
+            get_keyset=itemgetter(sort_by, 'id'),
+        )
+
+    def _get_statement(self, key: Hashable, build: Callable[[], Executable]) -> Executable:
+        """Returns the statement template cached by the key, building it on the first call.
+        Reusing the statement object skips both building the construct and computing its compilation cache key.
+        """
+        statement = self._statements.get(key)
+        if statement is None:
+            statement = self._statements[key] = build()
+        return statement
+
+    def _get_filter_key(self, kwargs: dict[str, Any]) -> FilterKey | None:
+        """Returns the key of the statement template for the filter,
+        None if it isn't made of plain columns and the statement must be built as is.
+        """
+        columns = self._model.__table__.columns
+        if not all(key in columns for key in kwargs):
+            return None
+        return tuple(sorted((key, value is None) for key, value in kwargs.items()))
+
+    def _get_filter_conditions(self, filter_key: FilterKey) -> list[ColumnElement[bool]]:
+        columns = self._model.__table__.columns
+        return [
+            columns[key].is_(None) if is_none else columns[key] == bindparam(f'p_{key}')
+            for key, is_none in filter_key
+        ]
+
+    @staticmethod
+    def _get_filter_params(kwargs: dict[str, Any]) -> dict[str, Any]:
+        # bind parameters are prefixed, since they can't be named after columns of the VALUES or SET clause
+        return {f'p_{key}': value for key, value in kwargs.items() if value is not None}
+
+    def _get_select_by_filter(self, kwargs: dict[str, Any]) -> tuple[Executable, dict[str, Any] | None]:
+        filter_key = self._get_filter_key(kwargs)
+        if filter_key is None:
+            return select(self._model).filter_by(**kwargs), None
+
+        query = self._get_statement(
+            ('get_by_filter', filter_key),
+            lambda: select(self._model).where(*self._get_filter_conditions(filter_key)),
+        )
+        return query, self._get_filter_params(kwargs)
+
+    def _build_update(self, values: dict[str, Any]) -> Executable:
+        """Builds the UPDATE template of `update_one_by_id`.
+        The update runs on the table and the returned row is loaded with `populate_existing`,
+        since the ORM would synchronize the identity map with the values of the template, not of the call.
+        """
+        table = self._model.__table__
+        query = (
+            update(table)
+            .where(table.c.id == bindparam('p_id'))
+            .values({table.c[key]: bindparam(f'p_{key}') for key in values})
+            .returning(*table.c)
+        )
+        return select(self._model).from_statement(query).execution_options(populate_existing=True)
+
+    async def _copy_records(self, values: Sequence[dict[str, Any]], batch_size: int) -> None:
+        """Loads rows with asyncpg `copy_records_to_table` in the transaction of the session.
+        Python-side column defaults are filled in here, server-side defaults are left to the database.
+        """
+        table = self._model.__table__
+        columns: list[Column] = [table.columns[key] for key in values[0]]
+        columns += [column for column in table.columns if column.key not in values[0] and column.default is not None]
+
+        connection = await self._session.connection()
+        # takes the lock of COPY FROM in advance, since the asyncpg adapter begins the transaction
+        # with the first statement it executes, and COPY runs on the driver connection past the adapter
+        table_name = connection.dialect.identifier_preparer.format_table(table)
+        await connection.exec_driver_sql(f'LOCK TABLE {table_name} IN ROW EXCLUSIVE MODE')
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+
+        for start in range(0, len(values), batch_size):
+            records = [
+                tuple(
+                    row[column.key] if column.key in row else self._get_column_default(column)
+                    for column in columns
+                )
+                for row in values[start:start + batch_size]
+            ]
+            await driver_connection.copy_records_to_table(
+                table.name,
+                records=records,
+                columns=[column.name for column in columns],
+                schema_name=table.schema,
+            )
+
+    def _has_sql_defaults(self, row: dict[str, Any]) -> bool:
+        """Whether a column missing from the row has a client-side default rendered as SQL,
+        e.g. `default=func.now()` or a `Sequence`. COPY can't compute them, so such rows are inserted with INSERT.
+        """
+        return any(
+            column.default is not None and (column.default.is_clause_element or column.default.is_sequence)
+            for column in self._model.__table__.columns
+            if column.key not in row
+        )
+
+    @staticmethod
+    def _get_column_default(column: Column) -> Any:
+        default = column.default
+        if default.is_callable:
+            return default.arg(None)  # SQLAlchemy wraps callables to accept the execution context
+        return default.arg
+
+
+class CachedRepository(Generic[M]):
+    """Read-through cache in front of a `SqlAlchemyRepository`.
+
+    Lookups by ID alone (`get_by_filter_one_or_none(id=...)`) are served from the cache.
+    The column values are cached instead of ORM objects, so every hit returns a new transient instance
+    that is not shared between sessions. IDs written through this repository are invalidated only after
+    the transaction is committed, until then they are read from the database.
+    All other methods are delegated to the wrapped repository as is.
+    """
+
+    def __init__(
+        self,
+        repository: SqlAlchemyRepository[M],
+        cache: LRUCache,
+        after_commit: Callable[[Callable[[], None]], None],
+    ) -> None:
+        self._repository = repository
+        self._cache = cache
+        self._after_commit = after_commit
+        self._model = repository.model
+        self._columns = self._model.__table__.columns.keys()
+        self._written_ids: set[Hashable] = set()
+        self._written_all = False
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._repository, name)
+
+    async def get_by_filter_one_or_none(self, **kwargs: Any) -> M | None:
+        obj_id = kwargs.get('id')
+        if len(kwargs) != 1 or obj_id is None or self._written_all or obj_id in self._written_ids:
+            return await self._repository.get_by_filter_one_or_none(**kwargs)
+
+        key = (self._model.__tablename__, obj_id)
+        values: dict[str, Any] | None = self._cache.get(key)
+        if values is not None:
+            return self._model(**values)
+
+        generation = self._cache.generation
+        obj = await self._repository.get_by_filter_one_or_none(**kwargs)
+        if obj is not None:
+            self._cache.set(key, {column: getattr(obj, column) for column in self._columns}, generation=generation)
+        return obj
+
+    async def update_one_by_id(self, obj_id: int | str | UUID, **kwargs: Any) -> M | None:
+        self._mark_written(obj_id)
+        return await self._repository.update_one_by_id(obj_id, **kwargs)
+
+    async def delete_by_filter(self, **kwargs: Any) -> None:
+        if len(kwargs) == 1 and 'id' in kwargs:
+            self._mark_written(kwargs['id'])
+        else:
+            self._mark_written(all_ids=True)
+        await self._repository.delete_by_filter(**kwargs)
+
+    async def delete_by_ids(self, *args: int | str | UUID) -> None:
+        self._mark_written(*args)
+        await self._repository.delete_by_ids(*args)
+
+    async def delete_all(self) -> None:
+        self._mark_written(all_ids=True)
+        await self._repository.delete_all()
+
+    def _mark_written(self, *ids: Hashable, all_ids: bool = False) -> None:
+        if not self._written_ids and not self._written_all:
+            self._after_commit(self._invalidate)
+        self._written_ids.update(ids)
+        self._written_all = self._written_all or all_ids
+
+    def _invalidate(self) -> None:
+        table = self._model.__tablename__
+        if self._written_all:
+            self._cache.invalidate_where(lambda key: key[0] == table)
+        else:
+            for obj_id in self._written_ids:
+                self._cache.invalidate((table, obj_id))
+        self._written_ids.clear()
+        self._written_all = False
+
+
+class BatchingRepository(Generic[M]):
+    """Batches lookups by ID alone (`get_by_filter_one_or_none(id=...)`) of concurrent read-only transactions.
+
+    The lookups of all requests of the process that arrive within `REPOSITORY_BATCH_WINDOW` are loaded
+    by one `WHERE id = ANY(...)` query in a separate read-only session. As in `CachedRepository`, every caller
+    gets a new transient instance built from the column values. A batch doesn't see uncommitted changes,
+    so only repositories of read-only transactions may be wrapped.
+    All other methods are delegated to the wrapped repository as is.
+    """
+
+    # one loader per repository class is shared by all requests of the process
+    _loaders: ClassVar[dict[type[SqlAlchemyRepository], BatchLoader]] = {}
+
+    def __init__(self, repository: SqlAlchemyRepository[M]) -> None:
+        self._repository = repository
+        self._model = repository.model
+        self._loader = self.get_loader(type(repository))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._repository, name)
+
+    async def get_by_filter_one_or_none(self, **kwargs: Any) -> M | None:
+        obj_id = kwargs.get('id')
+        if len(kwargs) != 1 or obj_id is None:
+            return await self._repository.get_by_filter_one_or_none(**kwargs)
+
+        values: dict[str, Any] | None = await self._loader.load(obj_id)
+        return None if values is None else self._model(**values)
+
+    @classmethod
+    def get_loader(cls, repository_class: type[SqlAlchemyRepository]) -> BatchLoader:
+        loader = cls._loaders.get(repository_class)
+        if loader is None:
+            loader = cls._loaders[repository_class] = BatchLoader(
+                partial(cls._load_many, repository_class),
+                window=settings.REPOSITORY_BATCH_WINDOW,
+                max_batch_size=settings.REPOSITORY_BATCH_MAX_SIZE,
+            )
+        return loader
+
+    @staticmethod
+    async def _load_many(
+        repository_class: type[SqlAlchemyRepository],
+        ids: Sequence[Hashable],
+    ) -> dict[Hashable, dict[str, Any]]:
+        async with get_session_maker(read_only=True)() as session:
+            return await repository_class(session).get_values_by_ids(ids)
+
+
+def json_object(model: type[BaseModel], schema: type[PydanticModel], **extra: ColumnElement) -> ColumnElement:
+    """Builds `json_build_object` with the columns of the model named as the fields of the schema.
+    The keys follow the order of the schema fields, so the document is rendered the same way as the schema.
+    """
+    # field names are identifiers, so they are inlined instead of being sent as untyped parameters
+    pairs = [(literal_column(f"'{name}'"), getattr(model, name)) for name in schema.model_fields]
+    pairs += [(literal_column(f"'{name}'"), value) for name, value in extra.items()]
+    return func.json_build_object(*chain.from_iterable(pairs))
@@ -0,0 +1,70 @@
+"""The module contains the in-process cache of encoded responses."""
+
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+from fastapi.responses import Response
+
+from src.config import settings
+from src.utils.cache import LRUCache
+from src.utils.etag import not_modified
+from src.utils.streaming import JSON_MEDIA_TYPE
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    body: bytes
+    etag: str
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.body) + len(self.etag)
+
+    def respond(self, if_none_match: str | None) -> Response:
+        """Replays the response, 304 if `If-None-Match` has its ETag."""
+        return not_modified(if_none_match, self.etag) or Response(
+            self.body,
+            media_type=JSON_MEDIA_TYPE,
+            headers={'ETag': self.etag},
+        )
+
+
+class ResponseCache(LRUCache):
+    """LRU cache of encoded responses of a route bounded by the total size of the bodies, `maxsize` is in bytes.
+    A hit skips the database and the serialization, the bytes are sent as they are.
+
+    The cache is consulted only if `RESPONSE_CACHE_ENABLED` is set, a disabled cache neither stores
+    nor counts anything. Writes invalidate the affected keys after commit, see the services.
+    """
+
+    def __init__(self, route: str, maxsize: int, ttl: float) -> None:
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.route = route
+
+    @property
+    def enabled(self) -> bool:
+        return settings.RESPONSE_CACHE_ENABLED
+
+    def get(self, key: Hashable) -> CachedResponse | None:
+        return super().get(key) if self.enabled else None
+
+    def set(self, key: Hashable, value: CachedResponse, generation: int | None = None) -> None:
+        if self.enabled:
+            super().set(key, value, generation=generation)
+
+    @staticmethod
+    def _weigh(value: CachedResponse) -> int:
+        return value.nbytes
+
+
+user_response_cache = ResponseCache(
+    route='GET /user/{user_id}',
+    maxsize=settings.RESPONSE_CACHE_USER_MAXBYTES,
+    ttl=settings.RESPONSE_CACHE_USER_TTL,
+)
+company_response_cache = ResponseCache(
+    route='GET /company/{company_id}',
+    maxsize=settings.RESPONSE_CACHE_COMPANY_MAXBYTES,
+    ttl=settings.RESPONSE_CACHE_COMPANY_TTL,
+)
+response_caches = (user_response_cache, company_response_cache)
@@ -0,0 +1,84 @@
+"""The module contains responses rendered without FastAPI's response model validation.
+
+Returning a response instance from a route skips the validation and serialization of `response_model`,
+so the content is validated only where it's created. `response_model` of the route still describes
+the response in OpenAPI.
+"""
+
+from functools import cache
+from types import UnionType
+from typing import Any, ClassVar, Union, get_args, get_origin
+
+import orjson
+from pydantic import BaseModel, TypeAdapter
+from starlette.responses import Response
+from typing_extensions import TypedDict
+
+
+class PydanticJSONResponse(Response):
+    """Renders the schema with its compiled pydantic-core serializer.
+    Nested schema instances are not validated again when the schema is created.
+    """
+
+    media_type = 'application/json'
+
+    @staticmethod
+    def render(content: BaseModel) -> bytes:
+        return content.__pydantic_serializer__.to_json(content)
+
+
+class RowsJSONResponse(Response):
+    """Renders the schema built with `model_construct` whose nested schemas are given as dicts, e.g. database rows.
+    No schema instance is created per row: the rows are serialized by a serializer compiled once from the schema,
+    keys that are not fields of the nested schema are skipped.
+    """
+
+    media_type = 'application/json'
+
+    @staticmethod
+    def render(content: BaseModel) -> bytes:
+        # keys are serialized in the order of the dict, `model_construct` puts the passed fields first
+        fields = {name: getattr(content, name) for name in content.model_fields}
+        return _get_dict_serializer(type(content)).dump_json(fields)
+
+
+class RawJSONResponse(Response):
+    """Renders the schema built with `model_construct` whose `payload` is a JSON document serialized beforehand,
+    e.g. by the database. The document is inserted into the response as is, without being decoded.
+    """
+
+    media_type = 'application/json'
+    raw_fields: ClassVar[frozenset[str]] = frozenset({'payload'})
+
+    def render(self, content: BaseModel) -> bytes:
+        items = (
+            orjson.dumps(name) + b':' + (
+                getattr(content, name).encode() if name in self.raw_fields else orjson.dumps(getattr(content, name))
+            )
+            for name in content.model_fields
+        )
+        return b'{' + b','.join(items) + b'}'
+
+
+@cache
+def _get_dict_serializer(schema: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(_as_typed_dict(schema))
+
+
+@cache
+def _as_typed_dict(schema: type[BaseModel]) -> type:
+    """Returns the TypedDict with the fields of the schema, nested schemas are replaced the same way."""
+    fields = {name: _replace_schemas(field.annotation) for name, field in schema.model_fields.items()}
+    return TypedDict(schema.__name__, fields)
+
+
+def _replace_schemas(annotation: Any) -> Any:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _as_typed_dict(annotation)
+
+    origin, args = get_origin(annotation), get_args(annotation)
+    if origin is list:
+        return list[_replace_schemas(args[0])]
+    if origin in {Union, UnionType}:
+        return Union[tuple(_replace_schemas(arg) for arg in args)]  # noqa: UP007
+    return annotation
@@ -0,0 +1,81 @@
+"""The module contains fuzzy text search backed by pg_trgm trigram indexes."""
+
+import re
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
+
+from sqlalchemy import DDL, ColumnElement, Connection, Float, Index, func, or_, text
+from sqlalchemy.orm import InstrumentedAttribute
+
+# sort key of the ranked search results in rows and pagination cursors
+SEARCH_RANK_KEY = 'rank'
+# the default `pg_trgm.similarity_threshold` of the `%` operator
+SIMILARITY_THRESHOLD = 0.3
+
+# pg_trgm splits the text into words of alphanumeric characters
+_WORD = re.compile(r'[^\W_]+')
+
+_PG_TRGM_AVAILABLE = text("SELECT EXISTS (SELECT FROM pg_available_extensions WHERE name = 'pg_trgm')")
+
+
+def pg_trgm_available(_ddl: Any, _target: Any, bind: Connection | None, **_kwargs: Any) -> bool:
+    """DDL condition of `create_all`: pg_trgm is a contrib extension that some PostgreSQL builds don't ship.
+    Migrations create the extension unconditionally.
+    """
+    return bind is not None and bool(bind.scalar(_PG_TRGM_AVAILABLE))
+
+
+create_pg_trgm = DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm').execute_if(callable_=pg_trgm_available)
+
+
+def trigram_index(name: str, column: str) -> Index:
+    """GIN index serving both `ILIKE '%text%'` and the similarity operator `%` on the column."""
+    index = Index(name, column, postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'})
+    return index.ddl_if(callable_=pg_trgm_available)
+
+
+def search_condition(columns: Sequence[InstrumentedAttribute], search: str) -> ColumnElement[bool]:
+    """Rows where any of the columns contains the text or is similar to it."""
+    # '/' is the escape character as in `autoescape` of SQLAlchemy, a backslash depends on standard_conforming_strings
+    pattern = '%{}%'.format(search.replace('/', '//').replace('%', '/%').replace('_', '/_'))
+    return or_(
+        *(column.ilike(pattern, escape='/') for column in columns),
+        *(column.op('%')(search) for column in columns),
+    )
+
+
+def search_rank(columns: Sequence[InstrumentedAttribute], search: str) -> ColumnElement[float]:
+    """Similarity of the best matching column, NULL columns are ignored."""
+    return func.greatest(*(func.similarity(column, search, type_=Float) for column in columns), type_=Float)
+
+
+def trigrams(value: str) -> set[str]:
+    """Trigrams of the text as extracted by pg_trgm: every lowercased word is padded with two spaces in front
+    and one space behind.
+    """
+    result = set()
+    for word in _WORD.findall(value.lower()):
+        padded = f'  {word} '
+        result.update(padded[start:start + 3] for start in range(len(padded) - 2))
+    return result
+
+
+def match_rank(search: str) -> Callable[[Iterable[str | None]], float | None]:
+    """In-memory counterpart of `search_condition` and `search_rank`: the returned function gives
+    the similarity of the best matching value, or None if no value contains the text or is similar to it.
+    """
+    search_lower, search_trigrams = search.lower(), trigrams(search)
+
+    def rank(values: Iterable[str | None]) -> float | None:
+        best, matched = None, False
+        for value in values:
+            if value is None:
+                continue
+            value_trigrams = trigrams(value)
+            union = len(value_trigrams | search_trigrams)
+            similarity = len(value_trigrams & search_trigrams) / union if union else 0.0
+            matched = matched or similarity >= SIMILARITY_THRESHOLD or search_lower in value.lower()
+            best = similarity if best is None else max(best, similarity)
+        return best if matched else None
+
+    return rank
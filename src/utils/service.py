@@ -1,32 +1,69 @@
 """The module contains base service."""
 import functools
+import inspect
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable, Callable, Sequence
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from time import perf_counter
 from typing import Any, Never, TypeVar, overload
 from uuid import UUID
 
 from fastapi import Depends, HTTPException
 from starlette.status import HTTP_404_NOT_FOUND
 
+from src.utils.metrics import service_duration, timed
 from src.utils.repository import AbstractRepository
-from src.utils.unit_of_work import AbstractUnitOfWork, UnitOfWork
+from src.utils.unit_of_work import AbstractUnitOfWork, UnitOfWork, get_unit_of_work_class
 
-T = TypeVar('T', bound=Callable[..., Awaitable[Any]])
+T = TypeVar('T', bound=Callable[..., Awaitable[Any] | AsyncIterator[Any]])
+
+
+def _async_gen_transaction_mode(func: T, *, read_only: bool) -> T:
+    """Wraps the async generator in transaction mode, see `transaction_mode`."""
+    duration = service_duration.labels(func.__qualname__)
+
+    @functools.wraps(func)
+    async def wrapper(self: AbstractService, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        start = perf_counter()
+        try:
+            if self.uow.is_open:
+                async for item in func(self, *args, **kwargs):
+                    yield item
+                return
+            self.uow.read_only = read_only
+            async with self.uow:
+                async for item in func(self, *args, **kwargs):
+                    yield item
+        finally:
+            duration.observe(perf_counter() - start)
+
+    return wrapper
 
 
 @overload
 def transaction_mode(_func: T) -> T: ...
 @overload
-def transaction_mode(*, auto_flush: bool) -> Callable[[T], T]: ...
+def transaction_mode(*, auto_flush: bool = False, read_only: bool = False) -> Callable[[T], T]: ...
 
 
-def transaction_mode(_func: T | None = None, *, auto_flush: bool = False) -> T | Callable[[T], T]:
+def transaction_mode(
+    _func: T | None = None,
+    *,
+    auto_flush: bool = False,
+    read_only: bool = False,
+) -> T | Callable[[T], T]:
     """Wraps the function in transaction mode.
     Checks if the UnitOfWork context manager is open.
     If not, then opens the context manager and opens a transaction.
+    Async generators keep the transaction open until they are exhausted or closed.
+    `read_only` transactions may be served by a read replica, it has no effect on an already open transaction.
+    The duration of every call, nested ones included, is observed in `service_method_duration_seconds`.
     """
 
     def decorator(func: T) -> T:
+        if inspect.isasyncgenfunction(func):
+            return _async_gen_transaction_mode(func, read_only=read_only)
+
+        @timed(service_duration.labels(func.__qualname__))
         @functools.wraps(func)
         async def wrapper(self: AbstractService, *args: Any, **kwargs: Any) -> Any:
             if self.uow.is_open:
@@ -34,6 +71,7 @@ def transaction_mode(_func: T | None = None, *, auto_flush: bool = False) -> T |
                 if auto_flush:
                     await self.uow.flush()
                 return res
+            self.uow.read_only = read_only
             async with self.uow:
                 return await func(self, *args, **kwargs)
 
@@ -105,12 +143,15 @@ class BaseService(AbstractService):
 
     _repo: str | None = None  # must be a string as an attribute of the Abstract UnitOfWork class
 
-    def __init__(self, uow: UnitOfWork = Depends()) -> None:
+    def __init__(self, uow: UnitOfWork = Depends(get_unit_of_work_class())) -> None:
         """Creates an instance of the base service.
 
+        The dependency is the UnitOfWork of the configured `REPOSITORY_BACKEND`, see `get_unit_of_work_class`.
         If the child class has dependencies with another service and wants to use its functionality,
         it is necessary to explicitly specify the dependency via `Depends`, for example:
-            def __init__(self, uow: UnitOfWork = Depends(), other_service: OtherService = Depends())
+            def __init__(
+                self, uow: UnitOfWork = Depends(get_unit_of_work_class()), other_service: OtherService = Depends(),
+            )
         """
         self.uow: UnitOfWork = uow
         if not hasattr(self, '_repo') or self._repo is None:
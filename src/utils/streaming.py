@@ -0,0 +1,31 @@
+"""The module contains encoders for streaming large listings to the client."""
+
+from collections.abc import AsyncIterable, AsyncIterator, Mapping, Sequence
+from typing import Any
+
+import orjson
+
+NDJSON_MEDIA_TYPE = 'application/x-ndjson'
+JSON_MEDIA_TYPE = 'application/json'
+
+
+def _dumps(row: Mapping[str, Any]) -> bytes:
+    # asyncpg returns its own UUID subclass which orjson doesn't serialize natively
+    return orjson.dumps(dict(row), default=str)
+
+
+async def ndjson_chunks(partitions: AsyncIterable[Sequence[Mapping[str, Any]]]) -> AsyncIterator[bytes]:
+    """Encodes every partition of rows as a chunk of newline-delimited JSON."""
+    async for rows in partitions:
+        if rows:
+            yield b'\n'.join(_dumps(row) for row in rows) + b'\n'
+
+
+async def json_array_chunks(partitions: AsyncIterable[Sequence[Mapping[str, Any]]]) -> AsyncIterator[bytes]:
+    """Encodes all partitions of rows as one JSON array sent chunk by chunk."""
+    separator = b'['
+    async for rows in partitions:
+        if rows:
+            yield separator + b','.join(_dumps(row) for row in rows)
+            separator = b','
+    yield b'[]' if separator == b'[' else b']'
@@ -1,15 +1,22 @@
 """The module contains base classes for supporting transactions."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from types import TracebackType
 from typing import Any, Never
 
-from src.database.db import async_session_maker
-from src.repositories import CompanyRepository, UserRepository
+from src.config import settings
+from src.database.memory import InMemorySession, memory_database
+from src.database.routing import get_session_maker, is_pinned_to_primary, pin_to_primary
+from src.repositories import CompanyRepository, InMemoryCompanyRepository, InMemoryUserRepository, UserRepository
+from src.utils.cache import repository_cache
+from src.utils.metrics import transactions
+from src.utils.repository import BatchingRepository, CachedRepository, SqlAlchemyRepository
 
 
 class AbstractUnitOfWork(ABC):
     is_open: bool
+    read_only: bool
     user: UserRepository
     company: CompanyRepository
 
@@ -38,24 +45,40 @@ class AbstractUnitOfWork(ABC):
     async def rollback(self) -> Never:
         raise NotImplementedError
 
+    @abstractmethod
+    def add_after_commit(self, callback: Callable[[], None]) -> Never:
+        raise NotImplementedError
+
+
+_commits = transactions.labels('commit')
+_read_only_ends = transactions.labels('read_only')
+_rollbacks = transactions.labels('rollback')
+
 
 class UnitOfWork(AbstractUnitOfWork):
-    """The class responsible for the atomicity of transactions."""
+    """The class responsible for the atomicity of transactions.
+    Read-only transactions (`read_only` is set before entering) are not committed
+    and are routed to a read replica, if configured.
+    """
 
     __slots__ = (
+        '_after_commit',
         '_session',
         'company',
         'is_open',
+        'read_only',
         'user',
     )
 
     def __init__(self) -> None:
         self.is_open = False
+        self.read_only = False
+        self._after_commit: list[Callable[[], None]] = []
 
     async def __aenter__(self) -> None:
-        self._session = async_session_maker()
-        self.company = CompanyRepository(self._session)
-        self.user = UserRepository(self._session)
+        self._session = get_session_maker(read_only=self.read_only)()
+        self.company = self._wrap_repository(CompanyRepository(self._session))
+        self.user = self._wrap_repository(UserRepository(self._session))
         self.is_open = True
 
     async def __aexit__(
@@ -64,12 +87,29 @@ class UnitOfWork(AbstractUnitOfWork):
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        if not exc_type:
-            await self._session.commit()
-        else:
-            await self.rollback()
-        await self._session.close()
-        self.is_open = False
+        try:
+            if not exc_type:
+                # a read-only transaction has nothing to commit, closing the session ends it
+                if self.read_only:
+                    _read_only_ends.inc()
+                else:
+                    await self._session.commit()
+                    _commits.inc()
+                    pin_to_primary()
+                for callback in self._after_commit:
+                    callback()
+            else:
+                await self.rollback()
+                _rollbacks.inc()
+        finally:
+            self._after_commit.clear()
+            await self._session.close()
+            self.is_open = False
+            self.read_only = False
+
+    def add_after_commit(self, callback: Callable[[], None]) -> None:
+        """Registers a callback that is called once the current transaction is committed."""
+        self._after_commit.append(callback)
 
     async def flush(self) -> None:
         await self._session.flush()
@@ -83,8 +123,33 @@ class UnitOfWork(AbstractUnitOfWork):
     async def session_refresh(self, obj: Any) -> None:
         await self._session.refresh(obj)
 
+    def _wrap_repository(self, repository: SqlAlchemyRepository) -> Any:
+        # reads pinned to the primary aren't batched with reads that may go to a replica
+        if settings.REPOSITORY_BATCH_ENABLED and self.read_only and not is_pinned_to_primary():
+            repository = BatchingRepository(repository)
+        if not settings.REPOSITORY_CACHE_ENABLED:
+            return repository
+        return CachedRepository(repository, repository_cache, self.add_after_commit)
+
     def __getattr__(self, name: str) -> None:
         err_msg = f"'{self.__class__.__name__}' object has no attribute '{name}'"
         if name in self.__slots__ and not self.is_open:
             err_msg = f"Attempting to access '{name}' with a closed UnitOfWork"
         raise AttributeError(err_msg)
+
+
+class InMemoryUnitOfWork(UnitOfWork):
+    """UnitOfWork of the in-memory backend (`REPOSITORY_BACKEND=memory`), see `InMemorySession`.
+    The repositories aren't cached or batched, replicas and read-only routing don't apply.
+    """
+
+    async def __aenter__(self) -> None:
+        self._session = InMemorySession(memory_database)
+        self.company = InMemoryCompanyRepository(self._session)
+        self.user = InMemoryUserRepository(self._session)
+        self.is_open = True
+
+
+def get_unit_of_work_class() -> type[UnitOfWork]:
+    """UnitOfWork of the configured `REPOSITORY_BACKEND`."""
+    return InMemoryUnitOfWork if settings.REPOSITORY_BACKEND == 'memory' else UnitOfWork
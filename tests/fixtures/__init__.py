@@ -40,6 +40,11 @@ class FakeUnitOfWork(UnitOfWork):
         exc_tb: TracebackType | None,
     ) -> None:
         await self._session.flush()
+        # the flush stands for the commit of the test transaction
+        if not exc_type:
+            for callback in self._after_commit:
+                callback()
+        self._after_commit.clear()
 
 
 class FakeBaseService(BaseService):
@@ -1,8 +1,11 @@
 from tests.fixtures.testing_cases.company_router import (
     TEST_COMPANY_ROUTE_CREATE_PARAMS,
+    TEST_COMPANY_ROUTE_GET_BY_FILTERS_PARAMS,
     TEST_COMPANY_ROUTE_GET_WITH_USERS_PARAMS,
+    TEST_COMPANY_ROUTE_SEARCH_BY_FILTERS_PARAMS,
 )
 from tests.fixtures.testing_cases.repository import (
+    TEST_SQLALCHEMY_REPOSITORY_DELETE_BY_IDS_PARAMS,
     TEST_SQLALCHEMY_REPOSITORY_DELETE_BY_QUERY_PARAMS,
     TEST_SQLALCHEMY_REPOSITORY_GET_BY_QUERY_ALL_PARAMS,
     TEST_SQLALCHEMY_REPOSITORY_GET_BY_QUERY_ONE_OR_NONE_PARAMS,
@@ -14,7 +17,15 @@ from tests.fixtures.testing_cases.service import (
     TEST_BASE_SERVICE_GET_BY_QUERY_ONE_OR_NONE_PARAMS,
     TEST_BASE_SERVICE_UPDATE_ONE_BY_ID_PARAMS,
 )
-from tests.fixtures.testing_cases.user_router import TEST_USER_ROUTE_CREATE_PARAMS, TEST_USER_ROUTE_GET_PARAMS
+from tests.fixtures.testing_cases.user_router import (
+    TEST_USER_ROUTE_BULK_CREATE_PARAMS,
+    TEST_USER_ROUTE_CREATE_PARAMS,
+    TEST_USER_ROUTE_GET_BY_FILTERS_PARAMS,
+    TEST_USER_ROUTE_GET_PARAMS,
+    TEST_USER_ROUTE_SEARCH_BY_FILTERS_PARAMS,
+    TEST_USER_ROUTE_STREAM_BY_FILTERS_PARAMS,
+    TEST_USER_ROUTE_STREAM_SEARCH_PARAMS,
+)
 
 __all__ = (
     'TEST_BASE_SERVICE_DELETE_BY_QUERY_PARAMS',
@@ -22,11 +33,19 @@ __all__ = (
     'TEST_BASE_SERVICE_GET_BY_QUERY_ONE_OR_NONE_PARAMS',
     'TEST_BASE_SERVICE_UPDATE_ONE_BY_ID_PARAMS',
     'TEST_COMPANY_ROUTE_CREATE_PARAMS',
+    'TEST_COMPANY_ROUTE_GET_BY_FILTERS_PARAMS',
     'TEST_COMPANY_ROUTE_GET_WITH_USERS_PARAMS',
+    'TEST_COMPANY_ROUTE_SEARCH_BY_FILTERS_PARAMS',
+    'TEST_SQLALCHEMY_REPOSITORY_DELETE_BY_IDS_PARAMS',
     'TEST_SQLALCHEMY_REPOSITORY_DELETE_BY_QUERY_PARAMS',
     'TEST_SQLALCHEMY_REPOSITORY_GET_BY_QUERY_ALL_PARAMS',
     'TEST_SQLALCHEMY_REPOSITORY_GET_BY_QUERY_ONE_OR_NONE_PARAMS',
     'TEST_SQLALCHEMY_REPOSITORY_UPDATE_ONE_BY_ID_PARAMS',
+    'TEST_USER_ROUTE_BULK_CREATE_PARAMS',
     'TEST_USER_ROUTE_CREATE_PARAMS',
+    'TEST_USER_ROUTE_GET_BY_FILTERS_PARAMS',
     'TEST_USER_ROUTE_GET_PARAMS',
+    'TEST_USER_ROUTE_SEARCH_BY_FILTERS_PARAMS',
+    'TEST_USER_ROUTE_STREAM_BY_FILTERS_PARAMS',
+    'TEST_USER_ROUTE_STREAM_SEARCH_PARAMS',
 )
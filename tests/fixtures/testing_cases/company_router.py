@@ -1,6 +1,13 @@
-from starlette.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_404_NOT_FOUND, HTTP_422_UNPROCESSABLE_ENTITY
+from starlette.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_400_BAD_REQUEST,
+    HTTP_404_NOT_FOUND,
+    HTTP_422_UNPROCESSABLE_ENTITY,
+)
 
 from tests.constants import BASE_ENDPOINT_URL
+from tests.fixtures.db_mocks import COMPANIES
 from tests.utils import RequestTestCase
 
 TEST_COMPANY_ROUTE_CREATE_PARAMS: list[RequestTestCase] = [
@@ -32,6 +39,48 @@ TEST_COMPANY_ROUTE_CREATE_PARAMS: list[RequestTestCase] = [
     ),
 ]
 
+TEST_COMPANY_ROUTE_GET_BY_FILTERS_PARAMS: list[RequestTestCase] = [
+    RequestTestCase(
+        url=f'{BASE_ENDPOINT_URL}/company/filters/',
+        headers={},
+        expected_status=HTTP_200_OK,
+        expected_data=[COMPANIES[1], COMPANIES[0]],
+        description='Ordered by ID',
+    ),
+    RequestTestCase(
+        url=f'{BASE_ENDPOINT_URL}/company/filters/?inn=123456789&order=desc',
+        headers={},
+        expected_status=HTTP_200_OK,
+        expected_data=[COMPANIES[0]],
+        description='Filtered by INN',
+    ),
+    RequestTestCase(
+        url=f'{BASE_ENDPOINT_URL}/company/filters/?cursor=not-a-cursor',
+        headers={},
+        expected_status=HTTP_400_BAD_REQUEST,
+        expected_data=[],
+        description='Not valid cursor',
+    ),
+]
+
+TEST_COMPANY_ROUTE_SEARCH_BY_FILTERS_PARAMS: list[RequestTestCase] = [
+    RequestTestCase(
+        url=f'{BASE_ENDPOINT_URL}/company/filters/?like=second',
+        headers={},
+        expected_status=HTTP_200_OK,
+        expected_data=[COMPANIES[1]],
+        description='Substring',
+    ),
+    RequestTestCase(
+        url=f'{BASE_ENDPOINT_URL}/company/filters/?like=Frist%20Test%20Company',
+        headers={},
+        expected_status=HTTP_200_OK,
+        # both names are similar, the misspelled one is closer to the first company
+        expected_data=[COMPANIES[0], COMPANIES[1]],
+        description='Misspelled name',
+    ),
+]
+
 TEST_COMPANY_ROUTE_GET_WITH_USERS_PARAMS: list[RequestTestCase] = [
     RequestTestCase(
         url=f'{BASE_ENDPOINT_URL}/company/b04e55bd-8431-4edd-8eb4-632099c0ea65',
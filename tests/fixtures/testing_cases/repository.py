@@ -1,16 +1,31 @@
 from copy import deepcopy
 
+from tests.fixtures.db_mocks import USERS
 from tests.fixtures.testing_cases.service import (
     TEST_BASE_SERVICE_DELETE_BY_QUERY_PARAMS,
     TEST_BASE_SERVICE_GET_BY_QUERY_ALL_PARAMS,
     TEST_BASE_SERVICE_GET_BY_QUERY_ONE_OR_NONE_PARAMS,
     TEST_BASE_SERVICE_UPDATE_ONE_BY_ID_PARAMS,
 )
+from tests.utils import BaseTestCase
 
 TEST_SQLALCHEMY_REPOSITORY_GET_BY_QUERY_ONE_OR_NONE_PARAMS = deepcopy(TEST_BASE_SERVICE_GET_BY_QUERY_ONE_OR_NONE_PARAMS)
 
-TEST_SQLALCHEMY_REPOSITORY_GET_BY_QUERY_ALL_PARAMS = deepcopy(TEST_BASE_SERVICE_GET_BY_QUERY_ALL_PARAMS)
+TEST_SQLALCHEMY_REPOSITORY_GET_BY_QUERY_ALL_PARAMS = [
+    *deepcopy(TEST_BASE_SERVICE_GET_BY_QUERY_ALL_PARAMS),
+    BaseTestCase(data={'middle_name': None}, expected_data=[USERS[1]]),
+    BaseTestCase(data={'first_name': 'Ivan', 'middle_name': 'Company'}, expected_data=[USERS[3]]),
+    BaseTestCase(data={'first_name': 'Ivan', 'middle_name': None}, expected_data=[]),
+]
 
 TEST_SQLALCHEMY_REPOSITORY_UPDATE_ONE_BY_ID_PARAMS = deepcopy(TEST_BASE_SERVICE_UPDATE_ONE_BY_ID_PARAMS)
 
-TEST_SQLALCHEMY_REPOSITORY_DELETE_BY_QUERY_PARAMS = deepcopy(TEST_BASE_SERVICE_DELETE_BY_QUERY_PARAMS)
+TEST_SQLALCHEMY_REPOSITORY_DELETE_BY_QUERY_PARAMS = [
+    *deepcopy(TEST_BASE_SERVICE_DELETE_BY_QUERY_PARAMS),
+    BaseTestCase(data={'middle_name': None}, expected_data=[USERS[0], *USERS[2:]]),
+]
+
+TEST_SQLALCHEMY_REPOSITORY_DELETE_BY_IDS_PARAMS = [
+    BaseTestCase(data=[USERS[0]['id'], USERS[2]['id']], expected_data=[USERS[1], USERS[3]]),
+    BaseTestCase(data=[], expected_data=USERS),
+]
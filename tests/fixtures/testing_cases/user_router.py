@@ -1,6 +1,13 @@
-from starlette.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_404_NOT_FOUND, HTTP_422_UNPROCESSABLE_ENTITY
+from starlette.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_400_BAD_REQUEST,
+    HTTP_404_NOT_FOUND,
+    HTTP_422_UNPROCESSABLE_ENTITY,
+)
 
 from tests.constants import BASE_ENDPOINT_URL
+from tests.fixtures.db_mocks import USERS
 from tests.utils import RequestTestCase
 
 TEST_USER_ROUTE_CREATE_PARAMS: list[RequestTestCase] = [
@@ -74,3 +81,193 @@ TEST_USER_ROUTE_GET_PARAMS: list[RequestTestCase] = [
         description='Non-existent user',
     ),
 ]
+
+TEST_USER_ROUTE_GET_BY_FILTERS_PARAMS: list[RequestTestCase] = [
+    RequestTestCase(
+        url=f'{BASE_ENDPOINT_URL}/user/filters/?first_name=Ivan&sort_by=last_name',
+        headers={},
+        expected_status=HTTP_200_OK,
+        expected_data=[
+            {
+                'company_id': 'b04e55bd-8431-4edd-8eb4-632099c0ea65',
+                'first_name': 'Ivan',
+                'id': '3d3e784f-646a-4ad4-979c-dca5dcea2a28',
+                'last_name': 'Ivanov',
+                'middle_name': 'Ivanovich',
+            },
+            {
+                'company_id': '9aff97eb-8b16-47d8-8ddc-dcdadb286d61',
+                'first_name': 'Ivan',
+                'id': '4289fdd9-9fd3-4f39-a10b-a703a4fd23f0',
+                'last_name': 'Second',
+                'middle_name': 'Company',
+            },
+            {
+                'company_id': 'b04e55bd-8431-4edd-8eb4-632099c0ea65',
+                'first_name': 'Ivan',
+                'id': 'd5621653-f72b-4124-98e6-79c5d9c2dc2b',
+                'last_name': 'Terrible',
+                'middle_name': 'Vasilievich',
+            },
+        ],
+        description='Positive case',
+    ),
+    RequestTestCase(
+        url=f'{BASE_ENDPOINT_URL}/user/filters/?first_name=Liza',
+        headers={},
+        expected_status=HTTP_200_OK,
+        expected_data=[],
+        description='Nothing found',
+    ),
+    RequestTestCase(
+        url=f'{BASE_ENDPOINT_URL}/user/filters/?sort_by=company_id',
+        headers={},
+        expected_status=HTTP_422_UNPROCESSABLE_ENTITY,
+        expected_data={},
+        description='Not sortable column',
+    ),
+    RequestTestCase(
+        url=f'{BASE_ENDPOINT_URL}/user/filters/?cursor=not-a-cursor',
+        headers={},
+        expected_status=HTTP_400_BAD_REQUEST,
+        expected_data={},
+        description='Not valid cursor',
+    ),
+]
+
+TEST_USER_ROUTE_SEARCH_BY_FILTERS_PARAMS: list[RequestTestCase] = [
+    RequestTestCase(
+        url=f'{BASE_ENDPOINT_URL}/user/filters/?like=Ivanov',
+        headers={},
+        expected_status=HTTP_200_OK,
+        # the exact match first, then the similar names ordered by ID
+        expected_data=[USERS[0], USERS[2], USERS[3]],
+        description='Ranked by similarity',
+    ),
+    RequestTestCase(
+        url=f'{BASE_ENDPOINT_URL}/user/filters/?like=terr',
+        headers={},
+        expected_status=HTTP_200_OK,
+        expected_data=[USERS[2]],
+        description='Substring',
+    ),
+    RequestTestCase(
+        url=f'{BASE_ENDPOINT_URL}/user/filters/?like=Musc',
+        headers={},
+        expected_status=HTTP_200_OK,
+        expected_data=[USERS[1]],
+        description='Misspelled name',
+    ),
+    RequestTestCase(
+        url=f'{BASE_ENDPOINT_URL}/user/filters/?like=Ivan&last_name=Second',
+        headers={},
+        expected_status=HTTP_200_OK,
+        expected_data=[USERS[3]],
+        description='Search with filters',
+    ),
+    RequestTestCase(
+        url=f'{BASE_ENDPOINT_URL}/user/filters/?like=100%25',
+        headers={},
+        expected_status=HTTP_200_OK,
+        expected_data=[],
+        description='Wildcards are escaped',
+    ),
+]
+
+TEST_USER_ROUTE_STREAM_SEARCH_PARAMS: list[RequestTestCase] = [
+    RequestTestCase(
+        url=f'{BASE_ENDPOINT_URL}/user/filters/stream/?like=Ivanov&sort_by=last_name&format=json',
+        headers={},
+        expected_status=HTTP_200_OK,
+        # the order of the listing, `sort_by` is ignored
+        expected_data=[USERS[0], USERS[2], USERS[3]],
+        description='Ranked by similarity',
+    ),
+    RequestTestCase(
+        url=f'{BASE_ENDPOINT_URL}/user/filters/stream/?like=Ivan&order=asc&format=ndjson',
+        headers={},
+        expected_status=HTTP_200_OK,
+        expected_data=[USERS[2], USERS[3], USERS[0]],
+        description='Equally similar users',
+    ),
+]
+
+TEST_USER_ROUTE_STREAM_BY_FILTERS_PARAMS: list[RequestTestCase] = [
+    RequestTestCase(
+        url=f'{BASE_ENDPOINT_URL}/user/filters/stream/?first_name=Ivan&sort_by=last_name&format=ndjson',
+        headers={},
+        expected_status=HTTP_200_OK,
+        expected_data=[USERS[0], USERS[3], USERS[2]],
+        description='NDJSON',
+    ),
+    RequestTestCase(
+        url=f'{BASE_ENDPOINT_URL}/user/filters/stream/?first_name=Ivan&sort_by=last_name&format=json',
+        headers={},
+        expected_status=HTTP_200_OK,
+        expected_data=[USERS[0], USERS[3], USERS[2]],
+        description='JSON array',
+    ),
+    RequestTestCase(
+        url=f'{BASE_ENDPOINT_URL}/user/filters/stream/?first_name=Liza&format=json',
+        headers={},
+        expected_status=HTTP_200_OK,
+        expected_data=[],
+        description='Empty JSON array',
+    ),
+    RequestTestCase(
+        url=f'{BASE_ENDPOINT_URL}/user/filters/stream/?format=xml',
+        headers={},
+        expected_status=HTTP_422_UNPROCESSABLE_ENTITY,
+        expected_data=None,
+        description='Not valid format',
+    ),
+]
+
+TEST_USER_ROUTE_BULK_CREATE_PARAMS: list[RequestTestCase] = [
+    RequestTestCase(
+        url=f'{BASE_ENDPOINT_URL}/user/bulk',
+        headers={},
+        data=[
+            {
+                'first_name': 'Ivan',
+                'last_name': 'Ivanov',
+                'company_id': 'b04e55bd-8431-4edd-8eb4-632099c0ea65',
+            },
+            {
+                'first_name': 'Ivan',
+                'company_id': 'b04e55bd-8431-4edd-8eb4-632099c0ea65',
+            },
+            {
+                'first_name': 'Elon',
+                'last_name': 'Musk',
+                'company_id': 'a04e55bd-8431-4edd-8eb4-632099c0ea65',
+            },
+            'not a user',
+            {
+                'first_name': 'Ivan',
+                'last_name': 'Second',
+                'middle_name': 'Company',
+                'company_id': '9aff97eb-8b16-47d8-8ddc-dcdadb286d61',
+            },
+        ],
+        expected_status=HTTP_201_CREATED,
+        expected_data={'created': [0, 4], 'errors': [1, 2, 3]},
+        description='Positive case with invalid rows',
+    ),
+    RequestTestCase(
+        url=f'{BASE_ENDPOINT_URL}/user/bulk',
+        headers={},
+        data=[],
+        expected_status=HTTP_422_UNPROCESSABLE_ENTITY,
+        expected_data={},
+        description='Empty request body',
+    ),
+    RequestTestCase(
+        url=f'{BASE_ENDPOINT_URL}/user/bulk',
+        headers={},
+        data={'first_name': 'Ivan'},
+        expected_status=HTTP_422_UNPROCESSABLE_ENTITY,
+        expected_data={},
+        description='Not a list',
+    ),
+]
@@ -0,0 +1,24 @@
+"""Contains tests for the metrics route."""
+
+import pytest
+from httpx import AsyncClient
+from starlette.status import HTTP_200_OK
+
+from tests.constants import BASE_ENDPOINT_URL
+
+
+@pytest.mark.usefixtures('setup_users')
+async def test_get_metrics(async_client: AsyncClient, first_user: dict) -> None:
+    await async_client.get(f'{BASE_ENDPOINT_URL}/user/{first_user["id"]}')
+
+    response = await async_client.get('/metrics')
+    assert response.status_code == HTTP_200_OK
+    assert response.headers['content-type'].startswith('text/plain; version=0.0.4')
+    counts = {
+        line.partition('{')[2].rpartition('}')[0]
+        for line in response.text.splitlines()
+        if line.split('{')[0].endswith('_count')
+    }
+    assert f'method="GET",route="/{BASE_ENDPOINT_URL}/user/{{user_id}}",status="200"' in counts
+    assert 'method="UserService.get_user_by_id"' in counts
+    assert 'repository="UserRepository",method="get_by_filter_one_or_none"' in counts
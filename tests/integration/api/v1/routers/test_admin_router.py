@@ -0,0 +1,36 @@
+"""Contains tests for admin routes."""
+
+import pytest
+from httpx import AsyncClient
+from starlette.status import HTTP_200_OK
+
+from src.config import settings
+from tests.constants import BASE_ENDPOINT_URL
+
+
+class TestAdminRouter:
+
+    @staticmethod
+    @pytest.mark.usefixtures('setup_users', 'response_cache')
+    async def test_get_response_cache_stats(async_client: AsyncClient, first_user: dict) -> None:
+        url = f'{BASE_ENDPOINT_URL}/user/{first_user["id"]}'
+        body = (await async_client.get(url)).content
+        await async_client.get(url)
+
+        response = await async_client.get(f'{BASE_ENDPOINT_URL}/admin/cache/responses')
+        assert response.status_code == HTTP_200_OK
+        stats = {cache['route']: cache for cache in response.json()['payload']}
+        user_stats = stats['GET /user/{user_id}']
+        assert (user_stats['size'], user_stats['hits'], user_stats['misses']) == (1, 1, 1)
+        assert user_stats['hit_ratio'] == 0.5  # noqa: PLR2004
+        assert user_stats['nbytes'] > len(body)
+        assert stats['GET /company/{company_id}']['size'] == 0
+
+    @staticmethod
+    async def test_get_pool_stats(async_client: AsyncClient) -> None:
+        response = await async_client.get(f'{BASE_ENDPOINT_URL}/admin/pool')
+        assert response.status_code == HTTP_200_OK
+        primary = response.json()['payload'][0]
+        assert primary['engine'] == 'primary'
+        assert (primary['size'], primary['max_overflow']) == (settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW)
+        assert list(primary['wait_time_buckets'])[-1] == '+Inf'
@@ -2,7 +2,15 @@
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.status import HTTP_200_OK, HTTP_304_NOT_MODIFIED
 
+from src.api.v1.services import CompanyService
+from src.config import settings
+from src.models import UserModel
+from src.schemas.company import CompanyDB
+from tests.constants import BASE_ENDPOINT_URL
 from tests.fixtures import testing_cases
 from tests.utils import RequestTestCase, prepare_payload
 
@@ -31,3 +39,87 @@ class TestCompanyRouter:
             response = await async_client.get(case.url, headers=case.headers)
             assert response.status_code == case.expected_status
             assert prepare_payload(response) == case.expected_data
+
+    @staticmethod
+    @pytest.mark.usefixtures('setup_users')
+    @pytest.mark.parametrize('case', testing_cases.TEST_COMPANY_ROUTE_GET_WITH_USERS_PARAMS)
+    async def test_get_company_with_users_json_from_db(
+        case: RequestTestCase,
+        async_client: AsyncClient,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(settings, 'COMPANY_JSON_FROM_DB', True)
+        with case.expected_error:
+            response = await async_client.get(case.url, headers=case.headers)
+            assert response.status_code == case.expected_status
+            assert prepare_payload(response) == case.expected_data
+
+    @staticmethod
+    @pytest.mark.usefixtures('setup_companies')
+    @pytest.mark.parametrize('case', testing_cases.TEST_COMPANY_ROUTE_GET_BY_FILTERS_PARAMS)
+    async def test_get_by_filters(
+        case: RequestTestCase,
+        async_client: AsyncClient,
+    ) -> None:
+        with case.expected_error:
+            response = await async_client.get(case.url, headers=case.headers)
+            assert response.status_code == case.expected_status
+            assert [CompanyDB(**row) for row in prepare_payload(response)] == [
+                CompanyDB(**company) for company in case.expected_data
+            ]
+
+    @staticmethod
+    @pytest.mark.usefixtures('pg_trgm', 'setup_companies')
+    @pytest.mark.parametrize('case', testing_cases.TEST_COMPANY_ROUTE_SEARCH_BY_FILTERS_PARAMS)
+    async def test_search_by_filters(
+        case: RequestTestCase,
+        async_client: AsyncClient,
+    ) -> None:
+        with case.expected_error:
+            response = await async_client.get(case.url, headers=case.headers)
+            assert response.status_code == case.expected_status
+            assert [CompanyDB(**row) for row in prepare_payload(response)] == [
+                CompanyDB(**company) for company in case.expected_data
+            ]
+
+    @staticmethod
+    @pytest.mark.usefixtures('committed_users')
+    @pytest.mark.parametrize(('total', 'expected_total'), [('exact', 2), ('none', None)])
+    async def test_get_by_filters_with_total(
+        total: str,
+        expected_total: int | None,
+        async_client: AsyncClient,
+    ) -> None:
+        response = await async_client.get(f'{BASE_ENDPOINT_URL}/company/filters/', params={'total': total})
+        assert response.status_code == HTTP_200_OK
+        assert response.json()['total'] == expected_total
+
+    @staticmethod
+    @pytest.mark.usefixtures('setup_users')
+    @pytest.mark.parametrize('json_from_db', [False, True])
+    async def test_get_company_with_etag(
+        json_from_db: bool,  # noqa: FBT001
+        async_client: AsyncClient,
+        transaction_session: AsyncSession,
+        companies: tuple[dict],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(settings, 'COMPANY_JSON_FROM_DB', json_from_db)
+        company = companies[0]
+        url = f'{BASE_ENDPOINT_URL}/company/{company["id"]}'
+        # without `If-None-Match` the ETag is computed from the loaded company, the version isn't selected
+        with monkeypatch.context() as patch:
+            patch.setattr(CompanyService, 'get_company_with_users_etag', None)
+            response = await async_client.get(url)
+        assert response.status_code == HTTP_200_OK
+        etag = response.headers['etag']
+
+        response = await async_client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == HTTP_304_NOT_MODIFIED
+        assert not response.content
+
+        # a deleted user doesn't change `updated_at` of the company and of the other users
+        await transaction_session.execute(delete(UserModel).where(UserModel.first_name == 'Elon'))
+        response = await async_client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == HTTP_200_OK
+        assert response.headers['etag'] != etag
@@ -1,11 +1,35 @@
 """Contains tests for user routes."""
 
+from datetime import datetime
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+import orjson
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import delete, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.status import (
+    HTTP_200_OK,
+    HTTP_204_NO_CONTENT,
+    HTTP_304_NOT_MODIFIED,
+    HTTP_404_NOT_FOUND,
+    HTTP_422_UNPROCESSABLE_ENTITY,
+)
 
+from src.api.v1.services import UserService
+from src.config import settings
+from src.models import UserModel
+from src.schemas.user import UserDB
+from src.utils.custom_types import AsyncFunc
+from tests.constants import BASE_ENDPOINT_URL
 from tests.fixtures import testing_cases
+from tests.fixtures.db_mocks import USERS
 from tests.utils import RequestTestCase, prepare_payload
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 
 class TestUserRouter:
 
@@ -21,6 +45,48 @@ class TestUserRouter:
             assert response.status_code == case.expected_status
             assert prepare_payload(response, ['id']) == case.expected_data
 
+    @staticmethod
+    @pytest.mark.usefixtures('setup_companies')
+    @pytest.mark.parametrize('case', testing_cases.TEST_USER_ROUTE_BULK_CREATE_PARAMS)
+    async def test_bulk_create(
+        case: RequestTestCase,
+        async_client: AsyncClient,
+        get_users: AsyncFunc,
+    ) -> None:
+        with case.expected_error:
+            response = await async_client.post(case.url, json=case.data, headers=case.headers)
+            assert response.status_code == case.expected_status
+            payload = prepare_payload(response)
+            result = {key: [item['index'] for item in items] for key, items in payload.items()}
+            assert result == case.expected_data
+
+            users_in_db: Sequence[UserModel] = await get_users()
+            created_ids = {UUID(user['id']) for user in payload.get('created', [])}
+            assert {user.id for user in users_in_db} == created_ids
+
+    @staticmethod
+    async def test_bulk_create_schema(async_client: AsyncClient) -> None:
+        response = await async_client.get('/openapi.json')
+        body = response.json()['paths'][f'/{BASE_ENDPOINT_URL}/user/bulk']['post']['requestBody']
+        items = body['content']['application/json']['schema']['items']
+        assert items == {'$ref': '#/components/schemas/CreateUserRequest'}
+        assert 'CreateUserRequest' in response.json()['components']['schemas']
+
+    @staticmethod
+    @pytest.mark.usefixtures('setup_companies')
+    async def test_bulk_create_without_valid_rows(async_client: AsyncClient, get_users: AsyncFunc) -> None:
+        users = [
+            {'first_name': 'Ivan', 'company_id': 'b04e55bd-8431-4edd-8eb4-632099c0ea65'},
+            {'first_name': 'Elon', 'last_name': 'Musk', 'company_id': 'a04e55bd-8431-4edd-8eb4-632099c0ea65'},
+        ]
+        response = await async_client.post(f'{BASE_ENDPOINT_URL}/user/bulk', json=users)
+
+        assert response.status_code == HTTP_422_UNPROCESSABLE_ENTITY
+        detail = response.json()['detail']
+        assert [error['index'] for error in detail] == [0, 1]
+        assert [error['errors'][0]['loc'] for error in detail] == [['last_name'], ['company_id']]
+        assert await get_users() == []
+
     @staticmethod
     @pytest.mark.usefixtures('setup_users')
     @pytest.mark.parametrize('case', testing_cases.TEST_USER_ROUTE_GET_PARAMS)
@@ -32,3 +98,216 @@ class TestUserRouter:
             response = await async_client.get(case.url, headers=case.headers)
             assert response.status_code == case.expected_status
             assert prepare_payload(response) == case.expected_data
+
+    @staticmethod
+    @pytest.mark.usefixtures('setup_users')
+    @pytest.mark.parametrize('case', testing_cases.TEST_USER_ROUTE_GET_BY_FILTERS_PARAMS)
+    async def test_get_by_filters(
+        case: RequestTestCase,
+        async_client: AsyncClient,
+    ) -> None:
+        with case.expected_error:
+            response = await async_client.get(case.url, headers=case.headers)
+            assert response.status_code == case.expected_status
+            assert prepare_payload(response) == case.expected_data
+
+    @staticmethod
+    @pytest.mark.usefixtures('setup_users')
+    @pytest.mark.parametrize('order', ['asc', 'desc'])
+    @pytest.mark.parametrize('sort_by', ['id', 'first_name', 'last_name', 'created_at'])
+    async def test_get_by_filters_with_cursor(
+        sort_by: str,
+        order: str,
+        async_client: AsyncClient,
+        users: tuple[dict],
+    ) -> None:
+        url = f'{BASE_ENDPOINT_URL}/user/filters/'
+        params = {'sort_by': sort_by, 'order': order, 'per_page': 1}
+        received_ids = []
+        while True:
+            response = await async_client.get(url, params=params)
+            assert response.status_code == HTTP_200_OK
+            received_ids.extend(user['id'] for user in prepare_payload(response))
+            if not (cursor := response.json()['next_cursor']):
+                break
+            params['cursor'] = cursor
+
+        assert len(received_ids) == len(set(received_ids)) == len(users)
+
+    @staticmethod
+    @pytest.mark.usefixtures('setup_users')
+    async def test_get_with_etag(
+        async_client: AsyncClient,
+        transaction_session: AsyncSession,
+        first_user: dict,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        url = f'{BASE_ENDPOINT_URL}/user/{first_user["id"]}'
+        # without `If-None-Match` the ETag is computed from the loaded user, the version isn't selected
+        with monkeypatch.context() as patch:
+            patch.setattr(UserService, 'get_user_etag', None)
+            response = await async_client.get(url)
+        assert response.status_code == HTTP_200_OK
+        etag = response.headers['etag']
+
+        response = await async_client.get(url, headers={'If-None-Match': f'W/"other", {etag}'})
+        assert response.status_code == HTTP_304_NOT_MODIFIED
+        assert response.headers['etag'] == etag
+        assert not response.content
+
+        await transaction_session.execute(
+            update(UserModel).where(UserModel.id == first_user['id']).values(updated_at=datetime(2000, 1, 1)),  # noqa: DTZ001
+        )
+        response = await async_client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == HTTP_200_OK
+        assert response.headers['etag'] != etag
+
+    @staticmethod
+    @pytest.mark.usefixtures('setup_users', 'response_cache')
+    async def test_get_from_response_cache(
+        async_client: AsyncClient,
+        transaction_session: AsyncSession,
+        first_user: dict,
+    ) -> None:
+        url = f'{BASE_ENDPOINT_URL}/user/{first_user["id"]}'
+        response = await async_client.get(url)
+        assert response.status_code == HTTP_200_OK
+        etag = response.headers['etag']
+
+        # a write bypassing the service isn't seen until the entry expires
+        await transaction_session.execute(delete(UserModel).where(UserModel.id == first_user['id']))
+        cached_response = await async_client.get(url)
+        assert cached_response.status_code == HTTP_200_OK
+        assert cached_response.content == response.content
+        assert cached_response.headers['etag'] == etag
+
+        response = await async_client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == HTTP_304_NOT_MODIFIED
+
+    @staticmethod
+    @pytest.mark.usefixtures('setup_users', 'response_cache')
+    async def test_response_cache_invalidated_by_writes(
+        async_client: AsyncClient,
+        first_user: dict,
+        companies: tuple[dict],
+    ) -> None:
+        user_url = f'{BASE_ENDPOINT_URL}/user/{first_user["id"]}'
+        company_urls = [f'{BASE_ENDPOINT_URL}/company/{company["id"]}' for company in companies]
+        for url in (user_url, *company_urls):
+            await async_client.get(url)
+
+        data = {'first_name': 'Petr', 'last_name': 'Petrov', 'company_id': str(companies[1]['id'])}
+        response = await async_client.put(user_url, json=data)
+        assert response.status_code == HTTP_200_OK
+
+        response = await async_client.get(user_url)
+        assert response.json()['payload']['first_name'] == data['first_name']
+        old_company, new_company = [(await async_client.get(url)).json()['payload'] for url in company_urls]
+        assert str(first_user['id']) not in {user['id'] for user in old_company['users']}
+        assert str(first_user['id']) in {user['id'] for user in new_company['users']}
+
+        response = await async_client.delete(user_url)
+        assert response.status_code == HTTP_204_NO_CONTENT
+        assert (await async_client.get(user_url)).status_code == HTTP_404_NOT_FOUND
+        new_company = (await async_client.get(company_urls[1])).json()['payload']
+        assert str(first_user['id']) not in {user['id'] for user in new_company['users']}
+
+    @staticmethod
+    @pytest.mark.usefixtures('committed_users')
+    @pytest.mark.parametrize(
+        ('params', 'expected_total'),
+        [
+            ({'total': 'exact', 'per_page': 1}, 4),
+            ({'total': 'exact', 'first_name': 'Ivan', 'per_page': 1}, 3),
+            ({'total': 'exact', 'first_name': 'Liza'}, 0),
+            ({'total': 'none'}, None),
+        ],
+    )
+    async def test_get_by_filters_with_total(
+        params: dict,
+        expected_total: int | None,
+        async_client: AsyncClient,
+    ) -> None:
+        response = await async_client.get(f'{BASE_ENDPOINT_URL}/user/filters/', params=params)
+        assert response.status_code == HTTP_200_OK
+        assert response.json()['total'] == expected_total
+
+    @staticmethod
+    @pytest.mark.usefixtures('committed_users')
+    @pytest.mark.parametrize('params', [{}, {'first_name': 'Ivan', 'last_name': ['Ivanov', 'Second']}])
+    async def test_get_by_filters_with_estimated_total(params: dict, async_client: AsyncClient) -> None:
+        response = await async_client.get(f'{BASE_ENDPOINT_URL}/user/filters/', params={**params, 'total': 'estimate'})
+        assert response.status_code == HTTP_200_OK
+        assert response.json()['total'] >= 0
+
+    @staticmethod
+    @pytest.mark.usefixtures('committed_users')
+    async def test_exact_total_timeout(async_client: AsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings, 'COUNT_EXACT_TIMEOUT', 0)
+        response = await async_client.get(f'{BASE_ENDPOINT_URL}/user/filters/', params={'total': 'exact'})
+        assert response.status_code == HTTP_200_OK
+        assert len(prepare_payload(response)) == len(USERS)
+        assert response.json()['total'] is None
+
+    @staticmethod
+    @pytest.mark.usefixtures('pg_trgm', 'setup_users')
+    @pytest.mark.parametrize('case', testing_cases.TEST_USER_ROUTE_SEARCH_BY_FILTERS_PARAMS)
+    async def test_search_by_filters(
+        case: RequestTestCase,
+        async_client: AsyncClient,
+    ) -> None:
+        with case.expected_error:
+            response = await async_client.get(case.url, headers=case.headers)
+            assert response.status_code == case.expected_status
+            assert [UserDB(**row) for row in prepare_payload(response)] == [
+                UserDB(**user) for user in case.expected_data
+            ]
+
+    @staticmethod
+    @pytest.mark.usefixtures('pg_trgm', 'setup_users')
+    async def test_search_with_cursor(async_client: AsyncClient) -> None:
+        url = f'{BASE_ENDPOINT_URL}/user/filters/'
+        params = {'like': 'Ivan', 'per_page': 1}
+        received_ids = []
+        while True:
+            response = await async_client.get(url, params=params)
+            assert response.status_code == HTTP_200_OK
+            received_ids.extend(user['id'] for user in prepare_payload(response))
+            if not (cursor := response.json()['next_cursor']):
+                break
+            params['cursor'] = cursor
+
+        # equally similar users are ordered by ID
+        assert received_ids == [str(user['id']) for user in (USERS[2], USERS[3], USERS[0])]
+
+    @staticmethod
+    @pytest.mark.usefixtures('pg_trgm', 'setup_users')
+    @pytest.mark.parametrize('case', testing_cases.TEST_USER_ROUTE_STREAM_SEARCH_PARAMS)
+    async def test_stream_search(case: RequestTestCase, async_client: AsyncClient) -> None:
+        response = await async_client.get(case.url, headers=case.headers)
+        assert response.status_code == case.expected_status
+
+        if 'ndjson' in response.headers['content-type']:
+            rows = [orjson.loads(line) for line in response.content.splitlines()]
+        else:
+            rows = orjson.loads(response.content)
+        assert [UserDB(**row) for row in rows] == [UserDB(**user) for user in case.expected_data]
+
+    @staticmethod
+    @pytest.mark.usefixtures('setup_users')
+    @pytest.mark.parametrize('case', testing_cases.TEST_USER_ROUTE_STREAM_BY_FILTERS_PARAMS)
+    async def test_stream_by_filters(
+        case: RequestTestCase,
+        async_client: AsyncClient,
+    ) -> None:
+        with case.expected_error:
+            response = await async_client.get(case.url, headers=case.headers)
+            assert response.status_code == case.expected_status
+            if case.expected_data is None:
+                return
+
+            if 'ndjson' in response.headers['content-type']:
+                rows = [orjson.loads(line) for line in response.content.splitlines()]
+            else:
+                rows = orjson.loads(response.content)
+            assert [UserDB(**row) for row in rows] == [UserDB(**user) for user in case.expected_data]
@@ -1,13 +1,16 @@
-from collections.abc import Sequence
+from collections.abc import AsyncGenerator, Generator, Sequence
 from copy import deepcopy
 
 import pytest
 import pytest_asyncio
-from sqlalchemy import Result, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Result, delete, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
+from src.config import settings
 from src.models import CompanyModel, UserModel
+from src.utils.cache import CacheStats
 from src.utils.custom_types import AsyncFunc
+from src.utils.response_cache import response_caches
 from tests import fixtures
 from tests.utils import bulk_save_models
 
@@ -24,6 +27,46 @@ async def setup_users(setup_companies: None, transaction_session: AsyncSession,
     await bulk_save_models(transaction_session, UserModel, users)
 
 
+@pytest_asyncio.fixture
+async def committed_users(
+    db_engine: AsyncEngine,
+    companies: tuple[dict],
+    users: tuple[dict],
+) -> AsyncGenerator[None, None]:
+    """Creates users visible to other connections, e.g. to counts on a separate connection.
+    They are deleted after the test.
+    """
+    async with db_engine.begin() as conn:
+        await conn.execute(insert(CompanyModel), list(companies))
+        await conn.execute(insert(UserModel), list(users))
+
+    yield
+
+    async with db_engine.begin() as conn:
+        await conn.execute(delete(UserModel))
+        await conn.execute(delete(CompanyModel))
+
+
+@pytest_asyncio.fixture
+async def pg_trgm(transaction_session: AsyncSession) -> None:
+    """Skips the test if the test database has no pg_trgm extension, the trigram indexes aren't created without it."""
+    query = text("SELECT EXISTS (SELECT FROM pg_extension WHERE extname = 'pg_trgm')")
+    if not await transaction_session.scalar(query):
+        pytest.skip('pg_trgm extension is not installed')
+
+
+@pytest_asyncio.fixture
+def response_cache(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    """Enables the response caches, they are emptied after the test."""
+    monkeypatch.setattr(settings, 'RESPONSE_CACHE_ENABLED', True)
+
+    yield
+
+    for cache in response_caches:
+        cache.clear()
+        cache.stats = CacheStats()
+
+
 @pytest_asyncio.fixture
 def get_users(transaction_session: AsyncSession) -> AsyncFunc:
     """Returns users existing within the session."""
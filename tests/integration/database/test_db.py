@@ -0,0 +1,67 @@
+"""Contains tests for database sessions."""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.api.v1.services import UserService
+from src.config import settings
+from src.database.db import ReadOnlyAsyncSession
+from src.database.pool import InstrumentedPool
+from src.models import UserModel
+from src.utils.unit_of_work import UnitOfWork
+from tests.fixtures.db_mocks import USERS
+from tests.utils import user_filters
+
+
+async def test_read_only_session_releases_connection() -> None:
+    engine = create_async_engine(settings.DB_URL, isolation_level='AUTOCOMMIT')
+    try:
+        async with ReadOnlyAsyncSession(bind=engine) as session:
+            res = await session.execute(text('SELECT 1'))
+            assert res.scalar_one() == 1
+            assert not session.in_transaction()
+            assert engine.pool.checkedout() == 0
+
+            assert await session.scalar(text('SELECT 1')) == 1
+            assert engine.pool.checkedout() == 0
+            assert list(await session.scalars(text('SELECT 1'))) == [1]
+            assert engine.pool.checkedout() == 0
+            assert await session.get(UserModel, uuid4()) is None
+            assert engine.pool.checkedout() == 0
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.usefixtures('committed_users')
+async def test_stream_in_read_only_unit_of_work() -> None:
+    # the read-only transaction runs on the autocommit session maker of the application
+    service = UserService(UnitOfWork())
+
+    batches = [batch async for batch in service.stream_users_by_filters(user_filters(sort_by='first_name'))]
+
+    assert sorted(row['id'] for batch in batches for row in batch) == sorted(user['id'] for user in USERS)
+
+
+async def test_instrumented_pool_stats() -> None:
+    engine = create_async_engine(
+        settings.DB_URL,
+        poolclass=InstrumentedPool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.01,
+    )
+    try:
+        async with engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                await engine.connect()
+
+        stats = engine.pool.stats
+        assert (stats.checkouts, stats.timeouts, stats.wait_time.count) == (1, 1, 1)
+
+        await engine.dispose()
+        assert engine.pool.stats is stats
+    finally:
+        await engine.dispose()
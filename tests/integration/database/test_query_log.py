@@ -0,0 +1,80 @@
+"""Contains tests for the slow-query log."""
+
+from collections.abc import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.config import settings
+from src.database.query_log import (
+    RequestQueries,
+    current_caller,
+    install_query_log,
+    parameters_shape,
+    request_queries,
+)
+
+
+@pytest_asyncio.fixture
+async def engine() -> AsyncGenerator[AsyncEngine, None]:
+    engine = create_async_engine(settings.DB_URL)
+    install_query_log(engine)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def messages() -> list[str]:
+    messages = []
+    handler_id = logger.add(messages.append, level='WARNING', format='{message}')
+    yield messages
+    logger.remove(handler_id)
+
+
+async def test_logs_slow_query_with_plan(
+    engine: AsyncEngine,
+    messages: list[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, 'SLOW_QUERY_THRESHOLD', 0)
+    monkeypatch.setattr(settings, 'SLOW_QUERY_EXPLAIN_RATE', 1)
+    token = current_caller.set('UserRepository.get_by_filter_one_or_none')
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text('SELECT generate_series(1, :n)'), {'n': 3})
+            # the transaction stays usable after EXPLAIN
+            assert await conn.scalar(text('SELECT 1')) == 1
+    finally:
+        current_caller.reset(token)
+
+    message = messages[0]
+    assert message.startswith('Slow query')
+    assert 'caller: UserRepository.get_by_filter_one_or_none' in message
+    assert 'parameters: (int)' in message
+    assert 'actual time=' in message
+
+
+async def test_warns_about_repeated_statement(
+    engine: AsyncEngine,
+    messages: list[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, 'N_PLUS_ONE_THRESHOLD', 2)
+    token = request_queries.set(RequestQueries({'type': 'http', 'path': '/api/v1/company/1'}))
+    try:
+        async with engine.connect() as conn:
+            for user_id in range(5):
+                await conn.execute(text('SELECT :id'), {'id': str(user_id)})
+    finally:
+        request_queries.reset(token)
+
+    assert len(messages) == 1
+    assert messages[0].startswith('Statement run more than 2 times in one request (N+1?), route: /api/v1/company/1')
+
+
+def test_parameters_shape() -> None:
+    assert parameters_shape(('a', 1, [1, 2])) == '(str, int, list[2])'
+    assert parameters_shape([(1,), (2,)], executemany=True) == '2 x (int)'
@@ -0,0 +1,32 @@
+"""Contains tests for loading the synthetic dataset."""
+
+from collections.abc import AsyncGenerator
+
+import pytest_asyncio
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.models import CompanyModel, UserModel
+from src.seed.dataset import SeedOptions, seed
+
+
+@pytest_asyncio.fixture
+async def session_maker(db_engine: AsyncEngine) -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    """Session maker of committing sessions, the loaded rows are deleted after the test."""
+    yield async_sessionmaker(db_engine, expire_on_commit=False)
+
+    async with db_engine.begin() as conn:
+        await conn.execute(delete(UserModel))
+        await conn.execute(delete(CompanyModel))
+
+
+async def test_seed(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    # the first users chunk reaches `BULK_INSERT_COPY_THRESHOLD` and is loaded with COPY, the second is inserted
+    options = SeedOptions(companies=20, users=1500, chunk_size=1000)
+
+    await seed(session_maker, options)
+    await seed(session_maker, options, truncate=True)
+
+    async with session_maker() as session:
+        assert await session.scalar(select(func.count()).select_from(CompanyModel)) == options.companies
+        assert await session.scalar(select(func.count()).select_from(UserModel)) == options.users
@@ -0,0 +1,47 @@
+"""Contains tests for the warm-up of the connection pools."""
+
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.config import settings
+from src.database.db import get_connect_args, get_engines
+from src.database.warmup import default_filters, warm_up_engine
+from src.main import app, lifespan
+from src.schemas.user import UserFilters
+from tests.utils import user_filters
+
+
+def test_default_filters() -> None:
+    assert default_filters(UserFilters) == user_filters()
+
+
+async def test_warm_up_engine() -> None:
+    engine = create_async_engine(settings.DB_URL, pool_size=2, max_overflow=5, connect_args=get_connect_args('direct'))
+    try:
+        opened = await warm_up_engine(engine, 3)
+
+        assert opened == engine.pool.checkedin() == engine.pool.size()
+        async with engine.connect() as connection:
+            raw_connection = await connection.get_raw_connection()
+            # the hot statements are prepared by every connection
+            assert len(raw_connection.dbapi_connection._prepared_statement_cache) > 0  # noqa: SLF001
+        assert engine.pool.checkedin() == opened
+    finally:
+        await engine.dispose()
+
+
+async def test_warm_up_engine_fails_softly() -> None:
+    url = settings.DB_URL.replace(f'/{settings.DB_NAME}', '/missing_database')
+    engine = create_async_engine(url, pool_size=2)
+    try:
+        assert await warm_up_engine(engine, 2) == 0
+    finally:
+        await engine.dispose()
+
+
+async def test_lifespan() -> None:
+    engine = get_engines()['primary']
+
+    async with lifespan(app):
+        assert engine.pool.checkedin() == min(settings.DB_POOL_WARM_UP_SIZE, settings.DB_POOL_SIZE)
+
+    assert engine.pool.checkedin() == 0
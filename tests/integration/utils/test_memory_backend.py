@@ -0,0 +1,100 @@
+"""Contains tests comparing the in-memory backend with PostgreSQL."""
+
+from collections.abc import AsyncGenerator, Generator
+from copy import deepcopy
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.status import HTTP_200_OK, HTTP_201_CREATED
+
+from src.config import settings
+from src.database.memory import InMemorySession, memory_database
+from src.main import app, lifespan
+from src.models import CompanyModel, UserModel
+from src.repositories import InMemoryUserRepository, UserRepository
+from src.utils.unit_of_work import InMemoryUnitOfWork, UnitOfWork
+from tests.constants import BASE_ENDPOINT_URL
+from tests.fixtures.db_mocks import COMPANIES, USERS
+from tests.utils import user_filters
+
+
+@pytest.fixture
+def memory_session() -> Generator[InMemorySession, None, None]:
+    """Session of the in-memory database of the process filled with the test data, it is emptied after the test."""
+    session = InMemorySession(memory_database)
+    for model, rows in ((CompanyModel, COMPANIES), (UserModel, USERS)):
+        for row in deepcopy(rows):
+            session.insert(session.table(model), row)
+
+    yield session
+
+    memory_database.clear()
+
+
+@pytest_asyncio.fixture
+async def memory_client(memory_session: InMemorySession) -> AsyncGenerator[AsyncClient, None]:
+    """Client of the application with the in-memory backend."""
+    app.dependency_overrides[UnitOfWork] = InMemoryUnitOfWork
+    async with AsyncClient(app=app, base_url='http://test') as client:
+        yield client
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.usefixtures('setup_users')
+@pytest.mark.parametrize('filters', [
+    {},
+    {'per_page': 2, 'sort_by': 'first_name'},
+    {'per_page': 3, 'sort_by': 'last_name', 'order': 'desc'},
+    {'first_name': ['Ivan'], 'middle_name': ['Company', 'Vasilievich'], 'page': 1, 'per_page': 1},
+    {'ids': [USERS[1]['id'], USERS[3]['id']], 'order': 'desc'},
+])
+async def test_get_users_by_filter_as_postgres(
+    transaction_session: AsyncSession,
+    memory_session: InMemorySession,
+    filters: dict[str, Any],
+) -> None:
+    sql_repository, memory_repository = UserRepository(transaction_session), InMemoryUserRepository(memory_session)
+
+    expected = await sql_repository.get_users_by_filter(user_filters(**filters))
+    page = await memory_repository.get_users_by_filter(user_filters(**filters))
+    assert (page.items, page.next_cursor, page.total) == (expected.items, expected.next_cursor, expected.total)
+
+    expected = await sql_repository.get_users_by_filter(user_filters(**filters, cursor=expected.next_cursor))
+    page = await memory_repository.get_users_by_filter(user_filters(**filters, cursor=page.next_cursor))
+    assert page.items == expected.items
+
+
+async def test_routes(memory_client: AsyncClient) -> None:
+    company = {'inn': 111222333, 'company_name': 'Memory Company'}
+    response = await memory_client.post(f'{BASE_ENDPOINT_URL}/company/', json=company)
+    assert response.status_code == HTTP_201_CREATED
+    company_id = response.json()['payload']['id']
+
+    user = {'first_name': 'Ivan', 'last_name': 'Memory', 'company_id': company_id}
+    response = await memory_client.post(f'{BASE_ENDPOINT_URL}/user/', json=user)
+    assert response.status_code == HTTP_201_CREATED
+    user_id = response.json()['payload']['id']
+
+    response = await memory_client.get(f'{BASE_ENDPOINT_URL}/company/{company_id}')
+    assert response.status_code == HTTP_200_OK
+    assert [user['id'] for user in response.json()['payload']['users']] == [user_id]
+
+    response = await memory_client.get(f'{BASE_ENDPOINT_URL}/user/filters/', params={'first_name': 'Ivan'})
+    assert response.status_code == HTTP_200_OK
+    assert len(response.json()['payload']) == 1 + sum(user['first_name'] == 'Ivan' for user in USERS)
+
+
+async def test_lifespan_seeds_memory_database(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, 'REPOSITORY_BACKEND', 'memory')
+    companies, users = 2, 3
+    monkeypatch.setattr(settings, 'MEMORY_SEED_COMPANIES', companies)
+    monkeypatch.setattr(settings, 'MEMORY_SEED_USERS', users)
+    try:
+        async with lifespan(app):
+            assert len(memory_database.tables[CompanyModel.__tablename__].rows) == companies
+            assert len(memory_database.tables[UserModel.__tablename__].rows) == users
+    finally:
+        memory_database.clear()
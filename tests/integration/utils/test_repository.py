@@ -1,13 +1,21 @@
 
+import asyncio
+from datetime import datetime
 from typing import TYPE_CHECKING
+from uuid import uuid4
 
 import pytest
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 from src.models import UserModel
+from src.repositories import UserRepository
 from src.schemas.user import UserDB
+from src.utils.cache import LRUCache
 from src.utils.custom_types import AsyncFunc
-from src.utils.repository import SqlAlchemyRepository
+from src.utils.dataloader import BatchLoader
+from src.utils.repository import BatchingRepository, CachedRepository, SqlAlchemyRepository
 from tests.fixtures import testing_cases
 from tests.utils import BaseTestCase, compare_dicts_and_db_models
 
@@ -15,6 +23,25 @@ if TYPE_CHECKING:
     from collections.abc import Sequence
 
 
+class _DefaultsBase(DeclarativeBase):
+    pass
+
+
+class _EventModel(_DefaultsBase):
+    """Model with a server-side default and a client-side SQL default, which binary COPY can't compute."""
+
+    __tablename__ = 'bulk_event'
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+    created_at: Mapped[datetime] = mapped_column(server_default=func.now())
+    code: Mapped[str] = mapped_column(default=func.upper('code'))
+
+
+class _EventRepository(SqlAlchemyRepository):
+    _model = _EventModel
+
+
 class TestSqlAlchemyRepository:
     class _SqlAlchemyRepository(SqlAlchemyRepository):
         _model = UserModel
@@ -66,6 +93,58 @@ class TestSqlAlchemyRepository:
         users_in_db: Sequence[UserModel] = await get_users()
         assert compare_dicts_and_db_models(users_in_db, [first_user], UserDB)
 
+    @pytest.mark.usefixtures('setup_companies')
+    @pytest.mark.parametrize('copy_threshold', [1, 1000])
+    @pytest.mark.parametrize('batch_size', [1, 3, 100])
+    async def test_bulk_add(
+        self,
+        copy_threshold: int,
+        batch_size: int,
+        transaction_session: AsyncSession,
+        users: tuple[dict],
+        get_users: AsyncFunc,
+    ) -> None:
+        sql_rep = self.__get_sql_rep(transaction_session)
+        sql_rep._copy_threshold = copy_threshold  # noqa: SLF001
+        await sql_rep.bulk_add(users, batch_size=batch_size)
+
+        users_in_db: Sequence[UserModel] = await get_users()
+        assert compare_dicts_and_db_models(users_in_db, users, UserDB)
+
+    @pytest.mark.usefixtures('setup_companies')
+    @pytest.mark.parametrize('copy_threshold', [1, 1000])
+    async def test_bulk_add_with_defaults(
+        self,
+        copy_threshold: int,
+        transaction_session: AsyncSession,
+        users: tuple[dict],
+        get_users: AsyncFunc,
+    ) -> None:
+        sql_rep = self.__get_sql_rep(transaction_session)
+        sql_rep._copy_threshold = copy_threshold  # noqa: SLF001
+        for user in users:
+            user.pop('id')
+        await sql_rep.bulk_add(users)
+
+        users_in_db: Sequence[UserModel] = await get_users()
+        assert len({user.id for user in users_in_db}) == len(users)
+        assert all(user.created_at is not None for user in users_in_db)
+
+    @staticmethod
+    @pytest.mark.parametrize('row', [{'name': 'event'}, {'name': 'event', 'code': 'copied'}])
+    async def test_bulk_add_with_sql_defaults(transaction_session: AsyncSession, row: dict) -> None:
+        # the DDL is rolled back with the transaction of the session
+        await transaction_session.run_sync(lambda session: _DefaultsBase.metadata.create_all(session.connection()))
+        sql_rep = _EventRepository(transaction_session)
+        sql_rep._copy_threshold = 1  # noqa: SLF001
+        rows = [row, row]
+        await sql_rep.bulk_add(rows)
+
+        events = (await transaction_session.scalars(select(_EventModel))).all()
+        assert len({event.id for event in events}) == len(events) == len(rows)
+        assert all(event.created_at is not None for event in events)
+        assert {event.code for event in events} == {row.get('code', 'CODE')}
+
     @pytest.mark.usefixtures('setup_users')
     @pytest.mark.parametrize('case', testing_cases.TEST_SQLALCHEMY_REPOSITORY_GET_BY_QUERY_ONE_OR_NONE_PARAMS)
     async def test_get_by_filter_one_or_none(
@@ -118,6 +197,37 @@ class TestSqlAlchemyRepository:
             users_in_db: Sequence[UserModel] = await get_users()
             assert compare_dicts_and_db_models(users_in_db, case.expected_data, UserDB)
 
+    @pytest.mark.usefixtures('setup_users')
+    @pytest.mark.parametrize('case', testing_cases.TEST_SQLALCHEMY_REPOSITORY_DELETE_BY_IDS_PARAMS)
+    async def test_delete_by_ids(
+        self,
+        case: BaseTestCase,
+        transaction_session: AsyncSession,
+        get_users: AsyncFunc,
+    ) -> None:
+        sql_rep = self.__get_sql_rep(transaction_session)
+        await sql_rep.delete_by_ids(*case.data)
+        await transaction_session.flush()
+        users_in_db: Sequence[UserModel] = await get_users()
+        assert compare_dicts_and_db_models(users_in_db, case.expected_data, UserDB)
+
+    @pytest.mark.usefixtures('setup_users')
+    async def test_statement_templates(self, transaction_session: AsyncSession, first_user: dict) -> None:
+        sql_rep = self.__get_sql_rep(transaction_session)
+        user: UserModel | None = await sql_rep.get_by_filter_one_or_none(id=first_user['id'])
+        statements = dict(sql_rep._statements)  # noqa: SLF001
+        await sql_rep.get_by_filter_one_or_none(id=first_user['id'])
+        assert sql_rep._statements == statements  # noqa: SLF001
+        assert SqlAlchemyRepository._statements == {}  # noqa: SLF001
+
+        # the object loaded before the update is refreshed from the returned row
+        updated_user: UserModel | None = await sql_rep.update_one_by_id(first_user['id'], middle_name=None)
+        assert updated_user is user
+        assert user.middle_name is None
+
+        await sql_rep.delete_by_ids(first_user['id'])
+        assert user not in transaction_session
+
     @pytest.mark.usefixtures('setup_users')
     async def test_delete_all(
         self,
@@ -129,3 +239,60 @@ class TestSqlAlchemyRepository:
         await transaction_session.flush()
         users_in_db: Sequence[UserModel] = await get_users()
         assert users_in_db == []
+
+
+class TestCachedRepository:
+
+    @staticmethod
+    @pytest.mark.usefixtures('setup_users')
+    async def test_get_by_id(transaction_session: AsyncSession, first_user: dict) -> None:
+        cache = LRUCache(maxsize=10, ttl=60)
+        cached_rep = CachedRepository(UserRepository(transaction_session), cache, after_commit=lambda _: None)
+
+        for _ in range(2):
+            user: UserModel | None = await cached_rep.get_by_filter_one_or_none(id=first_user['id'])
+            assert user.to_schema() == UserDB(**first_user)
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+        await cached_rep.get_by_filter_one_or_none(id=first_user['id'], last_name=first_user['last_name'])
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    @staticmethod
+    @pytest.mark.usefixtures('setup_users')
+    async def test_invalidate_after_commit(transaction_session: AsyncSession, first_user: dict) -> None:
+        cache = LRUCache(maxsize=10, ttl=60)
+        callbacks = []
+        cached_rep = CachedRepository(UserRepository(transaction_session), cache, after_commit=callbacks.append)
+        await cached_rep.get_by_filter_one_or_none(id=first_user['id'])
+
+        await cached_rep.update_one_by_id(first_user['id'], first_name='Liza')
+        user: UserModel | None = await cached_rep.get_by_filter_one_or_none(id=first_user['id'])
+        assert user.first_name == 'Liza'
+        assert len(cache) == 1
+
+        for callback in callbacks:
+            callback()
+        assert len(cache) == 0
+
+
+class TestBatchingRepository:
+
+    @staticmethod
+    @pytest.mark.usefixtures('setup_users')
+    async def test_get_by_id(
+        transaction_session: AsyncSession,
+        first_user: dict,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        # the users of the test transaction aren't visible to a separate session
+        loader = BatchLoader(UserRepository(transaction_session).get_values_by_ids, window=0.01, max_batch_size=10)
+        monkeypatch.setitem(BatchingRepository._loaders, UserRepository, loader)  # noqa: SLF001
+        batching_rep = BatchingRepository(UserRepository(transaction_session))
+
+        users = await asyncio.gather(
+            batching_rep.get_by_filter_one_or_none(id=first_user['id']),
+            batching_rep.get_by_filter_one_or_none(id=first_user['id']),
+            batching_rep.get_by_filter_one_or_none(id=uuid4()),
+        )
+        assert [user and user.to_schema() for user in users] == [UserDB(**first_user), UserDB(**first_user), None]
+        assert (loader.stats.loads, loader.stats.batches) == (3, 1)
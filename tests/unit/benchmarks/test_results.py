@@ -0,0 +1,29 @@
+"""Contains tests for benchmark results."""
+
+from dataclasses import replace
+
+import pytest
+
+from benchmarks.results import BenchmarkResult, Regression, find_regressions, summarize
+
+
+@pytest.fixture
+def result() -> BenchmarkResult:
+    return summarize('get user', 'api', [0.001 * value for value in range(1, 101)], elapsed=0.5, concurrency=2)
+
+
+def test_summarize(result: BenchmarkResult) -> None:
+    assert (result.p50_ms, result.p95_ms, result.p99_ms) == pytest.approx((50.5, 95.05, 99.01))
+    assert result.throughput == 200  # noqa: PLR2004
+
+
+def test_find_regressions(result: BenchmarkResult) -> None:
+    within_threshold = replace(result, p50_ms=result.p50_ms * 1.05)
+    slower = replace(result, p95_ms=result.p95_ms * 1.2, throughput=result.throughput * 0.5)
+    other = replace(result, name='other')
+
+    assert find_regressions({'get user': result}, {'get user': within_threshold}, threshold=0.1) == []
+    assert find_regressions({'get user': result}, {'get user': slower, 'other': other}, threshold=0.1) == [
+        Regression(name='get user', key='p95_ms', baseline=result.p95_ms, current=slower.p95_ms),
+        Regression(name='get user', key='throughput', baseline=result.throughput, current=slower.throughput),
+    ]
@@ -0,0 +1,26 @@
+"""Contains tests for the prepared statements modes."""
+
+import pytest
+
+from src.config import STATEMENT_CACHE_MODES, get_choice
+from src.database.db import get_connect_args
+
+
+def test_get_connect_args() -> None:
+    assert get_connect_args('direct')['prepared_statement_cache_size'] > 0
+    assert get_connect_args('pgbouncer')['statement_cache_size'] == 0
+    with pytest.raises(ValueError, match='pg_bouncer'):
+        get_connect_args('pg_bouncer')
+
+
+@pytest.mark.parametrize('value', ['PgBouncer', 'pg_bouncer', ''])
+def test_unknown_statement_cache_mode(monkeypatch: pytest.MonkeyPatch, value: str) -> None:
+    monkeypatch.setenv('DB_STATEMENT_CACHE_MODE', value)
+    with pytest.raises(ValueError, match='DB_STATEMENT_CACHE_MODE'):
+        get_choice('DB_STATEMENT_CACHE_MODE', 'direct', STATEMENT_CACHE_MODES)
+
+
+def test_statement_cache_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert get_choice('DB_STATEMENT_CACHE_MODE', 'direct', STATEMENT_CACHE_MODES) in STATEMENT_CACHE_MODES
+    monkeypatch.setenv('DB_STATEMENT_CACHE_MODE', 'pgbouncer')
+    assert get_choice('DB_STATEMENT_CACHE_MODE', 'direct', STATEMENT_CACHE_MODES) == 'pgbouncer'
@@ -0,0 +1,37 @@
+"""Contains tests for routing of transactions between the primary and read replicas."""
+
+import pytest
+
+from src.database import db
+from src.database.routing import PrimaryPin, get_session_maker, pin_to_primary, primary_pin
+
+
+class TestGetSessionMaker:
+
+    @staticmethod
+    @pytest.fixture
+    def replica(monkeypatch: pytest.MonkeyPatch) -> object:
+        replica_session_maker = object()
+        monkeypatch.setattr(db, 'get_replica_session_maker', lambda: replica_session_maker)
+        return replica_session_maker
+
+    @staticmethod
+    def test_without_replicas() -> None:
+        assert get_session_maker(read_only=True) is db.read_only_session_maker
+        assert get_session_maker() is db.async_session_maker
+
+    @staticmethod
+    def test_read_only(replica: object) -> None:
+        assert get_session_maker(read_only=True) is replica
+        assert get_session_maker() is db.async_session_maker
+
+    @staticmethod
+    def test_pinned_after_write(replica: object) -> None:
+        token = primary_pin.set(PrimaryPin())
+        try:
+            assert get_session_maker(read_only=True) is replica
+            pin_to_primary()
+            assert get_session_maker(read_only=True) is db.read_only_session_maker
+            assert primary_pin.get().wrote
+        finally:
+            primary_pin.reset(token)
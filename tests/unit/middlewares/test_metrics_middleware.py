@@ -0,0 +1,30 @@
+"""Contains tests for the metrics middleware."""
+
+from fastapi import FastAPI
+from httpx import AsyncClient
+from starlette.status import HTTP_200_OK, HTTP_404_NOT_FOUND
+
+from src.middlewares import MetricsMiddleware
+from src.middlewares.metrics import UNMATCHED_ROUTE
+from src.utils.metrics import request_duration
+
+app = FastAPI()
+app.add_middleware(MetricsMiddleware)
+
+
+@app.get('/items/{item_id}')
+def get_item(item_id: int) -> dict:
+    return {'id': item_id}
+
+
+async def test_observes_latency_by_route_template() -> None:
+    item_duration = request_duration.labels('GET', '/items/{item_id}', HTTP_200_OK)
+    unmatched_duration = request_duration.labels('GET', UNMATCHED_ROUTE, HTTP_404_NOT_FOUND)
+    counts = item_duration.count, unmatched_duration.count
+
+    async with AsyncClient(app=app, base_url='http://test') as client:
+        await client.get('/items/1')
+        await client.get('/items/2')
+        await client.get('/unknown')
+
+    assert (item_duration.count, unmatched_duration.count) == (counts[0] + 2, counts[1] + 1)
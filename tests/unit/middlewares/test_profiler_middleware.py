@@ -0,0 +1,50 @@
+"""Contains tests for the profiler middleware."""
+
+import asyncio
+from pathlib import Path
+
+import orjson
+from fastapi import FastAPI
+from httpx import AsyncClient
+from starlette.status import HTTP_200_OK
+
+from src.middlewares import ProfilerMiddleware
+
+TOKEN = 'secret'  # noqa: S105 - a test value
+
+
+def create_app(directory: Path, **kwargs: object) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ProfilerMiddleware, directory=str(directory), **kwargs)
+
+    @app.get('/items/{item_id}')
+    async def get_item(item_id: int) -> dict:
+        await asyncio.sleep(0)
+        return {'id': item_id}
+
+    return app
+
+
+async def test_profiles_requests_with_token(tmp_path: Path) -> None:
+    app = create_app(tmp_path, token=TOKEN)
+
+    async with AsyncClient(app=app, base_url='http://test') as client:
+        response = await client.get('/items/1', headers={'X-Profile': TOKEN})
+        await client.get('/items/2', params={'profile': TOKEN})
+        await client.get('/items/3', headers={'X-Profile': 'wrong'})
+        await client.get('/items/4')
+
+    files = sorted(tmp_path.iterdir())
+    assert response.status_code == HTTP_200_OK
+    assert response.json() == {'id': 1}
+    assert all('-GET-items_item_id-' in file.name and file.name.endswith('.speedscope.json') for file in files)
+    assert [orjson.loads(file.read_bytes())['name'] for file in files] == ['GET /items/{item_id}'] * 2
+
+
+async def test_profiles_sampled_requests(tmp_path: Path) -> None:
+    app = create_app(tmp_path, sample_rate=1, output_format='collapsed')
+
+    async with AsyncClient(app=app, base_url='http://test') as client:
+        await client.get('/items/1', headers={'X-Profile': TOKEN})
+
+    assert [file.suffixes for file in tmp_path.iterdir()] == [['.collapsed', '.txt']]
@@ -0,0 +1,37 @@
+"""Contains tests for the read-your-writes middleware."""
+
+from httpx import AsyncClient
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from src.database.routing import pin_to_primary, primary_pin
+from src.middlewares import ReadYourWritesMiddleware
+
+
+def read(request: Request) -> JSONResponse:
+    return JSONResponse({'pinned': primary_pin.get().pinned})
+
+
+def write(request: Request) -> JSONResponse:
+    pin_to_primary()
+    return JSONResponse({'pinned': primary_pin.get().pinned})
+
+
+app = Starlette(routes=[Route('/read', read), Route('/write', write, methods=['POST'])])
+app.add_middleware(ReadYourWritesMiddleware, ttl=5)
+
+
+async def test_read_your_writes() -> None:
+    async with AsyncClient(app=app, base_url='http://test') as client:
+        response = await client.get('/read')
+        assert response.json() == {'pinned': False}
+        assert 'set-cookie' not in response.headers
+
+        response = await client.post('/write')
+        assert response.json() == {'pinned': True}
+        assert response.headers['set-cookie'].startswith('db_primary_pin=1; Max-Age=5;')
+
+        response = await client.get('/read')
+        assert response.json() == {'pinned': True}
@@ -0,0 +1,42 @@
+"""Contains tests for the synthetic dataset generator."""
+
+from collections import Counter
+from itertools import chain
+
+from src.seed.dataset import SeedOptions, company_rows, make_id, user_rows
+
+OPTIONS = SeedOptions(companies=50, users=5000, chunk_size=1000)
+
+
+def test_rows_are_deterministic() -> None:
+    assert list(company_rows(OPTIONS)) == list(company_rows(OPTIONS))
+    assert list(user_rows(OPTIONS)) == list(user_rows(OPTIONS))
+
+    other_seed = SeedOptions(companies=50, users=5000, chunk_size=1000, seed=1)
+    assert next(user_rows(other_seed))[0]['id'] != next(user_rows(OPTIONS))[0]['id']
+
+
+def test_rows_are_chunked() -> None:
+    chunks = list(user_rows(OPTIONS))
+
+    assert [len(chunk) for chunk in chunks] == [1000] * 5
+    assert len({row['id'] for row in chain.from_iterable(chunks)}) == OPTIONS.users
+
+
+def test_companies_are_unique_and_referenced() -> None:
+    companies = next(company_rows(OPTIONS))
+    company_ids = {company['id'] for company in companies}
+
+    assert len(company_ids) == len({company['inn'] for company in companies}) == OPTIONS.companies
+    assert {user['company_id'] for user in chain.from_iterable(user_rows(OPTIONS))} <= company_ids
+
+
+def test_users_are_skewed_to_the_first_companies() -> None:
+    sizes = Counter(user['company_id'] for user in chain.from_iterable(user_rows(OPTIONS)))
+    uniform = Counter(
+        user['company_id'] for user in chain.from_iterable(user_rows(SeedOptions(companies=50, users=5000, skew=0)))
+    )
+
+    assert sizes.most_common(1)[0][0] == make_id(OPTIONS.seed, 'company', 0)
+    assert sizes.most_common(1)[0][1] > OPTIONS.users / 5
+    assert uniform.most_common(1)[0][1] < OPTIONS.users / 25
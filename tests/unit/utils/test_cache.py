@@ -0,0 +1,107 @@
+"""Contains tests for in-process caches."""
+
+import pytest
+from starlette.status import HTTP_200_OK, HTTP_304_NOT_MODIFIED
+
+from src.config import settings
+from src.utils.cache import LRUCache
+from src.utils.response_cache import CachedResponse, ResponseCache
+
+
+class TestLRUCache:
+
+    @staticmethod
+    def test_get_and_set() -> None:
+        cache = LRUCache(maxsize=2, ttl=60)
+        cache.set('a', 1)
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    @staticmethod
+    def test_evicts_least_recently_used() -> None:
+        cache = LRUCache(maxsize=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 1)
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.get('c') == 1
+        assert cache.stats.evictions == 1
+
+    @staticmethod
+    def test_expires_entries() -> None:
+        cache = LRUCache(maxsize=2, ttl=-1)
+        cache.set('a', 1)
+        assert cache.get('a') is None
+        assert len(cache) == 0
+        assert cache.stats.expirations == 1
+
+    @staticmethod
+    def test_invalidate() -> None:
+        cache = LRUCache(maxsize=10, ttl=60)
+        cache.set(('user', 1), 1)
+        cache.set(('user', 2), 2)
+        cache.set(('company', 1), 3)
+        cache.invalidate(('user', 1))
+        assert cache.get(('user', 1)) is None
+        assert cache.stats.invalidations == 1
+        cache.invalidate_where(lambda key: key[0] == 'user')
+        assert len(cache) == 1
+        assert cache.stats.invalidations == len(cache) + 1
+
+    @staticmethod
+    def test_set_skips_values_read_before_invalidation() -> None:
+        cache = LRUCache(maxsize=10, ttl=60)
+        generation = cache.generation
+        cache.invalidate('a')
+        cache.set('a', 'stale', generation=generation)
+        assert cache.get('a') is None
+
+
+class TestResponseCache:
+
+    @staticmethod
+    @pytest.fixture(autouse=True)
+    def _enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings, 'RESPONSE_CACHE_ENABLED', True)
+
+    @staticmethod
+    def test_evicts_by_size_of_bodies() -> None:
+        cache = ResponseCache(route='GET /', maxsize=30, ttl=60)
+        cache.set('a', CachedResponse(b'a' * 10, 'W/"a"'))
+        cache.set('b', CachedResponse(b'b' * 10, 'W/"b"'))
+        assert (len(cache), cache.weight) == (2, 30)
+
+        cache.set('c', CachedResponse(b'c', 'W/"c"'))
+        assert cache.get('a') is None
+        assert (len(cache), cache.weight) == (2, 21)
+        assert cache.stats.evictions == 1
+
+        cache.set('b', CachedResponse(b'b', 'W/"b"'))
+        assert (len(cache), cache.weight) == (2, 12)
+
+    @staticmethod
+    def test_skips_responses_larger_than_cache() -> None:
+        cache = ResponseCache(route='GET /', maxsize=30, ttl=60)
+        cache.set('a', CachedResponse(b'a', 'W/"a"'))
+        cache.set('b', CachedResponse(b'b' * 30, 'W/"b"'))
+        assert cache.get('b') is None
+        assert cache.get('a') is not None
+        assert cache.stats.evictions == 0
+
+    @staticmethod
+    def test_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings, 'RESPONSE_CACHE_ENABLED', False)
+        cache = ResponseCache(route='GET /', maxsize=30, ttl=60)
+        cache.set('a', CachedResponse(b'a', 'W/"a"'))
+        assert cache.get('a') is None
+        assert len(cache) == cache.stats.misses == 0
+
+    @staticmethod
+    def test_respond() -> None:
+        cached = CachedResponse(b'{}', 'W/"a"')
+        response = cached.respond(None)
+        assert (response.status_code, response.body, response.headers['etag']) == (HTTP_200_OK, b'{}', 'W/"a"')
+        assert cached.respond('W/"a"').status_code == HTTP_304_NOT_MODIFIED
@@ -0,0 +1,49 @@
+"""Contains tests for batching of concurrent lookups."""
+
+import asyncio
+from collections.abc import Hashable, Sequence
+
+import pytest
+
+from src.utils.dataloader import BatchLoader
+
+
+class TestBatchLoader:
+
+    @staticmethod
+    async def test_loads_concurrent_keys_in_one_batch() -> None:
+        batches = []
+
+        async def load_many(keys: Sequence[Hashable]) -> dict[Hashable, str]:
+            await asyncio.sleep(0)
+            batches.append(keys)
+            return {key: str(key) for key in keys if key != 'missing'}
+
+        loader = BatchLoader(load_many, window=0.01, max_batch_size=10)
+        values = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1), loader.load('missing'))
+        assert values == ['1', '2', '1', None]
+        assert batches == [[1, 2, 'missing']]
+
+    @staticmethod
+    async def test_dispatches_full_batch() -> None:
+        batches = []
+
+        async def load_many(keys: Sequence[Hashable]) -> dict[Hashable, Hashable]:
+            await asyncio.sleep(0)
+            batches.append(keys)
+            return {key: key for key in keys}
+
+        loader = BatchLoader(load_many, window=60, max_batch_size=2)
+        assert await asyncio.gather(*(loader.load(key) for key in range(4))) == list(range(4))
+        assert batches == [[0, 1], [2, 3]]
+
+    @staticmethod
+    async def test_propagates_errors() -> None:
+        async def load_many(keys: Sequence[Hashable]) -> dict[Hashable, Hashable]:
+            await asyncio.sleep(0)
+            raise RuntimeError(keys)
+
+        loader = BatchLoader(load_many, window=0, max_batch_size=10)
+        with pytest.raises(RuntimeError):
+            await loader.load(1)
+        assert loader.stats.errors == 1
@@ -0,0 +1,29 @@
+"""Contains tests for conditional GET helpers."""
+
+import pytest
+
+from src.utils.etag import etag_matches, make_etag
+
+ETAG = make_etag('id', '2024-01-01 00:00:00')
+
+
+def test_make_etag() -> None:
+    assert ETAG.startswith('W/"')
+    assert make_etag('id', '2024-01-01 00:00:00') == ETAG
+    assert make_etag('id', '2024-01-01 00:00:01') != ETAG
+
+
+@pytest.mark.parametrize(
+    ('if_none_match', 'expected'),
+    [
+        (None, False),
+        ('', False),
+        ('*', True),
+        (ETAG, True),
+        (ETAG.removeprefix('W/'), True),
+        (f'W/"other", {ETAG}', True),
+        ('W/"other"', False),
+    ],
+)
+def test_etag_matches(if_none_match: str | None, expected: bool) -> None:  # noqa: FBT001
+    assert etag_matches(if_none_match, ETAG) is expected
@@ -0,0 +1,167 @@
+"""Contains tests for the in-memory backend."""
+
+from collections.abc import Generator
+from copy import deepcopy
+
+import orjson
+import pytest
+import pytest_asyncio
+from sqlalchemy.exc import IntegrityError
+
+from src.api.v1.services import UserService
+from src.database.memory import InMemoryDatabase, InMemorySession, memory_database
+from src.models import CompanyModel, UserModel
+from src.repositories import InMemoryCompanyRepository, InMemoryUserRepository
+from src.schemas.user import UpdateUserRequest
+from src.utils.unit_of_work import InMemoryUnitOfWork
+from tests.fixtures.db_mocks import COMPANIES, USERS
+from tests.utils import user_filters
+
+
+@pytest.fixture
+def session() -> InMemorySession:
+    database = InMemoryDatabase({CompanyModel: ('inn',), UserModel: ('company_id', 'first_name', 'last_name')})
+    session = InMemorySession(database)
+    for model, rows in ((CompanyModel, COMPANIES), (UserModel, USERS)):
+        for row in deepcopy(rows):
+            session.insert(session.table(model), row)
+    return session
+
+
+@pytest_asyncio.fixture
+def memory_backend() -> Generator[None, None, None]:
+    """Fills the in-memory database of the process, it is emptied after the test."""
+    session = InMemorySession(memory_database)
+    for model, rows in ((CompanyModel, COMPANIES), (UserModel, USERS)):
+        for row in deepcopy(rows):
+            session.insert(session.table(model), row)
+
+    yield
+
+    memory_database.clear()
+
+
+async def test_get_by_filter(session: InMemorySession) -> None:
+    repository = InMemoryUserRepository(session)
+
+    user = await repository.get_by_filter_one_or_none(middle_name=None)
+    users = await repository.get_by_filter_all(first_name='Ivan', company_id=COMPANIES[0]['id'])
+
+    assert user.id == USERS[1]['id']
+    assert user.created_at is not None
+    assert {user.id for user in users} == {USERS[0]['id'], USERS[2]['id']}
+
+
+async def test_update_one_by_id(session: InMemorySession) -> None:
+    repository = InMemoryUserRepository(session)
+    before = await repository.get_updated_at(USERS[0]['id'])
+
+    user = await repository.update_one_by_id(USERS[0]['id'], first_name='Peter')
+
+    assert user.first_name == 'Peter'
+    assert user.updated_at > before
+    assert await repository.get_by_filter_all(first_name='Peter') != []
+    assert USERS[0]['id'] not in {user.id for user in await repository.get_by_filter_all(first_name='Ivan')}
+    assert await repository.update_one_by_id(COMPANIES[0]['id'], first_name='Peter') is None
+
+
+async def test_foreign_keys(session: InMemorySession) -> None:
+    users, companies = InMemoryUserRepository(session), InMemoryCompanyRepository(session)
+
+    with pytest.raises(IntegrityError):
+        await users.add_one(first_name='Ivan', last_name='Ivanov', company_id=USERS[0]['id'])
+
+    await companies.delete_by_ids(COMPANIES[0]['id'])
+    assert [user.id for user in await users.get_by_filter_all()] == [USERS[3]['id']]
+
+
+async def test_rollback(session: InMemorySession) -> None:
+    users, companies = InMemoryUserRepository(session), InMemoryCompanyRepository(session)
+    await session.commit()
+    before = {table.name: deepcopy(table.rows) for table in session.database.tables.values()}
+
+    await users.update_one_by_id(USERS[3]['id'], company_id=COMPANIES[0]['id'])
+    await companies.delete_all()
+    await companies.add_one(inn=1, company_name='Third Test Company')
+    await session.rollback()
+
+    assert {table.name: table.rows for table in session.database.tables.values()} == before
+    assert len(await users.get_by_filter_all(company_id=COMPANIES[0]['id'])) == len(USERS) - 1
+
+
+async def test_get_users_by_filter_pages(session: InMemorySession) -> None:
+    repository = InMemoryUserRepository(session)
+    filters = user_filters(per_page=3, sort_by='last_name', order='desc', total='exact')
+
+    first_page = await repository.get_users_by_filter(filters)
+    second_page = await repository.get_users_by_filter(user_filters(
+        per_page=3, sort_by='last_name', order='desc', cursor=first_page.next_cursor,
+    ))
+
+    assert [user['last_name'] for user in first_page.items] == ['Terrible', 'Second', 'Musk']
+    assert first_page.total == len(USERS)
+    assert [user['last_name'] for user in second_page.items] == ['Ivanov']
+    assert second_page.next_cursor is None
+
+
+async def test_get_users_by_filter_search(session: InMemorySession) -> None:
+    repository = InMemoryUserRepository(session)
+
+    page = await repository.get_users_by_filter(user_filters(like='ivanovi'))
+    filtered_page = await repository.get_users_by_filter(user_filters(like='ivanovi', first_name=['Elon']))
+
+    # the first user has the most similar names, the other Ivans are ordered by ID on a tie
+    assert [user['id'] for user in page.items] == [USERS[0]['id'], USERS[2]['id'], USERS[3]['id']]
+    assert page.items[0]['rank'] > page.items[1]['rank']
+    assert filtered_page.items == []
+
+
+async def test_stream_users_by_filter_search(session: InMemorySession) -> None:
+    repository = InMemoryUserRepository(session)
+    filters = user_filters(like='ivan', sort_by='last_name', order='asc')
+
+    page = await repository.get_users_by_filter(filters)
+    batches = [batch async for batch in repository.stream_users_by_filter(filters, batch_size=2)]
+
+    # the order of the listing, by similarity instead of `sort_by`
+    assert [user['id'] for batch in batches for user in batch] == [user['id'] for user in page.items]
+    assert [user['id'] for user in page.items] == [USERS[2]['id'], USERS[3]['id'], USERS[0]['id']]
+
+
+async def test_company_with_users(session: InMemorySession) -> None:
+    repository = InMemoryCompanyRepository(session)
+    company_id = COMPANIES[0]['id']
+
+    company = await repository.get_company_with_users(company_id)
+    document = orjson.loads(await repository.get_company_with_users_json(company_id))
+    version = await repository.get_company_with_users_version(company_id)
+    updated_at, users_updated_at, users_count = version
+
+    assert [user.id for user in company.users] == sorted(user['id'] for user in USERS[:3])
+    assert document['company_name'] == COMPANIES[0]['company_name']
+    assert [user['id'] for user in document['users']] == [str(user.id) for user in company.users]
+    assert updated_at == company.updated_at
+    assert users_updated_at == max(user.updated_at for user in company.users)
+    assert users_count == len(company.users)
+    assert await repository.get_company_with_users_json_and_version(company_id) == (
+        await repository.get_company_with_users_json(company_id), *version,
+    )
+
+
+@pytest.mark.usefixtures('memory_backend')
+async def test_unit_of_work() -> None:
+    uow = InMemoryUnitOfWork()
+    service = UserService(uow)
+    user = UpdateUserRequest(first_name='Peter', last_name='First', company_id=COMPANIES[1]['id'])
+
+    async def delete_and_fail() -> None:
+        async with uow:
+            await uow.user.delete_by_ids(USERS[1]['id'])
+            raise RuntimeError
+
+    await service.update_user(USERS[0]['id'], user)
+    with pytest.raises(RuntimeError):
+        await delete_and_fail()
+
+    assert (await service.get_user_by_id(USERS[0]['id'])).first_name == 'Peter'
+    assert (await service.get_user_by_id(USERS[1]['id'])).first_name == USERS[1]['first_name']
@@ -0,0 +1,85 @@
+"""Contains tests for metric primitives."""
+
+import asyncio
+import functools
+from collections.abc import Awaitable, Callable
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.database.memory import InMemoryDatabase, InMemorySession
+from src.models import CompanyModel, UserModel
+from src.repositories import InMemoryUserRepository
+from src.utils.metrics import Histogram, Registry, format_bound, repository_duration, timed
+
+
+def test_histogram() -> None:
+    histogram = Histogram([1, 0.1])
+    for value in (0.05, 0.1, 0.5, 2):
+        histogram.observe(value)
+    assert histogram.cumulative() == [(0.1, 2), (1, 3), (float('inf'), 4)]
+    assert (histogram.count, histogram.sum) == (4, 2.65)
+
+
+def test_format_bound() -> None:
+    assert [format_bound(bound) for bound in (0.005, 1, float('inf'))] == ['0.005', '1.0', '+Inf']
+
+
+def test_render() -> None:
+    registry = Registry()
+    counter = registry.counter('events_total', 'Events.', ('kind',))
+    histogram = registry.histogram('duration_seconds', 'Duration.', ('name',), bounds=(0.1,))
+    counter.labels('a"b').inc(2)
+    histogram.labels('x').observe(0.05)
+    assert registry.render() == (
+        '# HELP events_total Events.\n'
+        '# TYPE events_total counter\n'
+        'events_total{kind="a\\"b"} 2\n'
+        '# HELP duration_seconds Duration.\n'
+        '# TYPE duration_seconds histogram\n'
+        'duration_seconds_bucket{name="x",le="0.1"} 1\n'
+        'duration_seconds_bucket{name="x",le="+Inf"} 1\n'
+        'duration_seconds_sum{name="x"} 0.05\n'
+        'duration_seconds_count{name="x"} 1\n'
+    )
+
+
+async def test_timed() -> None:
+    histogram = Histogram([1])
+
+    @timed(histogram)
+    async def fail() -> None:
+        await asyncio.sleep(0)
+        raise ValueError
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        await fail()
+    assert histogram.count == 1
+
+
+async def test_repository_methods_keep_decorators() -> None:
+    calls = []
+
+    def logged(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            calls.append(func.__name__)
+            return await func(*args, **kwargs)
+
+        return wrapper
+
+    class LoggedRepository(InMemoryUserRepository):
+        @logged
+        async def get_company_id(self, user_id: UUID) -> UUID | None:
+            return await super().get_company_id(user_id)
+
+    class ChildRepository(LoggedRepository):
+        pass
+
+    repository = ChildRepository(InMemorySession(InMemoryDatabase({UserModel: ('company_id',), CompanyModel: ()})))
+    duration = repository_duration.labels('ChildRepository', 'get_company_id')
+
+    assert await repository.get_company_id(uuid4()) is None
+    assert calls == ['get_company_id']
+    assert duration.count == 1
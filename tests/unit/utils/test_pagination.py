@@ -0,0 +1,29 @@
+"""Contains tests for the keyset pagination helpers."""
+
+from operator import itemgetter
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, select
+from sqlalchemy.dialects import postgresql
+
+from src.utils.pagination import Cursor, encode_cursor, paginate, paginate_rows
+from tests.utils import user_filters
+
+# a table with integer IDs, the cursor ID is restored to the type of the ID column
+ITEMS = Table('item', MetaData(), Column('id', Integer, primary_key=True), Column('name', String))
+
+
+def test_paginate_restores_id_type() -> None:
+    cursor = encode_cursor(Cursor(sort_by='name', order='asc', value='b', id=2))
+    query = paginate(select(ITEMS), user_filters(cursor=cursor, per_page=1), 'name', ITEMS.c.name, ITEMS.c.id)
+
+    params = query.compile(dialect=postgresql.dialect()).params
+    assert sorted(params.values(), key=str) == [2, 2, 'b']
+
+
+def test_paginate_rows_restores_id_type() -> None:
+    rows = [{'id': obj_id, 'name': 'a'} for obj_id in range(5)]
+    cursor = encode_cursor(Cursor(sort_by='name', order='asc', value='a', id=2))
+
+    page = paginate_rows(rows, user_filters(cursor=cursor), 'name', itemgetter('name', 'id'), str, int)
+
+    assert [row['id'] for row in page.items] == [3, 4]
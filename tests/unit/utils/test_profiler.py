@@ -0,0 +1,69 @@
+"""Contains tests for the sampling profiler."""
+
+import asyncio
+from time import perf_counter
+
+import orjson
+import pytest
+
+from src.utils.profiler import AWAIT_FRAME, OTHER_LAYER, SamplingProfiler, layer_of
+
+
+def spin(seconds: float) -> None:
+    end = perf_counter() + seconds
+    while perf_counter() < end:
+        pass
+
+
+async def handle() -> None:
+    spin(0.05)
+    await asyncio.sleep(0.05)
+
+
+@pytest.mark.parametrize(('module', 'layer'), [
+    ('src.api.v1.routers.user', 'router'),
+    ('src.api.v1.services.user', 'service'),
+    ('src.utils.service', 'service'),
+    ('src.repositories.user', 'repository'),
+    ('sqlalchemy.ext.asyncio.session', 'database'),
+    ('pydantic.main', 'serialization'),
+    ('src.apis', None),
+    ('starlette.routing', None),
+])
+def test_layer_of(module: str, layer: str | None) -> None:
+    assert layer_of(module) == layer
+
+
+async def test_samples_running_and_suspended_coroutine() -> None:
+    profiler = SamplingProfiler(interval=0.001)
+    coro = handle()
+
+    profiler.start(coro)
+    await coro
+    profiler.stop()
+
+    names = [[frame.name for frame in stack] for stack, _ in profiler.samples]
+    spinning = sum(weight for stack, weight in profiler.samples if stack[-1].name.endswith(':spin'))
+    waiting = sum(weight for stack, weight in profiler.samples if stack[-1] == AWAIT_FRAME)
+    assert all(stack[0].endswith(':handle') for stack in names)
+    assert spinning == pytest.approx(0.05, abs=0.02)
+    assert waiting == pytest.approx(0.05, abs=0.02)
+    assert profiler.layers().keys() == {OTHER_LAYER}
+
+
+async def test_output_formats() -> None:
+    profiler = SamplingProfiler(interval=0.001)
+    coro = handle()
+    profiler.start(coro)
+    await coro
+    profiler.stop()
+
+    document = orjson.loads(profiler.to_speedscope('GET /'))
+    [profile] = document['profiles']
+    lines = profiler.to_collapsed().splitlines()
+
+    assert len(profile['samples']) == len(profile['weights']) == len(profiler.samples)
+    assert {frame['name'] for frame in document['shared']['frames']} >= {AWAIT_FRAME.name}
+    assert all(line.split(';')[0].endswith(':handle') for line in lines)
+    total = sum(int(line.rsplit(' ', 1)[1]) for line in lines)
+    assert total == pytest.approx(profile['endValue'] * 1_000_000, abs=len(lines))
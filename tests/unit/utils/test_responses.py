@@ -0,0 +1,38 @@
+"""Contains tests for responses rendered without response model validation."""
+
+from uuid import uuid4
+
+import orjson
+
+from src.schemas.company import CompanyResponse, CompanyWithUsers
+from src.schemas.user import UserDB, UserResponse, UsersListResponse
+from src.utils.responses import PydanticJSONResponse, RawJSONResponse, RowsJSONResponse
+
+
+def test_pydantic_json_response() -> None:
+    user = UserDB(id=uuid4(), first_name='Ivan', last_name='Ivanov', company_id=uuid4())
+    content = UserResponse(payload=user)
+    response = PydanticJSONResponse(content)
+    assert response.headers['content-type'] == 'application/json'
+    assert response.body == content.model_dump_json().encode()
+
+
+def test_rows_json_response() -> None:
+    users = [
+        UserDB(id=uuid4(), first_name='Ivan', last_name='Ivanov', company_id=uuid4()),
+        UserDB(id=uuid4(), first_name='Elon', last_name='Musk', middle_name='Errol', company_id=uuid4()),
+    ]
+    rows = [{**user.model_dump(), 'created_at': '2024-01-01'} for user in users]
+    response = RowsJSONResponse(UsersListResponse.model_construct(payload=rows, next_cursor='cursor'))
+
+    expected = UsersListResponse(payload=users, next_cursor='cursor').model_dump_json().encode()
+    assert response.body == expected
+    assert list(orjson.loads(response.body)) == list(UsersListResponse.model_fields)
+
+
+def test_raw_json_response() -> None:
+    company = CompanyWithUsers(id=uuid4(), inn=1, company_name='Test', is_active=True)
+    document = company.model_dump_json()
+    response = RawJSONResponse(CompanyResponse.model_construct(payload=document))
+
+    assert response.body == CompanyResponse(payload=company).model_dump_json().encode()
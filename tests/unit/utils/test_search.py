@@ -0,0 +1,22 @@
+"""Contains tests for the trigram search helpers."""
+
+from sqlalchemy.dialects import postgresql
+
+from src.models import UserModel
+from src.utils.search import SIMILARITY_THRESHOLD, match_rank, search_condition
+
+
+def test_search_condition_escapes_wildcards() -> None:
+    condition = search_condition([UserModel.first_name], '10%_a/b')
+    params = condition.compile(dialect=postgresql.dialect()).params
+    assert sorted(params.values()) == ['%10/%/_a//b%', '10%_a/b']
+
+
+def test_match_rank() -> None:
+    rank = match_rank('ivan')
+
+    assert rank(['Ivan', None]) == 1
+    # contained in the value, though not similar enough
+    assert 0 < rank(['Kalivanov']) < SIMILARITY_THRESHOLD
+    assert rank(['Elon', None]) is None
+    assert rank([None]) is None
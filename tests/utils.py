@@ -11,6 +11,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeBase
 from starlette.status import HTTP_200_OK
 
+from src.schemas.filter import MAX_PER_PAGE
+from src.schemas.user import UserFilters
 from tests.constants import BASE_ENDPOINT_URL
 
 Check = Callable[[dict[str, Any]], bool]
@@ -34,7 +36,7 @@ class TestExpectation(BaseConfig):
 
 
 class BaseTestCase(TestDescription, TestExpectation):
-    data: dict | None = None
+    data: dict | list | None = None
 
 
 class RequestTestCase(BaseTestCase):
@@ -91,3 +93,12 @@ def prepare_payload(response: Response, exclude: Sequence[str] | None = None) ->
         payload.pop(key, None)
 
     return payload
+
+
+def user_filters(**kwargs: Any) -> UserFilters:
+    """Creates filters outside of a request, where the defaults of the fields are `Query` objects."""
+    values = {
+        'page': None, 'per_page': MAX_PER_PAGE, 'cursor': None, 'order': 'asc', 'total': 'none', 'like': '',
+        'ids': None, 'first_name': None, 'last_name': None, 'middle_name': None, 'sort_by': 'id',
+    }
+    return UserFilters(**values | kwargs)